@@ -1,33 +1,46 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Union
 import asyncio
+import time
 import json
-import tempfile
-import base64
 
 # Import pipeline components
 from src.config.yutori_config import YUTORI_CONFIG
-from src.agents.linkedin_browser import LinkedInBrowserAgent
-from src.agents.twitter_browser import TwitterBrowserAgent
-from src.agents.company_researcher import CompanyResearcher
-from src.extractors.profile_extractor import SemanticProfileExtractor
-from src.extractors.theme_engine import ThemeIdentificationEngine
-from src.extractors.data_transformer import StructuredDataTransformer
-from src.synthesis.adaptive_pipeline import AdaptiveSynthesisPipeline
-from src.fabricate.conversation_generator import MockConversationGenerator
-from src.fabricate.response_coach import ResponseCoach
-from src.fabricate.scenario_builder import ConversationScenarioBuilder
+from src.pipeline.briefing_pipeline import BriefingPipeline
+from src.pipeline.dag_executor import StageFailedError
+from src.pipeline.cancellation import cancel_on_disconnect
+from src.pipeline.background_refresh import BackgroundRefresher
+from src.pipeline.single_flight import SingleFlight
+from src.pipeline.batch_runner import run_batch
+from src.config.pipeline_config import PIPELINE_CONFIG
+from src.pipeline.briefing_pipeline import browse_flight, research_flight, synthesis_flight
+from src.agents.yutori_client import close_yutori_clients
 from src.visual.pdf_generator import PDFGenerator
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse
 import io
 import os
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
-from anthropic import Anthropic
+from src.llm.llm_client import get_llm_client, close_llm_client
+from src.compliance.engine import ComplianceEngine
+from src.compliance.bulk import (
+    BATCH, REALTIME, BulkComplianceRunner, OutputLock, OutputLockedError, discover_inputs, parquet_available
+)
+from src.config.compliance_config import COMPLIANCE_CONFIG
+from src.audio.transcriber import ChunkedTranscriber
+from src.audio.ingest import UploadTooLargeError, new_spool, spool_base64_text, spool_json_base64
+from src.agents.browser_pool import get_browser_pool, close_browser_pool
+from src.agents.page_readiness import readiness_recorder
+from src.agents.resource_blocker import blocking_stats
 
 from src.demo.cache_manager import CacheManager
+from src.storage.company_store import get_company_store, close_company_store
+from src.config.elevenlabs_config import ELEVENLABS_CONFIG
+from src.governor.provider_governor import governor, BackpressureError
+from src.config.jobs_config import JOBS_CONFIG
+from src.jobs.job_queue import BriefingJobQueue, QueueFullError
 
 load_dotenv()
 
@@ -45,63 +58,63 @@ app.add_middleware(
 cache_manager = CacheManager()
 print(f"DEBUG: Cache directory is {os.path.abspath(cache_manager.cache_dir)}")
 
+# Refreshes stale briefings after they have been served
+briefing_refresher = BackgroundRefresher()
+
+# Concurrent requests for the same briefing share one pipeline run
+briefing_flight = SingleFlight("briefing")
+
 # Initialize clients for Call Analyzer
 try:
-    elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+    elevenlabs_client = ElevenLabs(api_key=ELEVENLABS_CONFIG["api_key"])
 except Exception as e:
     print(f"Warning: Failed to initialize ElevenLabs client: {e}")
     elevenlabs_client = None
 
-try:
-    anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-except Exception as e:
-    print(f"Warning: Failed to initialize Anthropic client: {e}")
-    anthropic_client = None
-
-COMPLIANCE_PROMPT = """You are a compliance analyst reviewing call center transcripts for regulatory violations.
-
-Analyze the following transcript and identify any compliance violations.
-
-Check for these specific rules:
-1. RECORDING_DISCLOSURE - Agent must inform caller they are being recorded at the start
-2. IDENTITY_VERIFICATION - Agent must verify caller's identity before sharing sensitive info
-3. NO_PRESSURE_TACTICS - Agent cannot use high-pressure sales language or create false urgency
-4. ACCURATE_INFORMATION - Agent cannot make false claims or promises
-5. OPT_OUT_RESPECT - Agent must respect do-not-call or opt-out requests
-
-For each violation found, provide:
-- rule_code: The rule that was violated
-- severity: "HIGH", "MEDIUM", or "LOW"
-- quote: The exact quote from the transcript showing the violation
-- explanation: Why this is a violation
-- suggestion: How the agent should have handled it
-
-Respond ONLY with valid JSON in this format:
-{{
-    "total_violations": <number>,
-    "risk_level": "HIGH" | "MEDIUM" | "LOW" | "NONE",
-    "violations": [
-        {{
-            "rule_code": "RULE_CODE",
-            "severity": "HIGH",
-            "quote": "exact quote from transcript",
-            "explanation": "why this violates the rule",
-            "suggestion": "what the agent should have said instead"
-        }}
-    ],
-    "compliant_areas": ["list of rules that were followed correctly"],
-    "summary": "One sentence summary of the call's compliance status"
-}}
-
-TRANSCRIPT:
-{transcript}
-"""
+# Long recordings are split on silence and transcribed chunk by chunk
+audio_transcriber = ChunkedTranscriber(elevenlabs_client.speech_to_text.convert) if elevenlabs_client else None
+
+# Process-wide async client shared by every LLM call site
+anthropic_client = get_llm_client()
+
+# Long transcripts are analyzed in concurrent windows and merged
+compliance_engine = ComplianceEngine(anthropic_client)
+
+@app.exception_handler(BackpressureError)
+async def backpressure_handler(request: Request, exc: BackpressureError):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "provider": exc.provider, "reason": exc.reason, "retry_after": exc.retry_after},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+@app.on_event("startup")
+async def start_job_workers():
+    await briefing_jobs.start()
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    await briefing_jobs.stop()
+    await briefing_refresher.shutdown()
+    await close_llm_client()
+    await close_browser_pool()
+    await close_yutori_clients()
+    close_company_store()
 
 class BriefingRequest(BaseModel):
     linkedin_url: str
     twitter_url: Optional[str] = None
     meeting_context: str
 
+class BriefingJobRequest(BriefingRequest):
+    # Lower numbers run first
+    priority: int = JOBS_CONFIG["default_priority"]
+
+class BatchBriefingRequest(BaseModel):
+    requests: List[BriefingRequest]
+    # Items running at once; capped by PIPELINE_CONFIG["batch_concurrency"]
+    max_concurrency: Optional[int] = None
+
 class DownloadRequest(BaseModel):
     briefing_id: str
     linkedin_url: Optional[str] = None
@@ -109,6 +122,15 @@ class DownloadRequest(BaseModel):
 class TranscriptRequest(BaseModel):
     transcript: str
 
+class BulkComplianceRequest(BaseModel):
+    # Paths are relative to COMPLIANCE_CONFIG["bulk_root"]
+    input: str
+    output: str = "compliance_results.jsonl"
+    parquet: Optional[str] = None
+    mode: str = REALTIME
+    resume: bool = True
+    max_concurrency: Optional[int] = None
+
 class AnalyzeResponse(BaseModel):
     total_violations: int
     risk_level: str
@@ -119,161 +141,294 @@ class AnalyzeResponse(BaseModel):
 
 class TranscribeResponse(BaseModel):
     transcript: str
+    segments: Optional[list] = None
 
 class Base64AudioRequest(BaseModel):
     audio_base64: str
     filename: str
 
-def parse_json_response(response_text: str) -> dict:
-    """Parse JSON from Claude's response, handling markdown code blocks."""
-    cleaned = response_text.strip()
-    
-    lines = cleaned.split('\n')
-    if lines[0].startswith('```'):
-        lines = lines[1:]
-    if lines[-1].strip() == '```':
-        lines = lines[:-1]
-    
-    cleaned = '\n'.join(lines).strip()
-    return json.loads(cleaned)
-
 @app.get("/")
 def health_check():
     return {"status": "ok", "service": "BriefMe Intelligence Suite API"}
 
+@app.get("/health/browser")
+async def browser_health_check():
+    return {
+        **(await get_browser_pool().health_check()),
+        "readiness": readiness_recorder.summary(),
+        "resource_blocking": blocking_stats.summary()
+    }
+
+@app.get("/health/providers")
+def providers_health_check():
+    return governor.summary()
+
+@app.get("/health/jobs")
+async def jobs_health_check():
+    return {"queue": briefing_jobs.summary(), "jobs": await asyncio.to_thread(briefing_jobs.store.counts)}
+
+@app.get("/health/cache")
+def cache_health_check():
+    company_store = get_company_store()
+    return {
+        "briefing_cache": cache_manager.stats,
+        "memory_entries": len(cache_manager.memory),
+        "refresh": {**briefing_refresher.stats, "in_flight": briefing_refresher.in_flight()},
+        "company_intel": company_store.stats if company_store else "disabled",
+        "single_flight": {
+            flight.name: {**flight.stats, "in_flight": flight.in_flight()}
+            for flight in (briefing_flight, browse_flight, research_flight, synthesis_flight)
+        }
+    }
+
+@app.get("/health/llm")
+def llm_health_check():
+    if not anthropic_client:
+        return {"client": "unavailable"}
+    cache = anthropic_client.cache
+    return {
+        "client": "ok",
+        "response_cache": cache.stats if cache else "disabled",
+        "usage": anthropic_client.meter.summary()
+    }
+
+async def run_briefing_pipeline(request: BriefingRequest, research_memo: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run the pipeline for a request, coalescing with any identical run
+    already in flight.
+    """
+    async def run():
+        api_key = YUTORI_CONFIG.get("api_key", "mock_key")
+        pipeline = BriefingPipeline(api_key=api_key, llm_client=anthropic_client, research_memo=research_memo)
+        return await pipeline.run(request.linkedin_url, request.meeting_context, request.twitter_url)
+
+    key = cache_manager.get_cache_key(request.linkedin_url, request.meeting_context, request.twitter_url)
+    return await briefing_flight.do(key, run)
+
+async def refresh_briefing(request: BriefingRequest):
+    """
+    Rebuild a briefing and swap it into the cache. Runs detached from any
+    HTTP request, so a client disconnect does not cancel it.
+    """
+    final_output = await run_briefing_pipeline(request)
+    await cache_manager.save_to_cache_async(request.linkedin_url, final_output, request.meeting_context, request.twitter_url)
+    print(f"Refreshed cached briefing for {request.linkedin_url}")
+
 @app.post("/api/briefing/generate")
-async def generate_briefing(request: BriefingRequest):
+async def generate_briefing(request: BriefingRequest, http_request: Request, response: Response):
     try:
-        # Check cache first (Demo Mode)
-        # Note: Cache key currently only uses LinkedIn URL. 
-        # For simplicity, we keep it that way, assuming LinkedIn is the primary key.
-        cached_data = cache_manager.get_from_cache(request.linkedin_url)
-        if cached_data:
-            return cached_data
+        # Check cache first (falls back to context-agnostic demo entries)
+        entry = cache_manager.get_entry(request.linkedin_url, request.meeting_context, request.twitter_url)
+        if entry:
+            if entry["is_stale"]:
+                # Serve the stale briefing now, rebuild it in the background
+                refresh_key = cache_manager.get_cache_key(request.linkedin_url, request.meeting_context, request.twitter_url)
+                briefing_refresher.schedule(refresh_key, lambda: refresh_briefing(request))
+                response.headers["X-Briefing-Cache"] = "stale"
+            else:
+                response.headers["X-Briefing-Cache"] = "hit"
+            response.headers["Age"] = str(int(entry["age_seconds"]))
+            return entry["data"]
 
         # Pipeline Execution Logic
-        api_key = YUTORI_CONFIG.get("api_key", "mock_key")
-        
-        # Initialize Agents
-        browser = LinkedInBrowserAgent(api_key=api_key)
-        twitter_browser = TwitterBrowserAgent(api_key=api_key)
-        researcher = CompanyResearcher(api_key=api_key)
-        extractor = SemanticProfileExtractor(llm_client=anthropic_client)
-        theme_engine = ThemeIdentificationEngine(llm_client=anthropic_client)
-        transformer = StructuredDataTransformer()
-        synthesis_pipeline = AdaptiveSynthesisPipeline(llm_client=anthropic_client)
-        
-        # Initialize Phase 5 Components
-        # Pass the initialized Anthropic client to the generators
-        mock_generator = MockConversationGenerator(llm_client=anthropic_client)
-        response_coach = ResponseCoach(llm_client=anthropic_client)
-        scenario_builder = ConversationScenarioBuilder(llm_client=anthropic_client)
-        
-        # Phase 1: LinkedIn Browsing
-        profile_data = await browser.browse_profile(request.linkedin_url, request.meeting_context)
-        
-        if profile_data.get("error"):
-             raise Exception(f"LinkedIn browsing failed: {profile_data['error']}")
-
-        if not profile_data.get("profile"):
-             raise Exception("Failed to extract profile data. Please check the URL or try again later.")
-        
-        # Phase 1.5: Twitter Browsing (Optional)
-        twitter_posts = []
-        if request.twitter_url:
-            twitter_posts = await twitter_browser.browse_tweets(request.twitter_url)
-            # Combine LinkedIn posts and Tweets for analysis
-            profile_data["posts"].extend(twitter_posts)
-
-        company_name = profile_data["profile"].get("company", "Unknown")
-        role = profile_data["profile"].get("current_role", "Unknown")
-        company_data = await researcher.research_company(company_name, role)
-        
-        phase1_output = {
-            "profile": profile_data["profile"],
-            "posts": profile_data["posts"],
-            "company_context": company_data,
-            "decision_metadata": profile_data["decision_metadata"]
-        }
-        
-        # Phase 2
-        themes = await extractor.extract_profile_themes(phase1_output["posts"])
-        sentiment = await extractor.extract_sentiment_patterns(phase1_output["posts"])
-        theme_insights = theme_engine.identify_themes(phase1_output["posts"])
-        insights = theme_engine.generate_theme_insights(theme_insights)
-        
-        raw_extraction = {
-            "person": {
-                "name": phase1_output["profile"].get("name"),
-                "role": phase1_output["profile"].get("current_role"),
-                "company": phase1_output["profile"].get("company"),
-                "professional_identity": themes.get("professional_identity", ""),
-                "career_trajectory": "IC -> Lead -> CTO" # Still somewhat mocked unless we extract history
-            },
-            "themes": theme_insights,
-            "sentiment": sentiment,
-            "insights": insights,
-            "company_context": {
-                "name": phase1_output["company_context"].get("name"),
-                "relevance_score": 0.85,
-                "key_facts": phase1_output["company_context"].get("recent_news", []),
-                "recent_developments": phase1_output["company_context"].get("recent_news", [])
-            },
-            "extraction_metadata": {
-                "confidence_score": 0.95,
-                "data_quality": "high",
-                "extraction_time": "1.2s"
-            }
-        }
-        
-        final_output = transformer.transform_to_briefing_format(raw_extraction)
-        
-        # Phase 4: Adaptive Synthesis
-        synthesis_result = await synthesis_pipeline.synthesize(raw_extraction, request.meeting_context)
-        
-        # Merge synthesis result into final output
-        final_output.update(synthesis_result)
-        
-        # Phase 5: Tonic Fabricate Mock Conversations
-        # 5.1 Generate Likely Questions
-        likely_questions = await mock_generator.generate_likely_questions(raw_extraction["person"], request.meeting_context)
-        
-        # 5.2 Generate Response Strategies
-        strategies = await response_coach.generate_response_strategies(likely_questions, raw_extraction["person"])
-        
-        # 5.3 Generate Pitch Simulation
-        pitch_simulation = await mock_generator.generate_pitch_simulation(raw_extraction["person"], "I'd like to propose a partnership...")
-        
-        # 5.4 Build Full Scenarios
-        scenarios = await scenario_builder.build_scenarios(raw_extraction["person"])
-        
-        # Add to final output
-        final_output["mock_conversations"] = {
-            "likely_questions": strategies, # Strategies include the question + coaching
-            "pitch_simulation": pitch_simulation,
-            "conversation_scenarios": scenarios
-        }
+        final_output = await cancel_on_disconnect(http_request, run_briefing_pipeline(request))
         
         # Save to cache for next time
-        cache_manager.save_to_cache(request.linkedin_url, final_output)
+        await cache_manager.save_to_cache_async(request.linkedin_url, final_output, request.meeting_context, request.twitter_url)
 
+        response.headers["X-Briefing-Cache"] = "miss"
         return final_output
 
+    except StageFailedError as e:
+        if isinstance(e.cause, BackpressureError):
+            raise e.cause
+        raise HTTPException(status_code=500, detail=str(e.cause))
+    except BackpressureError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def run_briefing_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = BriefingRequest(**payload)
+    entry = cache_manager.get_entry(request.linkedin_url, request.meeting_context, request.twitter_url)
+    if entry and not entry["is_stale"]:
+        return entry["data"]
+
+    final_output = await run_briefing_pipeline(request)
+    await cache_manager.save_to_cache_async(request.linkedin_url, final_output, request.meeting_context, request.twitter_url)
+    return final_output
+
+# Bounded worker pool for queued briefing jobs
+briefing_jobs = BriefingJobQueue(run_briefing_job)
+
+def job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in job.items() if key not in ("result", "payload")}
+
+@app.post("/api/briefing/jobs", status_code=202)
+async def submit_briefing_job(request: BriefingJobRequest):
+    try:
+        job = await briefing_jobs.submit(request.model_dump(exclude={"priority"}), priority=request.priority)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    return job_status(job)
+
+@app.get("/api/briefing/jobs/{job_id}")
+async def get_briefing_job(job_id: str):
+    job = await briefing_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status(job)
+
+@app.get("/api/briefing/jobs/{job_id}/result")
+async def get_briefing_job_result(job_id: str, wait: float = 0):
+    """
+    Return the briefing once the job completes. With `wait` (seconds) the
+    call long-polls; an unfinished job returns 202 with its status.
+    """
+    job = await briefing_jobs.wait(job_id, timeout=wait)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] == "completed":
+        return job["result"]
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] == "cancelled":
+        raise HTTPException(status_code=409, detail=job["error"])
+    return JSONResponse(status_code=202, content=job_status(job))
+
+@app.delete("/api/briefing/jobs/{job_id}")
+async def cancel_briefing_job(job_id: str):
+    job = await briefing_jobs.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status(job)
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.post("/api/briefing/stream")
+async def stream_briefing(request: BriefingRequest):
+    """
+    Server-Sent Events variant of /api/briefing/generate. Emits one
+    `section` event per briefing section as soon as its stage finishes,
+    `item` events for talking points and scenario dialogue turns as the
+    LLM generates them, then `complete` with the full briefing (or `error`).
+    """
+    entry = cache_manager.get_entry(request.linkedin_url, request.meeting_context, request.twitter_url)
+
+    async def events():
+        if entry:
+            if entry["is_stale"]:
+                refresh_key = cache_manager.get_cache_key(request.linkedin_url, request.meeting_context, request.twitter_url)
+                briefing_refresher.schedule(refresh_key, lambda: refresh_briefing(request))
+            yield format_sse("complete", {
+                "data": entry["data"],
+                "cache": "stale" if entry["is_stale"] else "hit",
+                "age_seconds": entry["age_seconds"]
+            })
+            return
+
+        api_key = YUTORI_CONFIG.get("api_key", "mock_key")
+        pipeline = BriefingPipeline(api_key=api_key, llm_client=anthropic_client)
+        # The iterator is closed (and the run cancelled) if the client disconnects
+        stream = pipeline.stream(request.linkedin_url, request.meeting_context, request.twitter_url)
+        try:
+            async for event in stream:
+                name = event.pop("event")
+                if name == "complete":
+                    await cache_manager.save_to_cache_async(request.linkedin_url, event["data"], request.meeting_context, request.twitter_url)
+                    event["cache"] = "miss"
+                yield format_sse(name, event)
+        except StageFailedError as e:
+            error = {"stage": e.stage_name, "detail": str(e.cause)}
+            if isinstance(e.cause, BackpressureError):
+                error["retry_after"] = e.cause.retry_after
+            yield format_sse("error", error)
+        except Exception as e:
+            yield format_sse("error", {"detail": str(e)})
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/briefing/batch")
+async def batch_briefing(batch: BatchBriefingRequest):
+    """
+    Generate briefings for a list of meetings, streaming an `item` event
+    (SSE) as each one finishes and a final `complete` summary. Items run
+    concurrently up to the batch capacity, and company research is shared
+    between attendees from the same company.
+    """
+    if not batch.requests:
+        raise HTTPException(status_code=400, detail="No briefing requests given")
+    if len(batch.requests) > PIPELINE_CONFIG["batch_max_items"]:
+        raise HTTPException(status_code=413, detail=f"At most {PIPELINE_CONFIG['batch_max_items']} briefings per batch")
+
+    capacity = PIPELINE_CONFIG["batch_concurrency"]
+    concurrency = min(batch.max_concurrency or capacity, capacity)
+    research_memo: Dict[str, Any] = {}
+
+    async def generate(request: BriefingRequest) -> Dict[str, Any]:
+        started = time.perf_counter()
+        entry = cache_manager.get_entry(request.linkedin_url, request.meeting_context, request.twitter_url)
+        if entry and not entry["is_stale"]:
+            return {"data": entry["data"], "cache": "hit", "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+        final_output = await run_briefing_pipeline(request, research_memo=research_memo)
+        await cache_manager.save_to_cache_async(request.linkedin_url, final_output, request.meeting_context, request.twitter_url)
+        return {"data": final_output, "cache": "miss", "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+    async def events():
+        started = time.perf_counter()
+        completed = failed = 0
+        # Closing this generator (client disconnect) cancels unfinished items
+        results = run_batch(batch.requests, generate, concurrency)
+        try:
+            async for index, result, error in results:
+                item = {"index": index, "linkedin_url": batch.requests[index].linkedin_url}
+                if error is None:
+                    completed += 1
+                    yield format_sse("item", {**item, "status": "completed", **result})
+                else:
+                    failed += 1
+                    cause = error.cause if isinstance(error, StageFailedError) else error
+                    failure = {**item, "status": "failed", "error": str(cause)}
+                    if isinstance(cause, BackpressureError):
+                        failure["retry_after"] = cause.retry_after
+                    yield format_sse("item", failure)
+        finally:
+            await results.aclose()
+        yield format_sse("complete", {
+            "total": len(batch.requests),
+            "completed": completed,
+            "failed": failed,
+            "concurrency": concurrency,
+            "companies_researched": len(research_memo),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        })
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/briefing/download")
 async def download_briefing(request: DownloadRequest):
     # Try to get data from cache if URL provided
     data = None
     if request.linkedin_url:
-        data = cache_manager.get_from_cache(request.linkedin_url)
+        data = cache_manager.get_latest_for_profile(request.linkedin_url)
 
     if not data:
         raise HTTPException(status_code=404, detail="Briefing not found. Please generate it first.")
     
     pdf_gen = PDFGenerator()
-    pdf_bytes = pdf_gen.generate(data)
+    pdf_bytes = await asyncio.to_thread(pdf_gen.generate, data)
     
     return StreamingResponse(
         io.BytesIO(pdf_bytes),
@@ -283,6 +438,22 @@ async def download_briefing(request: DownloadRequest):
 
 # --- Call Analyzer Endpoints ---
 
+async def transcribe_file(source: Union[str, BinaryIO], audio_format: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Transcribe a recording (a path or a seekable file object) with
+    ElevenLabs. Returns the transcript text with timestamped segments and
+    words (see ChunkedTranscriber).
+    """
+    return await audio_transcriber.transcribe(source, audio_format)
+
+def audio_format_of(filename: Optional[str]) -> Optional[str]:
+    if not filename or "." not in filename:
+        return None
+    return filename.rsplit(".", 1)[-1].lower()
+
+async def analyze_transcript_text(transcript: str) -> Dict[str, Any]:
+    return await compliance_engine.analyze(transcript)
+
 @app.post("/transcribe", response_model=TranscribeResponse)
 async def transcribe_audio(file: UploadFile = File(...)):
     """Transcribe an audio file using ElevenLabs Speech-to-Text."""
@@ -291,68 +462,48 @@ async def transcribe_audio(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail="ElevenLabs client not initialized")
     
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.split('.')[-1]}") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        
-        # Transcribe with ElevenLabs
-        with open(tmp_path, "rb") as audio_file:
-            result = elevenlabs_client.speech_to_text.convert(
-                file=audio_file,
-                model_id="scribe_v1",
-                language_code="en"
-            )
-        
-        # Clean up temp file
-        os.unlink(tmp_path)
-        
-        return TranscribeResponse(transcript=result.text)
+        # Starlette has already spooled the upload; transcribe straight from it
+        transcription = await transcribe_file(file.file, audio_format_of(file.filename))
+        return TranscribeResponse(transcript=transcription["text"], segments=transcription["segments"])
     
+    except BackpressureError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/analyze-audio-base64")
-async def analyze_audio_base64(request: Base64AudioRequest):
-    """Analyze audio from base64 data."""
+@app.post(
+    "/analyze-audio-base64",
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": Base64AudioRequest.model_json_schema()}}
+    }}
+)
+async def analyze_audio_base64(http_request: Request):
+    """
+    Analyze audio from base64 data. The JSON body (see Base64AudioRequest)
+    is decoded as it arrives, so the base64 text is never held in full.
+    """
     if not elevenlabs_client:
         raise HTTPException(status_code=500, detail="ElevenLabs client not initialized")
     if not anthropic_client:
         raise HTTPException(status_code=500, detail="Anthropic client not initialized")
 
-    # Decode base64 to file
-    audio_data = base64.b64decode(request.audio_base64)
-    suffix = request.filename.split('.')[-1]
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{suffix}") as tmp:
-        tmp.write(audio_data)
-        tmp_path = tmp.name
-    
+    spool = new_spool()
     try:
-        # Transcribe
-        with open(tmp_path, "rb") as audio_file:
-            result = elevenlabs_client.speech_to_text.convert(
-                file=audio_file,
-                model_id="scribe_v1",
-                language_code="en"
-            )
-        transcript = result.text
-        
-        # Analyze
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5", 
-            max_tokens=2000,
-            messages=[{"role": "user", "content": COMPLIANCE_PROMPT.format(transcript=transcript)}]
-        )
-        
-        response_text = message.content[0].text
-        compliance_result = parse_json_response(response_text)
-        
+        try:
+            fields = await spool_json_base64(http_request.stream(), "audio_base64", spool)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid base64 data: {e}")
+        if not isinstance(fields.get("filename"), str):
+            raise HTTPException(status_code=422, detail="filename is required")
+
+        transcript = (await transcribe_file(spool, audio_format_of(fields["filename"])))["text"]
+        compliance_result = await analyze_transcript_text(transcript)
         return {**compliance_result, "transcript": transcript}
     finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        spool.close()
 
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_compliance(request: TranscriptRequest):
@@ -362,29 +513,108 @@ async def analyze_compliance(request: TranscriptRequest):
         raise HTTPException(status_code=500, detail="Anthropic client not initialized")
     
     try:
-        # Note: Model name updated to a more standard one if the previous was hypothetical
-        # Reverting to what was in the source file: claude-sonnet-4-5
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5", 
-            max_tokens=2000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": COMPLIANCE_PROMPT.format(transcript=request.transcript)
-                }
-            ]
-        )
-        
-        response_text = message.content[0].text
-        result = parse_json_response(response_text)
-        
+        result = await analyze_transcript_text(request.transcript)
         return AnalyzeResponse(**result, transcript=request.transcript)
     
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Failed to parse Claude response: {e}")
+    except BackpressureError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/analyze/stream")
+async def stream_compliance(request: TranscriptRequest):
+    """
+    Server-Sent Events variant of /analyze: one `violation` event per
+    violation as soon as Claude has written it, `violation_update`
+    ({index, violation}) when a later section's copy of it replaces the one
+    at that index, then `complete` with the full report (or `error`).
+    """
+    if not anthropic_client:
+        raise HTTPException(status_code=500, detail="Anthropic client not initialized")
+
+    async def events():
+        try:
+            async for event in compliance_engine.stream(request.transcript):
+                if event["event"] in ("violation", "violation_update"):
+                    yield format_sse(event["event"], event["data"])
+                else:
+                    result = AnalyzeResponse(**event["data"], transcript=request.transcript)
+                    yield format_sse("complete", result.model_dump())
+        except BackpressureError as e:
+            yield format_sse("error", {"detail": str(e), "retry_after": e.retry_after})
+        except json.JSONDecodeError as e:
+            yield format_sse("error", {"detail": f"Failed to parse Claude response: {e}"})
+        except Exception as e:
+            yield format_sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def bulk_path(relative: str) -> str:
+    root = os.path.realpath(COMPLIANCE_CONFIG["bulk_root"])
+    path = os.path.realpath(os.path.join(root, relative))
+    if os.path.commonpath([root, path]) != root:
+        raise HTTPException(status_code=400, detail=f"{relative} is outside the bulk directory")
+    return path
+
+@app.post("/compliance/bulk")
+async def bulk_compliance(request: BulkComplianceRequest):
+    """
+    Analyze a directory or JSONL file of transcripts and recordings under
+    COMPLIANCE_CONFIG["bulk_root"], appending one record per call to
+    `output` (see BulkComplianceRunner). Streams an `item` event (SSE) per
+    finished call, `progress` while a batch-mode run waits on the Message
+    Batches API, and a final `complete` summary. Re-posting after a
+    disconnect resumes where the run stopped; a run already writing
+    `output` gets 409.
+    """
+    if not anthropic_client:
+        raise HTTPException(status_code=500, detail="Anthropic client not initialized")
+    if request.mode not in (REALTIME, BATCH):
+        raise HTTPException(status_code=400, detail=f"mode must be {REALTIME} or {BATCH}")
+    if request.parquet and not parquet_available():
+        raise HTTPException(status_code=400, detail="Parquet output needs pyarrow installed on the server")
+
+    source, output = bulk_path(request.input), bulk_path(request.output)
+    parquet = bulk_path(request.parquet) if request.parquet else None
+    try:
+        # Entries of a JSONL input (and symlinks) must stay under bulk_root too
+        items = await asyncio.to_thread(discover_inputs, source, COMPLIANCE_CONFIG["bulk_root"])
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not items:
+        raise HTTPException(status_code=400, detail="No transcripts or recordings found")
+
+    try:
+        # Taken before streaming starts so a clash can still be a 409
+        lock = OutputLock(output).acquire()
+    except OutputLockedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    runner = BulkComplianceRunner(compliance_engine, audio_transcriber)
+
+    async def events():
+        # Closing this generator (client disconnect) cancels unfinished calls
+        run = runner.run(items, output, request.mode, request.resume, request.max_concurrency, parquet, lock=lock)
+        try:
+            async for event in run:
+                yield format_sse(event["event"], event["data"])
+        except Exception as e:
+            yield format_sse("error", {"detail": str(e)})
+        finally:
+            await run.aclose()
+            lock.release()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/analyze-audio", response_model=AnalyzeResponse)
 async def analyze_audio(file: UploadFile = File(...)):
     """Full pipeline: Transcribe audio and analyze for compliance in one call."""
@@ -405,42 +635,21 @@ async def analyze_audio_form(audio_base64: str = Form(...), filename: str = Form
     if not anthropic_client:
         raise HTTPException(status_code=500, detail="Anthropic client not initialized")
 
-    # Decode base64 to file
-    try:
-        audio_data = base64.b64decode(audio_base64)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid base64 data: {e}")
-
-    suffix = filename.split('.')[-1]
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{suffix}") as tmp:
-        tmp.write(audio_data)
-        tmp_path = tmp.name
-    
+    # Decode a slice at a time into a spool rather than into one bytes copy
+    spool = new_spool()
     try:
-        # Transcribe
-        with open(tmp_path, "rb") as audio_file:
-            result = elevenlabs_client.speech_to_text.convert(
-                file=audio_file,
-                model_id="scribe_v1",
-                language_code="en"
-            )
-        transcript = result.text
-        
-        # Analyze
-        message = anthropic_client.messages.create(
-            model="claude-sonnet-4-5", 
-            max_tokens=2000,
-            messages=[{"role": "user", "content": COMPLIANCE_PROMPT.format(transcript=transcript)}]
-        )
-        
-        response_text = message.content[0].text
-        compliance_result = parse_json_response(response_text)
-        
+        try:
+            spool_base64_text(audio_base64, spool)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid base64 data: {e}")
+
+        transcript = (await transcribe_file(spool, audio_format_of(filename)))["text"]
+        compliance_result = await analyze_transcript_text(transcript)
         return {**compliance_result, "transcript": transcript}
     finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        spool.close()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import json
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from elevenlabs import ElevenLabs
+from src.audio.transcriber import ChunkedTranscriber
+from src.compliance.bulk import BATCH, REALTIME, BulkComplianceRunner, OutputLockedError, discover_inputs, parquet_available
+from src.compliance.engine import ComplianceEngine
+from src.config.elevenlabs_config import ELEVENLABS_CONFIG
+from src.llm.llm_client import get_llm_client, close_llm_client
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Analyze a backlog of calls for compliance violations.")
+    parser.add_argument("input", help="Directory of transcripts (.txt) and recordings, or a JSONL file")
+    parser.add_argument("--output", default="compliance_results.jsonl", help="Results file (JSONL); also the checkpoint")
+    parser.add_argument("--parquet", help="Also write the results to this Parquet file (needs pyarrow)")
+    parser.add_argument("--mode", choices=[REALTIME, BATCH], default=REALTIME,
+                        help="batch: send the LLM requests through the Message Batches API (cheaper, slower)")
+    parser.add_argument("--concurrency", type=int, help="Calls in flight at once")
+    parser.add_argument("--restart", action="store_true", help="Discard previous results instead of resuming")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    if args.parquet and not parquet_available():
+        raise SystemExit("--parquet needs pyarrow (pip install pyarrow)")
+
+    llm_client = get_llm_client()
+    if llm_client is None:
+        raise SystemExit("Anthropic client not initialized")
+    transcriber = None
+    if ELEVENLABS_CONFIG["api_key"]:
+        transcriber = ChunkedTranscriber(ElevenLabs(api_key=ELEVENLABS_CONFIG["api_key"]).speech_to_text.convert)
+
+    items = discover_inputs(args.input)
+    print(f"--- Compliance bulk run: {len(items)} calls from {args.input} ({args.mode} mode) ---")
+    runner = BulkComplianceRunner(ComplianceEngine(llm_client), transcriber)
+    try:
+        async for event in runner.run(
+            items,
+            os.path.abspath(args.output),
+            mode=args.mode,
+            resume=not args.restart,
+            concurrency=args.concurrency,
+            parquet_path=args.parquet
+        ):
+            data = event["data"]
+            if event["event"] == "item":
+                if data["status"] == "completed":
+                    print(f"[{data['status']}] {data['id']}: {data['risk_level']} risk, "
+                          f"{data['total_violations']} violation(s), {data['latency_ms']}ms")
+                else:
+                    print(f"[{data['status']}] {data['id']}: {data['error']}")
+            elif event["event"] == "progress":
+                print(f"Batch {data['batch_id']}: {data['status']} {data['request_counts']}")
+            else:
+                print(json.dumps(data, indent=2))
+    except OutputLockedError as e:
+        raise SystemExit(str(e))
+    finally:
+        await close_llm_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
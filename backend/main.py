@@ -5,6 +5,8 @@ from src.config.yutori_config import YUTORI_CONFIG
 from src.agents.linkedin_browser import LinkedInBrowserAgent
 from src.agents.yutori_researcher import YutoriResearcher
 from src.agents.twitter_browser import TwitterBrowserAgent
+from src.agents.browser_pool import close_browser_pool
+from src.agents.yutori_client import close_yutori_clients
 from src.schemas.navigator_output import NavigatorOutput
 
 async def main():
@@ -130,5 +132,9 @@ async def main():
     except Exception as e:
         print(f"\nERROR: Validation failed: {e}")
 
+    # Release the shared browser and HTTP pools before the event loop closes
+    await close_browser_pool()
+    await close_yutori_clients()
+
 if __name__ == "__main__":
     asyncio.run(main())
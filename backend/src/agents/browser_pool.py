@@ -0,0 +1,204 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
+from playwright.async_api import async_playwright
+from ..config.browser_config import BROWSER_CONFIG
+from .resource_blocker import install_resource_blocking
+from ..governor.provider_governor import governor
+
+_shared_pool: Optional["BrowserPool"] = None
+
+
+class _PooledContext:
+    """
+    A browser context plus the bookkeeping needed to decide when to recycle it.
+    """
+
+    def __init__(self, context, browser):
+        self.context = context
+        self.browser = browser
+        self.uses = 0
+        self.crashed = False
+        self.created_at = time.time()
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium instance that hands out warm, authenticated contexts.
+
+    One browser is launched lazily on first lease and kept running. Contexts
+    are reused across leases (cookies from auth_state.json stay loaded) and
+    recycled after `max_uses_per_context` leases or when a page crashes.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = {**BROWSER_CONFIG, **(config or {})}
+        self._playwright = None
+        self._browser = None
+        self._idle: List[_PooledContext] = []
+        self._in_use = 0
+        self._semaphore = asyncio.Semaphore(self.config["max_contexts"])
+        self._start_lock = asyncio.Lock()
+        self.stats = {"leases": 0, "contexts_created": 0, "contexts_recycled": 0, "browser_restarts": 0}
+
+    async def start(self):
+        """
+        Launch Playwright and Chromium if they are not already running.
+        """
+        async with self._start_lock:
+            if self._browser and self._browser.is_connected():
+                return
+
+            if self._browser is not None:
+                # Browser died underneath us; drop everything tied to it
+                print("Browser pool: browser disconnected, restarting.")
+                self.stats["browser_restarts"] += 1
+                self._idle = []
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.config["headless"])
+
+    async def close(self):
+        """
+        Close every context, the browser and Playwright.
+        """
+        for pooled in self._idle:
+            await self._close_context(pooled)
+        self._idle = []
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Browser pool: error closing browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @asynccontextmanager
+    async def lease_page(self, site: Optional[str] = None):
+        """
+        Lease a fresh page on a warm context. The page is closed on release
+        and the context goes back to the pool unless it needs recycling.
+        `site` selects the request-blocking rules applied to the page and
+        the per-site rate limit, which is waited on before taking a context.
+        """
+        async with governor.limit(site):
+            async with self._lease(site) as page:
+                yield page
+
+    @asynccontextmanager
+    async def _lease(self, site: Optional[str]):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.config["lease_timeout"])
+        except asyncio.TimeoutError:
+            raise RuntimeError("Browser pool exhausted: no context available within lease timeout")
+
+        pooled = None
+        page = None
+        failed = False
+        self._in_use += 1
+        try:
+            await self.start()
+            pooled = self._idle.pop() if self._idle else await self._new_context()
+            pooled.uses += 1
+            self.stats["leases"] += 1
+
+            page = await pooled.context.new_page()
+            page.on("crash", lambda _: setattr(pooled, "crashed", True))
+            await install_resource_blocking(page, site)
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    failed = True
+            if pooled is not None:
+                await self._release(pooled, failed)
+            self._in_use -= 1
+            self._semaphore.release()
+
+    async def _new_context(self) -> _PooledContext:
+        auth_path = self.config["auth_state_path"]
+        if auth_path and os.path.exists(auth_path):
+            print(f"Browser pool: loading auth state from {auth_path}")
+            context = await self._browser.new_context(storage_state=auth_path)
+        else:
+            print("Browser pool: no auth state found. Contexts will browse as guest (likely limited).")
+            context = await self._browser.new_context(user_agent=self.config["user_agent"])
+        self.stats["contexts_created"] += 1
+        return _PooledContext(context, self._browser)
+
+    async def _release(self, pooled: _PooledContext, failed: bool):
+        worn_out = pooled.uses >= self.config["max_uses_per_context"]
+        if failed or pooled.crashed or worn_out or not self._owned_by_live_browser(pooled):
+            self.stats["contexts_recycled"] += 1
+            await self._close_context(pooled)
+        else:
+            self._idle.append(pooled)
+
+    def _owned_by_live_browser(self, pooled: _PooledContext) -> bool:
+        # A context leased before a restart belongs to the dead browser
+        return pooled.browser is self._browser and self._browser is not None and self._browser.is_connected()
+
+    async def _responsive(self, pooled: _PooledContext) -> bool:
+        # A cheap round trip to the context; a dead one errors or hangs
+        try:
+            await asyncio.wait_for(pooled.context.cookies(), timeout=self.config["health_probe_timeout"])
+            return True
+        except Exception:
+            return False
+
+    async def _close_context(self, pooled: _PooledContext):
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Report pool state and drop idle contexts that no longer respond.
+        """
+        browser_alive = self._browser is not None and self._browser.is_connected()
+        # Leases may take or return contexts while the probes run
+        idle, self._idle = self._idle, []
+        healthy_idle = []
+        for pooled in idle:
+            if self._owned_by_live_browser(pooled) and not pooled.crashed and await self._responsive(pooled):
+                healthy_idle.append(pooled)
+            else:
+                self.stats["contexts_recycled"] += 1
+                await self._close_context(pooled)
+        self._idle = healthy_idle + self._idle
+
+        return {
+            "browser_running": browser_alive,
+            "idle_contexts": len(self._idle),
+            "leased_contexts": self._in_use,
+            "max_contexts": self.config["max_contexts"],
+            **self.stats
+        }
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Return the process-wide browser pool shared by all scraper agents.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = BrowserPool()
+    return _shared_pool
+
+
+async def close_browser_pool():
+    global _shared_pool
+    if _shared_pool is not None:
+        await _shared_pool.close()
+        _shared_pool = None
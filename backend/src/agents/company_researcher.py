@@ -1,14 +1,21 @@
 import asyncio
 from typing import Dict, Any
-from playwright.async_api import async_playwright
+from .browser_pool import get_browser_pool
+from .page_readiness import wait_until_ready
+from ..storage.company_store import get_company_store
+from ..governor.provider_governor import BackpressureError
+
+# Stored fields this researcher can use; it only scrapes recent_news itself
+STORED_FIELDS = ["recent_news", "industry", "funding", "competitors"]
 
 class CompanyResearcher:
     """
     Uses Playwright to research company context.
     """
     
-    def __init__(self, api_key: str):
-        pass
+    def __init__(self, api_key: str, browser_pool=None, company_store=None):
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.company_store = company_store or get_company_store()
 
     async def research_company(self, company_name: str, person_role: str) -> Dict[str, Any]:
         """
@@ -33,15 +40,19 @@ class CompanyResearcher:
                 "recent_news": ["No company name provided."],
                 "competitors": []
             }
-        
+
+        # Anyone at this company researched recently? Skip the scrape.
+        stored = await self.company_store.get(company_name, STORED_FIELDS) if self.company_store else {}
+        if "recent_news" in stored:
+            print(f"Using stored company intel for {company_name}")
+            return self._build_result(company_name, stored["recent_news"], stored)
+
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            async with self.browser_pool.lease_page(site="duckduckgo") as page:
                 # DuckDuckGo search for news
                 url = f"https://duckduckgo.com/?q={company_name.replace(' ', '+')}+news&t=h_&ia=news"
                 await page.goto(url)
-                await page.wait_for_timeout(3000)
+                await wait_until_ready(page, "duckduckgo")
                 
                 # Simple extraction of news titles
                 elements = await page.query_selector_all("a.result__a") # DDG news selector might vary, using generic result link
@@ -55,18 +66,28 @@ class CompanyResearcher:
                     if text and len(text) > 10:
                         recent_news.append(text)
                 
-                await browser.close()
-                
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Error researching company: {e}")
 
+        if recent_news and self.company_store:
+            await self.company_store.put(company_name, {"recent_news": recent_news})
+
+        return self._build_result(
+            company_name,
+            recent_news if recent_news else [f"No specific news found for {company_name}"],
+            stored
+        )
+
+    def _build_result(self, company_name: str, recent_news: list, stored: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "name": company_name,
-            "industry": "Technology", # Hard to determine without deeper scrape
-            "funding": {
+            "industry": stored.get("industry", "Technology"), # Hard to determine without deeper scrape
+            "funding": stored.get("funding", {
                 "stage": "Unknown",
                 "amount": "Unknown"
-            },
-            "recent_news": recent_news if recent_news else [f"No specific news found for {company_name}"],
-            "competitors": []
+            }),
+            "recent_news": recent_news,
+            "competitors": stored.get("competitors", [])
         }
@@ -1,8 +1,10 @@
 import asyncio
 from typing import Dict, Any, List
-from playwright.async_api import async_playwright
 import agentql
 from .decision_engine import NavigatorDecisionEngine
+from .browser_pool import get_browser_pool
+from ..governor.provider_governor import governor, BackpressureError
+from .page_readiness import wait_until_ready
 import os
 
 class LinkedInBrowserAgent:
@@ -11,12 +13,13 @@ class LinkedInBrowserAgent:
     and make intelligent decisions about what content matters.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, browser_pool=None):
         # Ensure API key is set for AgentQL
         if api_key and not os.getenv("AGENTQL_API_KEY"):
              os.environ["AGENTQL_API_KEY"] = api_key
         
         self.decision_engine = NavigatorDecisionEngine()
+        self.browser_pool = browser_pool or get_browser_pool()
 
     async def browse_profile(self, linkedin_url: str, meeting_context: str) -> Dict[str, Any]:
         """
@@ -28,29 +31,14 @@ class LinkedInBrowserAgent:
         raw_posts = []
 
         try:
-            async with async_playwright() as p:
-                # Launch browser (headless=True for backend)
-                browser = await p.chromium.launch(headless=True)
-                
-                # Load auth state if available
-                auth_path = os.path.join(os.path.dirname(__file__), "../../data/cache/auth_state.json")
-                if os.path.exists(auth_path):
-                    print(f"Loading auth state from {auth_path}")
-                    context = await browser.new_context(storage_state=auth_path)
-                else:
-                    print("No auth state found. Proceeding as guest (likely limited).")
-                    context = await browser.new_context(
-                         user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    )
-
-                page = await context.new_page()
-                
+            async with self.browser_pool.lease_page(site="linkedin") as page:
                 # Wrap page with AgentQL
                 page = await agentql.wrap_async(page)
                 
                 await page.goto(linkedin_url)
-                # Wait for some content to load
-                await page.wait_for_timeout(5000) 
+                # Wait until the profile header or feed is rendered
+                readiness = await wait_until_ready(page, "linkedin")
+                print(f"LinkedIn page ready: {readiness['outcome']} after {readiness['waited_ms']}ms")
                 
                 # Attempt Playwright scraping first (or in parallel) as requested
                 print("Attempting deep scraping with Playwright...")
@@ -81,7 +69,10 @@ class LinkedInBrowserAgent:
                 # Execute Query
                 response = None
                 try:
-                    response = await page.query_data(QUERY)
+                    async with governor.limit("agentql"):
+                        response = await page.query_data(QUERY)
+                except BackpressureError:
+                    raise
                 except Exception as q_err:
                     print(f"AgentQL query error: {q_err}")
                 
@@ -111,9 +102,11 @@ class LinkedInBrowserAgent:
                 
                 # Merge posts: simple concatenation for now, could be smarter deduplication
                 raw_posts = ql_posts + playwright_data.get("posts", [])
-
-                await browser.close()
                 
+        except BackpressureError:
+            # Throttled by our own governor: let the caller retry later rather
+            # than continuing with an empty profile
+            raise
         except Exception as e:
             # If we fail (e.g. no AgentQL key or browser issue), we return empty to avoid breaking pipeline completely
             # but we are NOT falling back to mock data.
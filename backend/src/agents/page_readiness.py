@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import deque, Counter
+from typing import Dict, Any, List, Optional
+from ..config.browser_config import READINESS_CONFIG
+
+_SAMPLES_PER_SITE = 200
+
+
+class ReadinessRecorder:
+    """
+    Keeps recent readiness wait durations per site so the upper bounds in
+    READINESS_CONFIG can be tuned from real data.
+    """
+
+    def __init__(self, max_samples: int = _SAMPLES_PER_SITE):
+        self.max_samples = max_samples
+        self._samples: Dict[str, deque] = {}
+
+    def record(self, site: str, phase: str, waited_ms: float, outcome: str):
+        key = f"{site}:{phase}"
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=self.max_samples)
+        self._samples[key].append({"waited_ms": waited_ms, "outcome": outcome})
+
+    def summary(self) -> Dict[str, Any]:
+        report = {}
+        for key, samples in self._samples.items():
+            durations = sorted(s["waited_ms"] for s in samples)
+            report[key] = {
+                "count": len(durations),
+                "p50_ms": self._percentile(durations, 0.5),
+                "p90_ms": self._percentile(durations, 0.9),
+                "max_ms": durations[-1] if durations else 0,
+                "outcomes": dict(Counter(s["outcome"] for s in samples))
+            }
+        return report
+
+    @staticmethod
+    def _percentile(values: List[float], pct: float) -> float:
+        if not values:
+            return 0
+        index = min(len(values) - 1, int(round(pct * (len(values) - 1))))
+        return values[index]
+
+
+readiness_recorder = ReadinessRecorder()
+
+
+async def wait_until_ready(page, site: str, max_wait_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Wait until the content a scraper needs is on the page.
+
+    Races the site's selectors against a network-idle heuristic and returns
+    as soon as either settles, bounded by max_wait_ms. Never raises: a page
+    that is not ready in time is scraped as-is, like the old fixed sleeps.
+    """
+    site_config = READINESS_CONFIG["sites"].get(site, {})
+    max_wait_ms = max_wait_ms or site_config.get("max_wait_ms") or READINESS_CONFIG["default_max_wait_ms"]
+    selectors = site_config.get("selectors", [])
+
+    waiters = {}
+    if selectors:
+        waiters["selector"] = page.wait_for_selector(", ".join(selectors), state="attached", timeout=max_wait_ms)
+    waiters["network_idle"] = page.wait_for_load_state("networkidle", timeout=max_wait_ms)
+
+    return await _race(site, "load", waiters, max_wait_ms)
+
+
+async def wait_for_lazy_content(page, site: str, previous_count: int) -> Dict[str, Any]:
+    """
+    After a scroll, wait until more items than `previous_count` match the
+    site's lazy-load selector, or the network goes idle.
+    """
+    site_config = READINESS_CONFIG["sites"].get(site, {})
+    selector = site_config.get("lazy_selector")
+    max_wait_ms = site_config.get("lazy_max_wait_ms") or READINESS_CONFIG["default_max_wait_ms"]
+
+    waiters = {}
+    if selector:
+        waiters["selector"] = page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[selector, previous_count],
+            timeout=max_wait_ms
+        )
+    waiters["network_idle"] = page.wait_for_load_state("networkidle", timeout=max_wait_ms)
+
+    return await _race(site, "lazy_load", waiters, max_wait_ms)
+
+
+async def _race(site: str, phase: str, waiters: Dict[str, Any], max_wait_ms: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    tasks = {asyncio.ensure_future(coro): name for name, coro in waiters.items()}
+    outcome = "timeout"
+    pending = set(tasks)
+
+    try:
+        deadline = started + max_wait_ms / 1000
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            # A waiter that errored (usually a Playwright timeout) is not a signal of readiness
+            finished = [t for t in done if not t.cancelled() and t.exception() is None]
+            if finished:
+                outcome = tasks[finished[0]]
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    waited_ms = round((time.perf_counter() - started) * 1000, 1)
+    readiness_recorder.record(site, phase, waited_ms, outcome)
+    return {"site": site, "phase": phase, "outcome": outcome, "waited_ms": waited_ms}
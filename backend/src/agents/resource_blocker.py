@@ -0,0 +1,87 @@
+from collections import Counter
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from ..config.browser_config import BLOCKING_CONFIG
+
+
+class BlockingStats:
+    """
+    Running totals of aborted requests and estimated bytes saved, per site.
+    """
+
+    def __init__(self):
+        self._sites: Dict[str, Dict[str, Any]] = {}
+
+    def _site(self, site: str) -> Dict[str, Any]:
+        if site not in self._sites:
+            self._sites[site] = {"blocked_requests": 0, "allowed_requests": 0, "estimated_bytes_saved": 0, "by_reason": Counter()}
+        return self._sites[site]
+
+    def record(self, site: str, reason: str, estimated_bytes: int):
+        stats = self._site(site)
+        stats["blocked_requests"] += 1
+        stats["estimated_bytes_saved"] += estimated_bytes
+        stats["by_reason"][reason] += 1
+
+    def record_allowed(self, site: str):
+        self._site(site)["allowed_requests"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {site: {**stats, "by_reason": dict(stats["by_reason"])} for site, stats in self._sites.items()}
+
+
+blocking_stats = BlockingStats()
+
+
+class ResourceBlocker:
+    """
+    Aborts images, media, fonts and tracker/ad requests on a scraper page.
+    Rules come from BLOCKING_CONFIG["sites"][site].
+    """
+
+    def __init__(self, site: str, config: Optional[Dict[str, Any]] = None):
+        self.site = site
+        self.config = config or BLOCKING_CONFIG
+        self.enabled = self.config.get("enabled", True)
+        site_rules = self.config["sites"].get(site, {})
+        self.resource_types = set(site_rules.get("resource_types", []))
+        self.blocked_domains = tuple(site_rules.get("blocked_domains", []))
+        self.estimated_bytes = self.config.get("estimated_bytes", {})
+
+    def should_block(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Return the reason a request should be aborted, or None to let it through.
+        """
+        if not self.enabled:
+            return None
+        if resource_type in self.resource_types:
+            return resource_type
+        host = urlparse(url).hostname or ""
+        for domain in self.blocked_domains:
+            if host == domain or host.endswith("." + domain):
+                return "tracker"
+        return None
+
+    async def attach(self, page):
+        await page.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route):
+        request = route.request
+        reason = self.should_block(request.url, request.resource_type)
+        if reason is None:
+            blocking_stats.record_allowed(self.site)
+            await route.continue_()
+            return
+
+        estimate = self.estimated_bytes.get(request.resource_type, self.estimated_bytes.get("other", 0))
+        blocking_stats.record(self.site, reason, estimate)
+        await route.abort("blockedbyclient")
+
+
+async def install_resource_blocking(page, site: Optional[str]):
+    """
+    Attach the site's blocking rules to a page, if blocking is enabled.
+    """
+    if not site or not BLOCKING_CONFIG.get("enabled") or site not in BLOCKING_CONFIG["sites"]:
+        return
+    await ResourceBlocker(site).attach(page)
@@ -1,8 +1,10 @@
 import asyncio
 from typing import Dict, Any, List
-from playwright.async_api import async_playwright
 import agentql
 import os
+from .browser_pool import get_browser_pool
+from ..governor.provider_governor import governor, BackpressureError
+from .page_readiness import wait_until_ready, wait_for_lazy_content
 
 class TwitterBrowserAgent:
     """
@@ -10,11 +12,13 @@ class TwitterBrowserAgent:
     and extract recent tweets for sentiment analysis.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, browser_pool=None):
         # Ensure API key is set for AgentQL
         if api_key and not os.getenv("AGENTQL_API_KEY"):
              os.environ["AGENTQL_API_KEY"] = api_key
-        
+
+        self.browser_pool = browser_pool or get_browser_pool()
+
     async def browse_tweets(self, twitter_url: str) -> List[Dict[str, Any]]:
         """
         Browse a Twitter/X profile and return recent tweets.
@@ -23,29 +27,17 @@ class TwitterBrowserAgent:
         raw_tweets = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                
-                # Load auth state if available
-                auth_path = os.path.join(os.path.dirname(__file__), "../../data/cache/auth_state.json")
-                if os.path.exists(auth_path):
-                    print(f"Loading auth state from {auth_path}")
-                    context = await browser.new_context(storage_state=auth_path)
-                else:
-                    print("No auth state found. Proceeding as guest.")
-                    context = await browser.new_context(
-                        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    )
-
-                page = await context.new_page()
+            async with self.browser_pool.lease_page(site="twitter") as page:
                 page = await agentql.wrap_async(page)
                 
                 await page.goto(twitter_url)
-                await page.wait_for_timeout(5000)
+                readiness = await wait_until_ready(page, "twitter")
+                print(f"Twitter page ready: {readiness['outcome']} after {readiness['waited_ms']}ms")
                 
                 # Scroll a bit to trigger lazy loading
+                tweet_count = len(await page.query_selector_all('article[data-testid="tweet"]'))
                 await page.evaluate("window.scrollTo(0, 1000)")
-                await page.wait_for_timeout(2000)
+                await wait_for_lazy_content(page, "twitter", tweet_count)
 
                 # AgentQL Query for Tweets
                 QUERY = """
@@ -64,7 +56,10 @@ class TwitterBrowserAgent:
                 
                 response = None
                 try:
-                    response = await page.query_data(QUERY)
+                    async with governor.limit("agentql"):
+                        response = await page.query_data(QUERY)
+                except BackpressureError:
+                    raise
                 except Exception as query_error:
                     print(f"AgentQL query failed: {query_error}")
 
@@ -87,9 +82,9 @@ class TwitterBrowserAgent:
                 if not raw_tweets:
                     print("AgentQL returned no tweets. Attempting Playwright fallback...")
                     raw_tweets = await self._scrape_tweets_fallback(page)
-                
-                await browser.close()
 
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Error browsing Twitter: {e}")
             pass
@@ -0,0 +1,121 @@
+import asyncio
+import random
+import time
+from typing import Dict, Any, Optional
+import httpx
+from ..config.yutori_config import YUTORI_CONFIG
+from ..governor.provider_governor import governor
+
+_shared_clients: Dict[str, "AsyncYutoriClient"] = {}
+
+COMPLETED_STATUSES = {"completed", "succeeded", "success"}
+FAILED_STATUSES = {"failed", "error", "cancelled"}
+
+
+class YutoriTaskError(Exception):
+    """
+    Raised when a Yutori browsing task ends in a failed state.
+    """
+
+
+class AsyncYutoriClient:
+    """
+    Non-blocking client for Yutori browsing tasks.
+
+    All requests go through one pooled httpx.AsyncClient. Polling backs off
+    exponentially with jitter, and a semaphore caps how many research tasks
+    are in flight at once. Cancelling the awaiting coroutine stops polling
+    immediately.
+    """
+
+    def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None, http_client: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key
+        self.config = {**YUTORI_CONFIG, **(config or {})}
+        self.base_url = self.config["base_url"].rstrip("/")
+        self._http = http_client or httpx.AsyncClient(
+            headers={"x-api-key": api_key, "Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=self.config["max_connections"]),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+        self._task_slots = asyncio.Semaphore(self.config["max_concurrent_tasks"])
+
+    async def create_task(self, task: str, start_url: str) -> Dict[str, Any]:
+        async with governor.limit("yutori"):
+            resp = await self._http.post(f"{self.base_url}/browsing/tasks", json={"task": task, "start_url": start_url})
+        resp.raise_for_status()
+        return resp.json()
+
+    async def get_task(self, task_id: str) -> Dict[str, Any]:
+        async with governor.limit("yutori"):
+            resp = await self._http.get(f"{self.base_url}/browsing/tasks/{task_id}")
+        resp.raise_for_status()
+        return resp.json()
+
+    async def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Poll until the task completes. Raises YutoriTaskError if it fails and
+        asyncio.TimeoutError if it is still running after `timeout` seconds.
+        """
+        timeout = timeout or self.config["poll_timeout"]
+        deadline = time.monotonic() + timeout
+        interval = self.config["poll_initial_interval"]
+        max_interval = self.config["poll_max_interval"]
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Yutori task {task_id} still running after {timeout}s")
+
+                # Jitter keeps many concurrent pollers from hitting the API in lockstep
+                await asyncio.sleep(min(remaining, interval * random.uniform(0.5, 1.0)))
+                interval = min(max_interval, interval * 2)
+
+                try:
+                    task_data = await self.get_task(task_id)
+                except httpx.HTTPError as e:
+                    print(f"Yutori poll for {task_id} failed: {e}")
+                    continue
+
+                status = task_data.get("status")
+                if status in COMPLETED_STATUSES:
+                    return task_data
+                if status in FAILED_STATUSES:
+                    raise YutoriTaskError(task_data.get("error") or f"Task {task_id} {status}")
+        except asyncio.CancelledError:
+            print(f"Yutori task {task_id} abandoned: caller cancelled.")
+            raise
+
+    async def run_task(self, task: str, start_url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Start a browsing task and wait for its result, holding one of the
+        process-wide task slots for the duration.
+        """
+        async with self._task_slots:
+            initial_response = await self.create_task(task, start_url)
+            task_id = initial_response.get("task_id")
+            if not task_id:
+                raise YutoriTaskError("No task_id returned from Yutori.")
+
+            print(f"Yutori Task Started: {task_id}")
+            print(f"Monitor at: {initial_response.get('view_url')}")
+            return await self.wait_for_task(task_id, timeout=timeout)
+
+    async def aclose(self):
+        await self._http.aclose()
+
+
+def get_yutori_client(api_key: str) -> AsyncYutoriClient:
+    """
+    Return the process-wide client for this API key so connections and
+    task slots are shared by every YutoriResearcher.
+    """
+    if api_key not in _shared_clients:
+        _shared_clients[api_key] = AsyncYutoriClient(api_key)
+    return _shared_clients[api_key]
+
+
+async def close_yutori_clients():
+    for client in list(_shared_clients.values()):
+        await client.aclose()
+    _shared_clients.clear()
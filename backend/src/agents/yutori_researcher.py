@@ -1,105 +1,106 @@
 import asyncio
-import os
 import json
-import requests
-import time
-from typing import Dict, Any, List
-from yutori import YutoriClient
+from typing import Dict, Any, List, Optional
+from .yutori_client import get_yutori_client, YutoriTaskError
+from ..storage.company_store import get_company_store
+from ..governor.provider_governor import BackpressureError
+
+# What to ask Yutori for each field that is missing from the company store
+FIELD_PROMPTS = {
+    "recent_news": ("Find 3 recent news items (last 30 days) or key developments.", "'recent_news' (list)"),
+    "industry": ("Identify the company's industry.", "'industry'"),
+    "funding": ("Identify the company's funding stage (if applicable).", "'funding'"),
+    "competitors": ("Identify the company's main competitors.", "'competitors' (list)"),
+}
 
 class YutoriResearcher:
     """
     Agent that uses Yutori to perform deep research on companies and people.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, company_store=None):
         self.api_key = api_key
+        self.company_store = company_store or get_company_store()
         if not self.api_key:
             print("Warning: YUTORI_API_KEY not set for YutoriResearcher.")
             
-        try:
-            self.client = YutoriClient(api_key=self.api_key)
-        except Exception as e:
-            print(f"Failed to initialize YutoriClient: {e}")
-            self.client = None
+        # Shared async client: pooled connections and a process-wide cap on tasks in flight
+        self.client = get_yutori_client(self.api_key) if self.api_key else None
 
     async def research_company(self, company_name: str, person_role: str) -> Dict[str, Any]:
         """
         Research company and generate talking points using Yutori.
         """
+        # Talking points depend on the role, so they are stored per role
+        talking_points_field = f"talking_points:{(person_role or 'unknown').strip().lower()}"
+        fields = list(FIELD_PROMPTS) + [talking_points_field]
+        stored = await self.company_store.get(company_name, fields) if self.company_store else {}
+        missing = [field for field in FIELD_PROMPTS if field not in stored]
+        if not missing and talking_points_field in stored:
+            print(f"Using stored company intel for {company_name}")
+            return self._merge(company_name, stored, {}, talking_points_field)
+
         if not self.client:
             return self._fallback_response(company_name)
 
         print(f"Initiating Yutori research for {company_name}...")
-
-        prompt = (
-            f"Research the company '{company_name}'. "
-            f"Find 3 recent news items (last 30 days) or key developments. "
-            f"Identify the company's industry, funding stage (if applicable), and main competitors. "
-            f"Also, considering the role '{person_role}', suggest 2 strategic talking points "
-            f"for a meeting. "
-            f"Return the result as a JSON object with keys: 'name', 'industry', 'funding', 'recent_news' (list), 'competitors' (list), 'talking_points' (list)."
-        )
+        prompt = self._build_prompt(company_name, person_role, missing)
 
         try:
-            # 1. Start Task
-            payload = {
-                "task": prompt,
-                "start_url": "https://www.google.com" # Start at Google for broad research
-            }
-            
-            initial_response = self.client.agent_run(payload)
-            task_id = initial_response.get("task_id")
-            
-            if not task_id:
-                print("Error: No task_id returned from Yutori.")
-                return self._fallback_response(company_name)
+            # Start at Google for broad research
+            task_data = await self.client.run_task(prompt, "https://www.google.com")
+            print("Yutori research completed.")
+            data = self._parse_json(task_data.get("output", "") or task_data.get("result", ""))
+            if data is None:
+                return self._parse_result(task_data, company_name)
 
-            print(f"Yutori Task Started: {task_id}")
-            print(f"Monitor at: {initial_response.get('view_url')}")
+            researched = {field: data[field] for field in missing if field in data}
+            if "talking_points" in data:
+                researched[talking_points_field] = data["talking_points"]
+            if researched and self.company_store:
+                await self.company_store.put(company_name, researched)
+            return self._merge(data.get("name", company_name), stored, researched, talking_points_field)
 
-            # 2. Poll for Result
-            # We'll poll for up to 90 seconds (Yutori tasks can take time)
-            base_url = self.client.base_url
-            headers = {"x-api-key": self.api_key, "Content-Type": "application/json"}
-            
-            for _ in range(45): # 45 * 2s = 90s
-                # Note: In a production async app, we should use aiohttp or run in executor to avoid blocking
-                # For this script, blocking is acceptable or we can use asyncio.sleep
-                await asyncio.sleep(2)
-                
-                resp = requests.get(f"{base_url}/browsing/tasks/{task_id}", headers=headers)
-                
-                if resp.status_code != 200:
-                    continue
-                    
-                task_data = resp.json()
-                status = task_data.get("status")
-                
-                if status == "completed":
-                    print("Yutori research completed.")
-                    return self._parse_result(task_data, company_name)
-                elif status == "failed":
-                    print(f"Yutori task failed: {task_data.get('error')}")
-                    return self._fallback_response(company_name)
-            
+        except BackpressureError:
+            raise
+        except YutoriTaskError as e:
+            print(f"Yutori task failed: {e}")
+            return self._fallback_response(company_name)
+        except asyncio.TimeoutError:
             print("Yutori task timed out.")
             return self._fallback_response(company_name)
-
         except Exception as e:
             print(f"Error during Yutori research: {e}")
             return self._fallback_response(company_name)
 
-    def _parse_result(self, task_data: Dict[str, Any], company_name: str) -> Dict[str, Any]:
+    def _build_prompt(self, company_name: str, person_role: str, missing: List[str]) -> str:
         """
-        Extract the JSON result from the task output.
+        Ask only for the fields the company store could not supply.
         """
-        # The result might be in 'output', 'result', or 'artifacts'. 
-        # Inspecting the test run would help, but assuming 'result' or 'output' text.
-        # Often agents return a final text answer.
-        
-        output_text = task_data.get("output", "") or task_data.get("result", "")
-        
-        # Try to parse JSON from text
+        asks = " ".join(FIELD_PROMPTS[field][0] for field in missing)
+        keys = ", ".join(["'name'"] + [FIELD_PROMPTS[field][1] for field in missing] + ["'talking_points' (list)"])
+        return (
+            f"Research the company '{company_name}'. "
+            f"{asks} "
+            f"Also, considering the role '{person_role}', suggest 2 strategic talking points "
+            f"for a meeting. "
+            f"Return the result as a JSON object with keys: {keys}."
+        )
+
+    @staticmethod
+    def _merge(company_name: str, stored: Dict[str, Any], researched: Dict[str, Any], talking_points_field: str) -> Dict[str, Any]:
+        fields = {**stored, **researched}
+        return {
+            "name": company_name,
+            "industry": fields.get("industry", "Unknown"),
+            "funding": fields.get("funding", {"stage": "Unknown", "amount": "Unknown"}),
+            "recent_news": fields.get("recent_news", []),
+            "competitors": fields.get("competitors", []),
+            "talking_points": fields.get(talking_points_field, [])
+        }
+
+    @staticmethod
+    def _parse_json(output_text: str) -> Optional[Dict[str, Any]]:
         try:
             # simple json extraction
             if "```json" in output_text:
@@ -110,8 +111,22 @@ class YutoriResearcher:
                 json_str = output_text[start:end]
             else:
                 json_str = output_text
-
             data = json.loads(json_str)
+        except Exception:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _parse_result(self, task_data: Dict[str, Any], company_name: str) -> Dict[str, Any]:
+        """
+        Extract the JSON result from the task output.
+        """
+        # The result might be in 'output', 'result', or 'artifacts'. 
+        # Inspecting the test run would help, but assuming 'result' or 'output' text.
+        # Often agents return a final text answer.
+        
+        output_text = task_data.get("output", "") or task_data.get("result", "")
+        data = self._parse_json(output_text)
+        if data is not None:
             # Ensure keys exist
             return {
                 "name": data.get("name", company_name),
@@ -122,15 +137,15 @@ class YutoriResearcher:
                 # Extra fields
                 "talking_points": data.get("talking_points", [])
             }
-        except Exception:
-            print("Failed to parse JSON from Yutori output. Returning raw text as news.")
-            return {
-                "name": company_name,
-                "industry": "Unknown",
-                "funding": {"stage": "Unknown", "amount": "Unknown"},
-                "recent_news": [output_text[:500]] if output_text else ["No data returned."],
-                "competitors": []
-            }
+
+        print("Failed to parse JSON from Yutori output. Returning raw text as news.")
+        return {
+            "name": company_name,
+            "industry": "Unknown",
+            "funding": {"stage": "Unknown", "amount": "Unknown"},
+            "recent_news": [output_text[:500]] if output_text else ["No data returned."],
+            "competitors": []
+        }
 
     def _fallback_response(self, company_name: str) -> Dict[str, Any]:
         return {
@@ -0,0 +1,210 @@
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+try:
+    from pydub import AudioSegment
+    from pydub.silence import detect_silence
+except ImportError:
+    AudioSegment = None
+    detect_silence = None
+
+
+class AudioChunk:
+    """
+    One piece of a recording. The chunk owns [start, end) of the timeline;
+    the exported audio covers [audio_start, audio_end), which adds the
+    configured overlap on either side. Times are in seconds.
+    """
+
+    def __init__(self, index: int, start: float, end: float, audio_start: float, audio_end: float):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.audio_start = audio_start
+        self.audio_end = audio_end
+
+
+def chunking_available() -> bool:
+    return AudioSegment is not None
+
+
+class AudioSource:
+    """
+    A recording on disk or in a seekable file object (e.g. a spooled
+    upload), read one window at a time so a long call is never decoded
+    whole. PCM WAV is read natively through its header; other formats
+    need ffprobe/ffmpeg, which are always given a seekable input so each
+    window is decoded from its own offset: the path itself, a file
+    object's descriptor as /dev/fd/N, or (for in-memory objects) a
+    temporary copy made once. Reads from a file object are serialized, so
+    chunks can be exported from several threads at once. Call `close`
+    when done to remove any temporary copy.
+    """
+
+    def __init__(self, source: Union[str, BinaryIO], audio_format: Optional[str] = None):
+        self.source = source
+        if isinstance(source, str) and not audio_format:
+            audio_format = source.rsplit(".", 1)[-1]
+        self.format = (audio_format or "wav").lower()
+        self._lock = threading.Lock()
+        self._copy: Optional[str] = None
+
+    def close(self):
+        if self._copy is not None:
+            os.remove(self._copy)
+            self._copy = None
+
+    def duration(self) -> float:
+        """
+        Length in seconds, from the file's metadata; nothing is decoded.
+        """
+        if self.format == "wav":
+            try:
+                with self._wav() as wav:
+                    return wav.getnframes() / wav.getframerate()
+            except (wave.Error, EOFError):
+                pass  # Not plain PCM (e.g. float or extensible); ask ffprobe
+        output = self._ff(
+            ["ffprobe", "-v", "error"],
+            ["-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1"]
+        )
+        return float(output.decode().strip())
+
+    def window(self, start: float, end: float):
+        """
+        The audio between start and end (seconds) as an AudioSegment.
+        """
+        if self.format == "wav":
+            try:
+                with self._wav() as wav:
+                    rate = wav.getframerate()
+                    wav.setpos(min(wav.getnframes(), int(start * rate)))
+                    frames = wav.readframes(int((end - start) * rate))
+                    return AudioSegment(
+                        data=frames, sample_width=wav.getsampwidth(), frame_rate=rate, channels=wav.getnchannels()
+                    )
+            except (wave.Error, EOFError):
+                pass
+        output = self._ff(
+            ["ffmpeg", "-v", "error", "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}"],
+            ["-f", "wav", "pipe:1"]
+        )
+        return AudioSegment.from_file(io.BytesIO(output), format="wav")
+
+    @contextmanager
+    def _wav(self):
+        if isinstance(self.source, str):
+            with wave.open(self.source, "rb") as wav:
+                yield wav
+            return
+        with self._lock:
+            self.source.seek(0)
+            wav = wave.open(self.source, "rb")
+            try:
+                yield wav
+            finally:
+                wav.close()
+
+    def _ff(self, before_input: List[str], after_input: List[str]) -> bytes:
+        path, pass_fds = self._seekable_input()
+        command = [*before_input, "-i", path, *after_input]
+        return subprocess.run(command, capture_output=True, check=True, pass_fds=pass_fds).stdout
+
+    def _seekable_input(self) -> Tuple[str, Tuple[int, ...]]:
+        """
+        A path ffmpeg can seek in (a pipe cannot, so -ss would decode from
+        the start every time), plus the descriptors the child must inherit.
+        """
+        if isinstance(self.source, str):
+            return self.source, ()
+        with self._lock:
+            if self._copy is not None:
+                return self._copy, ()
+            try:
+                fd = self.source.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                fd = None
+            if fd is not None and os.path.exists(f"/dev/fd/{fd}"):
+                self.source.flush()
+                return f"/dev/fd/{fd}", (fd,)
+            # In-memory object: copy it to disk once
+            self.source.seek(0)
+            with tempfile.NamedTemporaryFile(suffix=f".{self.format}", delete=False) as copy:
+                shutil.copyfileobj(self.source, copy)
+            self._copy = copy.name
+            return self._copy, ()
+
+
+def next_cut(position: float, duration: float, silences: List[Tuple[float, float]], config: Dict[str, Any]) -> float:
+    """
+    Where to end the chunk that starts at `position` (seconds), keeping it
+    between min_chunk and max_chunk long. The cut is placed in the silence
+    closest to target_chunk; with no silence in range it is cut hard at
+    max_chunk.
+    """
+    lowest = position + config["min_chunk"]
+    highest = position + config["max_chunk"]
+    target = position + config["target_chunk"]
+    midpoints = [(start + end) / 2 for start, end in silences]
+    candidates = [m for m in midpoints if lowest <= m <= highest and duration - m >= config["min_chunk"]]
+    return min(candidates, key=lambda m: abs(m - target)) if candidates else highest
+
+
+def find_silences(audio: AudioSource, start: float, end: float, config: Dict[str, Any]) -> List[Tuple[float, float]]:
+    """
+    Silences (seconds on the recording's timeline) between start and end,
+    relative to that window's own loudness. Only the window is decoded.
+    """
+    segment = audio.window(start, end)
+    if segment.rms == 0:
+        return [(start, start + len(segment) / 1000)]
+    silences = detect_silence(
+        segment,
+        min_silence_len=config["min_silence_ms"],
+        silence_thresh=segment.dBFS + config["silence_thresh_db"]
+    )
+    return [(start + a / 1000, start + b / 1000) for a, b in silences]
+
+
+def split_on_silence(audio: AudioSource, duration: float, config: Dict[str, Any]) -> List[AudioChunk]:
+    """
+    Plan the chunks of a recording. Only the span each cut can fall in
+    (min_chunk to max_chunk past the previous cut) is decoded.
+    """
+    cuts = []
+    position = 0.0
+    while duration - position > config["max_chunk"]:
+        silences = find_silences(audio, position + config["min_chunk"], position + config["max_chunk"], config)
+        position = next_cut(position, duration, silences, config)
+        cuts.append(position)
+
+    bounds = [0.0, *cuts, duration]
+    overlap = config["overlap"]
+    return [
+        AudioChunk(
+            index=i,
+            start=start,
+            end=end,
+            audio_start=max(0.0, start - overlap),
+            audio_end=min(duration, end + overlap)
+        )
+        for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+    ]
+
+
+def export_chunk(audio: AudioSource, chunk: AudioChunk, config: Dict[str, Any]) -> bytes:
+    """
+    The chunk's audio as mono 16-bit WAV at the configured sample rate.
+    """
+    segment = audio.window(chunk.audio_start, chunk.audio_end)
+    segment = segment.set_channels(1).set_frame_rate(config["sample_rate"]).set_sample_width(2)
+    buffer = io.BytesIO()
+    segment.export(buffer, format="wav")
+    return buffer.getvalue()
@@ -0,0 +1,140 @@
+import base64
+import binascii
+import codecs
+import json
+import re
+import tempfile
+from typing import Any, AsyncIterator, BinaryIO, Dict, Optional
+from ..config.elevenlabs_config import INGEST_CONFIG
+
+
+class UploadTooLargeError(Exception):
+    """
+    Raised when a decoded upload exceeds INGEST_CONFIG["max_upload_bytes"].
+    """
+
+
+def new_spool(config: Optional[Dict[str, Any]] = None) -> BinaryIO:
+    """
+    A file that stays in memory up to spool_memory_bytes and rolls over to
+    disk beyond that.
+    """
+    config = {**INGEST_CONFIG, **(config or {})}
+    return tempfile.SpooledTemporaryFile(max_size=config["spool_memory_bytes"])
+
+
+class IncrementalBase64Decoder:
+    """
+    Decodes base64 text fed in arbitrary pieces straight into `sink`, so
+    neither the whole text nor the whole payload has to be held at once.
+    Whitespace (e.g. MIME line breaks) is ignored.
+    """
+
+    def __init__(self, sink: BinaryIO, max_bytes: Optional[int] = None):
+        self.sink = sink
+        self.max_bytes = max_bytes
+        self.written = 0
+        self._pending = ""
+
+    def feed(self, text: str):
+        data = self._pending + "".join(text.split())
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        if usable:
+            self._write(data[:usable])
+
+    def finish(self) -> int:
+        """
+        Flush the final block and return the number of decoded bytes.
+        """
+        if self._pending:
+            if len(self._pending) == 1:
+                raise ValueError("truncated base64 data")
+            self._write(self._pending + "=" * (-len(self._pending) % 4))
+            self._pending = ""
+        return self.written
+
+    def _write(self, data: str):
+        try:
+            decoded = base64.b64decode(data, validate=True)
+        except binascii.Error as e:
+            raise ValueError(str(e)) from e
+        self.written += len(decoded)
+        if self.max_bytes is not None and self.written > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+        self.sink.write(decoded)
+
+
+def spool_base64_text(text: str, sink: BinaryIO, config: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Decode a base64 string into `sink` a slice at a time.
+    """
+    config = {**INGEST_CONFIG, **(config or {})}
+    decoder = IncrementalBase64Decoder(sink, config["max_upload_bytes"])
+    step = config["read_chunk_bytes"] - config["read_chunk_bytes"] % 4
+    for offset in range(0, len(text), step):
+        decoder.feed(text[offset:offset + step])
+    return decoder.finish()
+
+
+async def spool_json_base64(
+    body: AsyncIterator[bytes],
+    field: str,
+    sink: BinaryIO,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Read a JSON object request body as it arrives, decoding the base64
+    string under `field` into `sink`. Returns the object's other fields.
+    Raises ValueError for a malformed body and UploadTooLargeError past
+    max_upload_bytes.
+    """
+    config = {**INGEST_CONFIG, **(config or {})}
+    decoder = IncrementalBase64Decoder(sink, config["max_upload_bytes"])
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    value_start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+
+    head, tail = "", ""
+    in_value = done = False
+    escape = ""
+    async for chunk in body:
+        text = text_decoder.decode(chunk)
+        if not in_value and not done:
+            head += text
+            match = value_start.search(head)
+            if not match:
+                if len(head) > config["max_json_head_bytes"]:
+                    raise ValueError(f'"{field}" not found in the request body')
+                continue
+            text = head[match.end():]
+            head = head[:match.end() - 1]
+            in_value = True
+
+        if in_value:
+            text = escape + text
+            end = text.find('"')
+            value = text if end < 0 else text[:end]
+            # Base64 holds no quotes; JSON may still escape "/" or wrap lines
+            escape = "\\" if value.endswith("\\") and end < 0 else ""
+            if escape:
+                value = value[:-1]
+            decoder.feed(value.replace("\\/", "/").replace("\\n", "").replace("\\r", ""))
+            if end < 0:
+                continue
+            in_value, done = False, True
+            text = text[end + 1:]
+
+        tail += text
+
+    if not done:
+        raise ValueError(f'"{field}" not found in the request body' if not in_value else "unterminated request body")
+    decoder.finish()
+
+    try:
+        fields = json.loads(head + '""' + tail + text_decoder.decode(b"", final=True))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON body: {e}") from e
+    if not isinstance(fields, dict):
+        raise ValueError("Request body must be a JSON object")
+    fields.pop(field, None)
+    return fields
@@ -0,0 +1,163 @@
+import asyncio
+import io
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from ..config.elevenlabs_config import ELEVENLABS_CONFIG, TRANSCRIPTION_CONFIG
+from ..governor.provider_governor import BackpressureError, governor
+from .chunker import AudioChunk, AudioSource, chunking_available, export_chunk, split_on_silence
+
+
+class ChunkTranscriptionError(Exception):
+    """
+    Raised when some chunks still fail after every retry. `failed` holds
+    their indices.
+    """
+
+    def __init__(self, failed: List[int], errors: Dict[int, BaseException]):
+        self.failed = failed
+        self.errors = errors
+        super().__init__(f"{len(failed)} audio chunk(s) failed to transcribe: {failed} ({errors[failed[0]]})")
+
+
+class ChunkedTranscriber:
+    """
+    Transcribes recordings with an ElevenLabs-compatible `convert` callable
+    (e.g. `client.speech_to_text.convert`).
+
+    Recordings longer than min_duration are split on silence into
+    overlapping chunks that are transcribed concurrently, under both
+    max_concurrency and the provider governor. Chunks that fail are retried
+    with backoff while the finished ones are kept. Chunk transcripts are
+    stitched back onto the recording's timeline, and each word in an
+    overlap is kept once, by the chunk that owns its start time.
+    """
+
+    def __init__(self, convert: Callable[..., Any], config: Optional[Dict[str, Any]] = None):
+        self.convert = convert
+        self.config = {**TRANSCRIPTION_CONFIG, **(config or {})}
+
+    async def transcribe(self, source: Union[str, BinaryIO], audio_format: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Transcribe a recording given as a path or a seekable file object
+        (e.g. a spooled upload). Returns {"text", "segments", "words",
+        "chunks", "retried_chunks"}. Segment and word times are in seconds
+        from the start of the recording.
+        """
+        audio = AudioSource(source, audio_format)
+        try:
+            return await self._transcribe(audio, source, audio_format)
+        finally:
+            audio.close()
+
+    async def _transcribe(self, audio: AudioSource, source: Union[str, BinaryIO], audio_format: Optional[str]) -> Dict[str, Any]:
+        duration = None
+        if self.config["chunking_enabled"] and chunking_available():
+            try:
+                # Metadata only; chunks are decoded one window at a time
+                duration = await asyncio.to_thread(audio.duration)
+            except Exception as e:
+                print(f"Could not read the recording's duration for chunking ({e}); transcribing it whole.")
+
+        if duration is None or duration < self.config["min_duration"]:
+            return await self._transcribe_whole(source, audio_format, duration)
+
+        try:
+            chunks = await asyncio.to_thread(split_on_silence, audio, duration, self.config)
+        except Exception as e:
+            print(f"Could not decode the recording for chunking ({e}); transcribing it whole.")
+            return await self._transcribe_whole(source, audio_format, duration)
+        print(f"Transcribing {duration:.0f}s recording in {len(chunks)} chunks.")
+        slots = asyncio.Semaphore(max(1, self.config["max_concurrency"]))
+
+        async def transcribe_chunk(chunk: AudioChunk):
+            async with slots:
+                data = await asyncio.to_thread(export_chunk, audio, chunk, self.config)
+                return await self._convert((f"chunk-{chunk.index}.wav", io.BytesIO(data), "audio/wav"))
+
+        retried = set()
+        results = await self._with_retries(chunks, transcribe_chunk, retried)
+        return self._stitch(chunks, results, retried)
+
+    async def _transcribe_whole(self, source: Union[str, BinaryIO], audio_format: Optional[str], duration: Optional[float]) -> Dict[str, Any]:
+        end = duration or float("inf")
+        whole = AudioChunk(0, 0.0, end, 0.0, end)
+
+        async def transcribe_whole(chunk: AudioChunk):
+            if not isinstance(source, str):
+                source.seek(0)
+                return await self._convert((f"recording.{audio_format or 'wav'}", source))
+            with open(source, "rb") as audio_file:
+                return await self._convert(audio_file)
+
+        retried = set()
+        results = await self._with_retries([whole], transcribe_whole, retried)
+        return self._stitch([whole], results, retried)
+
+    async def _with_retries(self, chunks: List[AudioChunk], transcribe, retried: set) -> Dict[int, Any]:
+        results: Dict[int, Any] = {}
+        pending = chunks
+        errors: Dict[int, BaseException] = {}
+        for attempt in range(1, self.config["max_attempts"] + 1):
+            outcomes = await asyncio.gather(*(transcribe(chunk) for chunk in pending), return_exceptions=True)
+            errors = {}
+            for chunk, outcome in zip(pending, outcomes):
+                if isinstance(outcome, BackpressureError):
+                    raise outcome
+                if isinstance(outcome, Exception):
+                    errors[chunk.index] = outcome
+                else:
+                    results[chunk.index] = outcome
+
+            pending = [chunk for chunk in pending if chunk.index in errors]
+            if not pending:
+                return results
+            retried.update(errors)
+            if attempt < self.config["max_attempts"]:
+                print(f"Retrying {len(pending)} failed chunk(s) {sorted(errors)} (attempt {attempt + 1}).")
+                await asyncio.sleep(self.config["retry_backoff"] * 2 ** (attempt - 1))
+
+        raise ChunkTranscriptionError(sorted(errors), errors)
+
+    async def _convert(self, file: Any) -> Any:
+        async with governor.limit("elevenlabs"):
+            return await asyncio.to_thread(
+                self.convert,
+                file=file,
+                model_id=ELEVENLABS_CONFIG["model_id"],
+                language_code=ELEVENLABS_CONFIG["language_code"]
+            )
+
+    @staticmethod
+    def _stitch(chunks: List[AudioChunk], results: Dict[int, Any], retried: set) -> Dict[str, Any]:
+        words: List[Dict[str, Any]] = []
+        segments: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            result = results[chunk.index]
+            chunk_words = [w for w in getattr(result, "words", None) or [] if getattr(w, "type", "word") == "word"]
+            owned = []
+            for word in chunk_words:
+                start = chunk.audio_start + (word.start or 0.0)
+                end = chunk.audio_start + (word.end or word.start or 0.0)
+                if chunk.start <= start < chunk.end or (chunk is chunks[-1] and start >= chunk.end):
+                    owned.append({"text": word.text, "start": round(start, 3), "end": round(end, 3)})
+            words.extend(owned)
+
+            if owned and len(chunks) > 1:
+                text = " ".join(word["text"] for word in owned)
+            else:
+                # A single chunk, or no word timings: the provider's text as is
+                text = (getattr(result, "text", "") or "").strip()
+
+            segments.append({
+                "index": chunk.index,
+                "start": round(chunk.start, 3),
+                "end": round(chunk.end, 3) if chunk.end != float("inf") else None,
+                "text": text
+            })
+
+        return {
+            "text": " ".join(segment["text"] for segment in segments if segment["text"]),
+            "segments": segments,
+            "words": words,
+            "chunks": len(chunks),
+            "retried_chunks": sorted(retried)
+        }
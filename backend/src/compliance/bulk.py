@@ -0,0 +1,454 @@
+import asyncio
+import fcntl
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from ..config.compliance_config import COMPLIANCE_CONFIG
+from ..governor.provider_governor import governor
+from ..pipeline.batch_runner import run_batch
+from .engine import ComplianceEngine
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+TRANSCRIPT_EXTENSIONS = (".txt",)
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm", ".mp4")
+REALTIME = "realtime"
+BATCH = "batch"
+RESULT_COLUMNS = (
+    "id", "source", "status", "total_violations", "risk_level", "violations", "compliant_areas", "summary",
+    "transcript", "transcribe_ms", "analysis_ms", "latency_ms", "error"
+)
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def discover_inputs(source: str, root: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Calls to analyze, from a directory of transcripts (.txt) and recordings,
+    or from a JSONL file whose lines hold "transcript" or "audio_path"
+    (relative to the file) and optionally "id". Each call gets a stable id:
+    its path relative to the directory, or its "id" / line number.
+
+    Paths are resolved (symlinks included); with `root`, any that resolves
+    outside it raises ValueError.
+    """
+    root = os.path.realpath(root) if root is not None else None
+
+    def confined(path: str, where: str) -> str:
+        resolved = os.path.realpath(path)
+        if root is not None and os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"{where}: {path} is outside {root}")
+        return resolved
+
+    items: List[Dict[str, Any]] = []
+    if os.path.isdir(source):
+        for directory, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                extension = os.path.splitext(name)[1].lower()
+                call_id = os.path.relpath(path, source)
+                if extension in TRANSCRIPT_EXTENSIONS:
+                    items.append({"id": call_id, "transcript_path": confined(path, call_id)})
+                elif extension in AUDIO_EXTENSIONS:
+                    items.append({"id": call_id, "audio_path": confined(path, call_id)})
+        return items
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{source}:{line_number}: invalid JSON ({e})") from e
+            call_id = str(entry.get("id") or line_number)
+            if isinstance(entry.get("transcript"), str):
+                items.append({"id": call_id, "transcript": entry["transcript"]})
+            elif isinstance(entry.get("audio_path"), str):
+                path = confined(os.path.join(base, entry["audio_path"]), f"{source}:{line_number}")
+                items.append({"id": call_id, "audio_path": path})
+            else:
+                raise ValueError(f'{source}:{line_number}: needs "transcript" or "audio_path"')
+    return items
+
+
+def read_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Records in a results file, keyed by call id. A call that was retried
+    on resume appears more than once; its latest record wins.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash; the call simply runs again
+                continue
+            results[record["id"]] = record
+    return results
+
+
+def write_parquet(results_path: str, parquet_path: str) -> int:
+    """
+    Convert a results file to Parquet, one row per call. Violations and
+    compliant areas are stored as JSON strings. Needs pyarrow.
+    """
+    if pyarrow is None:
+        raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+    rows = []
+    for record in read_results(results_path).values():
+        row = {column: record.get(column) for column in RESULT_COLUMNS}
+        row["violations"] = json.dumps(row["violations"])
+        row["compliant_areas"] = json.dumps(row["compliant_areas"])
+        rows.append(row)
+    table = pyarrow.Table.from_pylist(rows)
+    pyarrow.parquet.write_table(table, parquet_path)
+    return len(rows)
+
+
+class OutputLockedError(RuntimeError):
+    """
+    Raised when another run (API or CLI) is already writing the results file.
+    """
+
+
+class OutputLock:
+    """
+    Exclusive, non-blocking lock on a results file, held for a whole run
+    so two runs never append to the same file or rewrite its batch
+    checkpoint at once. Uses flock on "<output>.lock", so it holds across
+    processes; the lock file itself is left in place.
+    """
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self._file = None
+
+    def acquire(self) -> "OutputLock":
+        lock_file = open(self.output_path + ".lock", "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise OutputLockedError(f"{self.output_path} is already being written by another run") from None
+        self._file = lock_file
+        return self
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class BulkComplianceRunner:
+    """
+    Analyzes many calls and appends one JSON record per call to a results
+    file as it finishes. The results file doubles as the checkpoint: with
+    `resume`, calls already completed in it are skipped, so an interrupted
+    run picks up where it stopped.
+
+    In "realtime" mode each call is transcribed (if needed) and analyzed
+    through the regular LLM client, `concurrency` calls at a time. In
+    "batch" mode every call is transcribed and pre-screened first, and the
+    remaining LLM requests go to the Message Batches API, which is cheaper
+    but may take hours. Each batch is checkpointed next to the results as
+    soon as it is submitted, so a resumed run collects the same batches
+    instead of resubmitting, and submits only the calls not yet in one.
+    """
+
+    def __init__(self, engine: ComplianceEngine, transcriber=None, config: Optional[Dict[str, Any]] = None):
+        self.engine = engine
+        self.transcriber = transcriber
+        self.config = {**COMPLIANCE_CONFIG, **(config or {})}
+
+    async def run(
+        self,
+        items: List[Dict[str, Any]],
+        output_path: str,
+        mode: str = REALTIME,
+        resume: bool = True,
+        concurrency: Optional[int] = None,
+        parquet_path: Optional[str] = None,
+        lock: Optional[OutputLock] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield an "item" event per finished call (its record, minus the
+        transcript), "progress" events while a batch is processing, and a
+        final "complete" summary.
+
+        The run holds an OutputLock on `output_path` throughout, raising
+        OutputLockedError if another run has it. Pass `lock` (already
+        acquired) to take it before iterating; the run releases it.
+        """
+        if mode not in (REALTIME, BATCH):
+            if lock is not None:
+                lock.release()
+            raise ValueError(f"Unknown mode: {mode}")
+        lock = lock or OutputLock(output_path).acquire()
+        run = self._run(items, output_path, mode, resume, concurrency, parquet_path)
+        try:
+            async for event in run:
+                yield event
+        finally:
+            # Closing the run cancels its unfinished calls before unlocking
+            await run.aclose()
+            lock.release()
+
+    async def _run(
+        self,
+        items: List[Dict[str, Any]],
+        output_path: str,
+        mode: str,
+        resume: bool,
+        concurrency: Optional[int],
+        parquet_path: Optional[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        started = time.perf_counter()
+        concurrency = min(concurrency or self.config["bulk_concurrency"], self.config["bulk_concurrency"])
+        done = {call_id for call_id, record in read_results(output_path).items() if record["status"] == "completed"} if resume else set()
+        pending = [item for item in items if item["id"] not in done]
+        if not resume:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            self._clear_batch_state(output_path)
+        counts = {"completed": 0, "failed": 0}
+
+        with open(output_path, "a", encoding="utf-8") as output:
+            def write(record: Dict[str, Any]) -> Dict[str, Any]:
+                output.write(json.dumps(record, default=str) + "\n")
+                output.flush()
+                counts[record["status"]] += 1
+                return {"event": "item", "data": {k: v for k, v in record.items() if k != "transcript"}}
+
+            if mode == BATCH:
+                events = self._run_batched(pending, output_path, concurrency, done)
+            else:
+                events = self._run_realtime(pending, concurrency)
+            try:
+                async for event in events:
+                    yield write(event["data"]) if event["event"] == "record" else event
+            finally:
+                await events.aclose()
+
+        summary = {
+            "mode": mode,
+            "total": len(items),
+            "skipped": len(items) - len(pending),
+            **counts,
+            "output": output_path,
+            "elapsed_ms": elapsed_ms(started)
+        }
+        if parquet_path:
+            summary["parquet"] = parquet_path
+            summary["parquet_rows"] = await asyncio.to_thread(write_parquet, output_path, parquet_path)
+        yield {"event": "complete", "data": summary}
+
+    async def _run_realtime(self, items: List[Dict[str, Any]], concurrency: int) -> AsyncIterator[Dict[str, Any]]:
+        async def analyze(item: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            transcript, transcribe_ms = await self._load_transcript(item)
+            analysis_started = time.perf_counter()
+            report = await self.engine.analyze(transcript)
+            return self._record(item, transcript, report, transcribe_ms, elapsed_ms(analysis_started), elapsed_ms(started))
+
+        results = run_batch(items, analyze, concurrency)
+        try:
+            async for index, record, error in results:
+                yield {"event": "record", "data": record if error is None else self._failure(items[index], error)}
+        finally:
+            await results.aclose()
+
+    async def _run_batched(
+        self,
+        items: List[Dict[str, Any]],
+        output_path: str,
+        concurrency: int,
+        done: Set[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        state = self._load_batch_state(output_path) or {"batches": [], "calls": {}}
+        # Calls checkpointed by an earlier run are collected from their
+        # batches; anything else still pending is prepared and submitted now
+        fresh = [item for item in items if item["id"] not in state["calls"]]
+        next_id = sum(len(call["custom_ids"]) for call in state["calls"].values())
+        groups: List[List[Dict[str, Any]]] = [[]]
+        group_size = 0
+        step = self.config["batch_max_requests"]
+
+        async def prepare(item: Dict[str, Any]) -> Dict[str, Any]:
+            transcript, transcribe_ms = await self._load_transcript(item)
+            return {"transcript": transcript, "transcribe_ms": transcribe_ms, **self.engine.prepare(transcript)}
+
+        results = run_batch(fresh, prepare, concurrency)
+        try:
+            async for index, prepared, error in results:
+                item = fresh[index]
+                if error is not None:
+                    yield {"event": "record", "data": self._failure(item, error)}
+                elif not prepared["requests"]:
+                    report = self.engine.finish(prepared, [])
+                    yield {"event": "record", "data": self._record(
+                        item, prepared["transcript"], report, prepared["transcribe_ms"], 0.0, prepared["transcribe_ms"] or 0.0
+                    )}
+                else:
+                    requests = []
+                    for request in prepared["requests"]:
+                        params = {k: v for k, v in request.items() if k != "call_site"}
+                        requests.append({"custom_id": f"r{next_id}", "params": params})
+                        next_id += 1
+                    # A call's requests always share a batch
+                    if group_size and group_size + len(requests) > step:
+                        groups.append([])
+                        group_size = 0
+                    groups[-1].append({
+                        "item": item,
+                        "settled": prepared["settled"],
+                        "custom_ids": [request["custom_id"] for request in requests],
+                        "requests": requests,
+                        "transcript": prepared["transcript"],
+                        "transcribe_ms": prepared["transcribe_ms"]
+                    })
+                    group_size += len(requests)
+        finally:
+            await results.aclose()
+
+        for group in groups:
+            if not group:
+                continue
+            requests = [request for call in group for request in call.pop("requests")]
+            async with governor.limit("anthropic"):
+                batch = await self.engine.llm_client.messages.batches.create(requests=requests)
+            # Checkpoint each batch as soon as it exists, so a crash between
+            # submissions never orphans one or resubmits its calls
+            submitted_at = time.time()
+            for call in group:
+                state["calls"][call["item"]["id"]] = {**call, "submitted_at": submitted_at}
+            state["batches"].append(batch.id)
+            self._save_batch_state(output_path, state)
+            print(f"Submitted compliance batch {batch.id} ({len(requests)} requests).")
+
+        texts: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        for batch_id in state["batches"]:
+            while True:
+                batch = await self.engine.llm_client.messages.batches.retrieve(batch_id)
+                if batch.processing_status == "ended":
+                    break
+                yield {"event": "progress", "data": {
+                    "batch_id": batch_id,
+                    "status": batch.processing_status,
+                    "request_counts": batch.request_counts.model_dump() if batch.request_counts else None
+                }}
+                await asyncio.sleep(self.config["batch_poll_interval"])
+
+            async for entry in await self.engine.llm_client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    texts[entry.custom_id] = "".join(
+                        block.text for block in entry.result.message.content if getattr(block, "type", None) == "text"
+                    )
+                else:
+                    errors[entry.custom_id] = entry.result.type
+
+        collected_at = time.time()
+        for call in state["calls"].values():
+            if call["item"]["id"] in done:
+                # Written before a crash cut the collection short
+                continue
+            failed = [errors.get(custom_id, "missing") for custom_id in call["custom_ids"] if custom_id not in texts]
+            try:
+                if failed:
+                    raise RuntimeError(f"Batch requests did not succeed: {', '.join(sorted(set(failed)))}")
+                report = self.engine.finish(call, [texts[custom_id] for custom_id in call["custom_ids"]])
+            except Exception as e:
+                yield {"event": "record", "data": self._failure(call["item"], e)}
+                continue
+            analysis_ms = round((collected_at - call["submitted_at"]) * 1000, 1)
+            latency = analysis_ms + (call["transcribe_ms"] or 0.0)
+            yield {"event": "record", "data": self._record(
+                call["item"], call["transcript"], report, call["transcribe_ms"], analysis_ms, latency
+            )}
+        self._clear_batch_state(output_path)
+
+    async def _load_transcript(self, item: Dict[str, Any]):
+        """
+        The call's transcript and, for recordings, the transcription time.
+        """
+        if "transcript" in item:
+            return item["transcript"], None
+        if "transcript_path" in item:
+            with open(item["transcript_path"], encoding="utf-8") as f:
+                return f.read(), None
+        if self.transcriber is None:
+            raise RuntimeError("Audio input needs a transcriber (is ElevenLabs configured?)")
+        started = time.perf_counter()
+        audio_format = os.path.splitext(item["audio_path"])[1].lstrip(".").lower() or None
+        transcription = await self.transcriber.transcribe(item["audio_path"], audio_format)
+        return transcription["text"], elapsed_ms(started)
+
+    @staticmethod
+    def _record(
+        item: Dict[str, Any],
+        transcript: str,
+        report: Dict[str, Any],
+        transcribe_ms: Optional[float],
+        analysis_ms: float,
+        latency_ms: float
+    ) -> Dict[str, Any]:
+        return {
+            "id": item["id"],
+            "source": item.get("audio_path") or item.get("transcript_path"),
+            "status": "completed",
+            **report,
+            "transcript": transcript if "audio_path" in item else None,
+            "transcribe_ms": transcribe_ms,
+            "analysis_ms": analysis_ms,
+            "latency_ms": latency_ms,
+            "error": None
+        }
+
+    @staticmethod
+    def _failure(item: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        return {
+            "id": item["id"],
+            "source": item.get("audio_path") or item.get("transcript_path"),
+            "status": "failed",
+            "error": f"{type(error).__name__}: {error}"
+        }
+
+    @staticmethod
+    def _batch_state_path(output_path: str) -> str:
+        return output_path + ".batch.json"
+
+    def _load_batch_state(self, output_path: str) -> Optional[Dict[str, Any]]:
+        path = self._batch_state_path(output_path)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_batch_state(self, output_path: str, state: Dict[str, Any]):
+        path = self._batch_state_path(output_path)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(path + ".tmp", path)
+
+    def _clear_batch_state(self, output_path: str):
+        path = self._batch_state_path(output_path)
+        if os.path.exists(path):
+            os.remove(path)
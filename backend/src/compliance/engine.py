@@ -0,0 +1,345 @@
+import asyncio
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from ..config.compliance_config import COMPLIANCE_CONFIG
+from ..llm.json_stream import JSONArrayStreamParser, strip_code_fence
+from .prescreen import RULES, RulePrescreen
+from .windowing import build_windows, split_turns
+
+COMPLIANCE_PROMPT = """You are a compliance analyst reviewing call center transcripts for regulatory violations.
+
+Analyze the following transcript and identify any compliance violations.
+
+Check for these specific rules:
+{rules}
+
+For each violation found, provide:
+- rule_code: The rule that was violated
+- severity: "HIGH", "MEDIUM", or "LOW"
+- quote: The exact quote from the transcript showing the violation
+- explanation: Why this is a violation
+- suggestion: How the agent should have handled it
+
+Respond ONLY with valid JSON in this format:
+{{
+    "total_violations": <number>,
+    "risk_level": "HIGH" | "MEDIUM" | "LOW" | "NONE",
+    "violations": [
+        {{
+            "rule_code": "RULE_CODE",
+            "severity": "HIGH",
+            "quote": "exact quote from transcript",
+            "explanation": "why this violates the rule",
+            "suggestion": "what the agent should have said instead"
+        }}
+    ],
+    "compliant_areas": ["list of rules that were followed correctly"],
+    "summary": "One sentence summary of the call's compliance status"
+}}
+
+{excerpt_note}TRANSCRIPT:
+{transcript}
+"""
+
+EXCERPT_NOTE = """This transcript is excerpt {index} of {count} from a longer call (turns {first}-{last} of {total}).
+Only report violations shown in this excerpt. {start_note}
+
+"""
+FIRST_EXCERPT = "It includes the start of the call."
+LATER_EXCERPT = "It does not include the start of the call."
+# Only when RECORDING_DISCLOSURE is still being checked
+LATER_EXCERPT_DISCLOSURE = "It does not include the start of the call, so do not report RECORDING_DISCLOSURE or list it as compliant."
+TRIMMED_NOTE = """Turns that do not bear on the rules above have been left out of this transcript and are marked [...].
+
+"""
+
+SEVERITY_RANK = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
+RISK_BY_RANK = {0: "NONE", 1: "LOW", 2: "MEDIUM", 3: "HIGH"}
+VIOLATION_FIELDS = ("rule_code", "severity", "quote", "explanation", "suggestion")
+
+
+def rules_text(codes: List[str]) -> str:
+    descriptions = {rule["code"]: rule["description"] for rule in RULES}
+    return "\n".join(f"{i}. {code} - {descriptions[code]}" for i, code in enumerate(codes, 1))
+
+
+def normalize_quote(quote: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", quote.lower()).split())
+
+
+class ComplianceEngine:
+    """
+    Map-reduce compliance analysis.
+
+    Transcripts that fit in one window are analyzed in a single call, as
+    before. Longer ones are split into overlapping speaker-turn windows
+    that are analyzed concurrently (up to max_concurrency); violations are
+    then merged, deduplicated by rule and quote, and the totals and risk
+    level recomputed, so the report keeps the AnalyzeResponse shape.
+
+    With the pre-screen enabled, rules that RulePrescreen settles (or
+    finds not applicable) are not sent to the LLM, and only the turns the
+    remaining rules need are. Only settled rules are reported as
+    compliant.
+    """
+
+    def __init__(self, llm_client, config: Optional[Dict[str, Any]] = None):
+        self.llm_client = llm_client
+        self.config = {**COMPLIANCE_CONFIG, **(config or {})}
+        self.prescreen = RulePrescreen(config=self.config)
+
+    def plan_windows(self, transcript: str) -> List[Dict[str, Any]]:
+        if len(transcript) <= self.config["window_chars"]:
+            return [{"first_turn": 0, "last_turn": 0, "text": transcript, "total_turns": 1}]
+        turns = split_turns(transcript)
+        windows = build_windows(turns, self.config["window_chars"], self.config["overlap_turns"])
+        for window in windows:
+            window["total_turns"] = len(turns)
+        return windows
+
+    def prepare(self, transcript: str) -> Dict[str, Any]:
+        """
+        Plan the LLM work for a transcript without running it. Returns
+        {settled, requests}: the rules the pre-screen settled and one
+        messages.create request per window (empty when every rule was
+        settled). `finish` turns the responses into the report, so callers
+        such as the bulk runner can send the requests however they like.
+        """
+        settled: Dict[str, Optional[str]] = {}
+        codes = [rule["code"] for rule in RULES]
+        text = transcript
+        if self.config["prescreen"]:
+            screen = self.prescreen.screen(transcript)
+            settled, codes, text = screen["settled"], screen["ambiguous"], screen["excerpt"]
+            print(
+                f"Compliance pre-screen settled {len(settled)}/{len(RULES)} rules "
+                f"({len(screen['not_applicable'])} not applicable); "
+                f"{len(screen['turns'])}/{screen['total_turns']} turns left for the LLM."
+            )
+            if not codes:
+                return {"settled": settled, "requests": []}
+
+        windows = self.plan_windows(text)
+        trimmed = text != transcript
+        requests = [self._window_request(window, i, len(windows), codes, trimmed) for i, window in enumerate(windows)]
+        return {"settled": settled, "requests": requests}
+
+    def finish(self, prepared: Dict[str, Any], response_texts: List[str]) -> Dict[str, Any]:
+        """
+        The merged report for the responses to `prepared["requests"]`, in
+        request order.
+        """
+        reports = [self._parse_report(text) for text in response_texts]
+        if len(reports) > 1:
+            print(f"Compliance analysis merged {len(reports)} windows.")
+        return self.reduce(reports, settled=prepared["settled"])
+
+    async def analyze(
+        self,
+        transcript: str,
+        on_violation: Optional[Callable[[Dict[str, Any], Optional[int]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns {total_violations, risk_level, violations, compliant_areas,
+        summary}. `on_violation(violation, None)` receives each distinct
+        violation as soon as it has been generated. When a later duplicate
+        is the one the merge keeps (see reduce), it is called again as
+        `on_violation(violation, index)` with the index, in delivery order, of
+        the violation it replaces, so the streamed list ends up matching
+        the final report.
+        """
+        prepared = self.prepare(transcript)
+        slots = asyncio.Semaphore(max(1, self.config["max_concurrency"]))
+        seen: List[Dict[str, Any]] = []
+
+        def offer(violation: Any):
+            violation = self._validate_violation(violation)
+            if violation is None:
+                return
+            duplicate = self._find_duplicate(seen, violation)
+            if duplicate is None:
+                seen.append(violation)
+                on_violation(violation, None)
+            elif self._preferred(violation, seen[duplicate]):
+                seen[duplicate] = violation
+                on_violation(violation, duplicate)
+
+        async def run(request: Dict[str, Any]) -> str:
+            async with slots:
+                return await self._complete(request, offer if on_violation else None)
+
+        response_texts = await asyncio.gather(*(run(request) for request in prepared["requests"]))
+        return self.finish(prepared, list(response_texts))
+
+    async def stream(self, transcript: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a "violation" event per distinct violation as it is generated,
+        a "violation_update" event ({index, violation}) when a later
+        duplicate replaces the violation at that index, then a "complete"
+        event with the merged report. Closing the iterator early cancels
+        the analysis.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        started = time.perf_counter()
+
+        def on_violation(violation: Dict[str, Any], replaces: Optional[int]):
+            queue.put_nowait({
+                "event": "violation" if replaces is None else "violation_update",
+                "data": violation if replaces is None else {"index": replaces, "violation": violation},
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            })
+
+        task = asyncio.create_task(self.analyze(transcript, on_violation=on_violation))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            yield {
+                "event": "complete",
+                "data": task.result(),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def _window_request(
+        self,
+        window: Dict[str, Any],
+        index: int,
+        count: int,
+        codes: List[str],
+        trimmed: bool
+    ) -> Dict[str, Any]:
+        excerpt_note = TRIMMED_NOTE if trimmed else ""
+        if count > 1:
+            excerpt_note += EXCERPT_NOTE.format(
+                index=index + 1,
+                count=count,
+                first=window["first_turn"] + 1,
+                last=window["last_turn"] + 1,
+                total=window["total_turns"],
+                start_note=(
+                    FIRST_EXCERPT if window["first_turn"] == 0
+                    else LATER_EXCERPT_DISCLOSURE if "RECORDING_DISCLOSURE" in codes
+                    else LATER_EXCERPT
+                )
+            )
+        return {
+            "call_site": "compliance",
+            "model": self.config["model"],
+            "max_tokens": self.config["max_tokens"],
+            "messages": [{"role": "user", "content": COMPLIANCE_PROMPT.format(
+                rules=rules_text(codes), excerpt_note=excerpt_note, transcript=window["text"]
+            )}]
+        }
+
+    async def _complete(self, request: Dict[str, Any], on_violation: Optional[Callable[[Any], None]]) -> str:
+        if on_violation is not None and hasattr(self.llm_client.messages, "stream_text"):
+            parser = JSONArrayStreamParser(array_key="violations")
+            async for chunk in self.llm_client.messages.stream_text(**request):
+                for violation in parser.feed(chunk):
+                    on_violation(violation)
+            return parser.text
+
+        message = await self.llm_client.messages.create(**request)
+        response_text = message.content[0].text
+        if on_violation is not None:
+            for violation in self._parse_report(response_text).get("violations") or []:
+                on_violation(violation)
+        return response_text
+
+    @staticmethod
+    def _parse_report(response_text: str) -> Dict[str, Any]:
+        report = json.loads(strip_code_fence(response_text))
+        if not isinstance(report, dict):
+            raise ValueError("Compliance response was not a JSON object")
+        return report
+
+    def reduce(
+        self,
+        reports: List[Dict[str, Any]],
+        settled: Optional[Dict[str, Optional[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Merge window reports, and the rules the pre-screen settled, into one
+        report. Counts and risk level are derived from the merged violations
+        rather than taken from the windows.
+        """
+        settled = settled or {}
+        violations: List[Dict[str, Any]] = []
+        for report in reports:
+            for violation in report.get("violations") or []:
+                violation = self._validate_violation(violation)
+                if violation is None:
+                    continue
+                duplicate = self._find_duplicate(violations, violation)
+                if duplicate is None:
+                    violations.append(violation)
+                elif self._preferred(violation, violations[duplicate]):
+                    violations[duplicate] = violation
+
+        violated = {violation["rule_code"] for violation in violations}
+        compliant_areas = [code for code in settled if code not in violated]
+        for report in reports:
+            for area in report.get("compliant_areas") or []:
+                if isinstance(area, str) and area not in violated and area not in compliant_areas:
+                    compliant_areas.append(area)
+
+        highest = max((SEVERITY_RANK[v["severity"]] for v in violations), default=0)
+        risk_level = RISK_BY_RANK[highest]
+        if not reports:
+            summary = "No compliance violations found; every applicable rule was settled by the rule pre-screen."
+        elif len(reports) == 1 and isinstance(reports[0].get("summary"), str):
+            summary = reports[0]["summary"]
+        elif violations:
+            summary = (
+                f"{len(violations)} compliance violation(s) found across {len(reports)} sections of the call "
+                f"({', '.join(sorted(violated))}); overall risk {risk_level}."
+            )
+        else:
+            summary = f"No compliance violations found across {len(reports)} sections of the call."
+
+        return {
+            "total_violations": len(violations),
+            "risk_level": risk_level,
+            "violations": violations,
+            "compliant_areas": compliant_areas,
+            "summary": summary
+        }
+
+    @staticmethod
+    def _validate_violation(violation: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(violation, dict) or not isinstance(violation.get("rule_code"), str):
+            return None
+        cleaned = {field: str(violation.get(field) or "") for field in VIOLATION_FIELDS}
+        cleaned["rule_code"] = cleaned["rule_code"].strip().upper()
+        severity = cleaned["severity"].strip().upper()
+        cleaned["severity"] = severity if severity in SEVERITY_RANK else "MEDIUM"
+        return cleaned
+
+    @staticmethod
+    def _find_duplicate(violations: List[Dict[str, Any]], violation: Dict[str, Any]) -> Optional[int]:
+        """
+        Index of an existing violation of the same rule whose quote matches,
+        allowing for one window quoting more of the same passage.
+        """
+        quote = normalize_quote(violation["quote"])
+        for i, existing in enumerate(violations):
+            if existing["rule_code"] != violation["rule_code"]:
+                continue
+            other = normalize_quote(existing["quote"])
+            if quote == other or (quote and other and (quote in other or other in quote)):
+                return i
+        return None
+
+    @staticmethod
+    def _preferred(candidate: Dict[str, Any], current: Dict[str, Any]) -> bool:
+        return (SEVERITY_RANK[candidate["severity"]], len(candidate["quote"])) > (
+            SEVERITY_RANK[current["severity"]], len(current["quote"])
+        )
@@ -0,0 +1,199 @@
+import re
+from typing import Any, Dict, List, Optional, Set
+from ..config.compliance_config import COMPLIANCE_CONFIG
+from .windowing import SENTENCE_END, split_turns
+
+# The compliance rules, in prompt order. Phrase matching only decides
+# what it can decide reliably:
+#   "disclosure" rules are settled as compliant when the agent says one of
+#     their patterns in the opening turns, as a statement and without a
+#     negation ("this call is not recorded" and a caller asking "is this
+#     being recorded?" do not count);
+#   "request" rules only apply once the caller makes an explicit request
+#     matching one of their triggers; without one they are not applicable
+#     (neither checked nor reported as compliant), with one the turns
+#     after it go to the LLM;
+#   "conduct" rules (false claims, pressure, verification) cannot be ruled
+#     out by missing keywords and always go to the LLM. They judge what
+#     the agent says, so the LLM sees every agent turn plus the turns
+#     around their context phrases (e.g. the verification exchange before
+#     account details come up); caller small talk is left out. Without
+#     speaker labels every turn is sent.
+RULES: List[Dict[str, Any]] = [
+    {
+        "code": "RECORDING_DISCLOSURE",
+        "description": "Agent must inform caller they are being recorded at the start",
+        "mode": "disclosure",
+        "patterns": [
+            r"\b(is|are|being|be|will be|may be|gets?) (recorded|monitored)",
+            r"\brecord(ed|ing)? (this|the|our) (call|conversation)",
+            r"\b(call|conversation) (is|will be|may be) (recorded|monitored)",
+            r"\bfor (quality|training) (and \w+ )?purposes"
+        ]
+    },
+    {
+        "code": "IDENTITY_VERIFICATION",
+        "description": "Agent must verify caller's identity before sharing sensitive info",
+        "mode": "conduct",
+        "triggers": [
+            r"\b(account|card|routing|social security|ssn|policy|member) (number|balance|details)\b",
+            r"\b(balance|statement|transactions?|payment history)\b",
+            r"\b(date of birth|dob|home address|zip|postcode|pin|password|security question)\b",
+            r"\b(verify|confirm) (your|the|some)\b",
+            r"\blast (four|4) digits\b"
+        ],
+        # Verification, if any, happens in the turns before the disclosure
+        "context_before": 6,
+        "context_after": 1
+    },
+    {
+        "code": "NO_PRESSURE_TACTICS",
+        "description": "Agent cannot use high-pressure sales language or create false urgency",
+        "mode": "conduct",
+        "triggers": [
+            r"\b(right now|right away|immediately|today only|only today|tonight only)\b",
+            r"\b(last chance|limited time|act (now|fast|quickly)|hurry|don'?t wait|won'?t last)\b",
+            r"\b(expires?|ends) (today|tonight|soon|in \w+ (minutes?|hours?))\b",
+            r"\b(decide|sign up|commit) (now|today)\b",
+            r"\b(think about it|not sure|need (some )?time|call (you )?back)\b"
+        ],
+        # The caller's hesitation shows whether the push was pressure
+        "context_before": 1,
+        "context_after": 1
+    },
+    {
+        "code": "ACCURATE_INFORMATION",
+        "description": "Agent cannot make false claims or promises",
+        "mode": "conduct",
+        "triggers": [
+            r"\b(guarantee[ds]?|promise[sd]?|assure|certain(ly)?|definitely|100 ?%|100 percent)\b",
+            r"\b(risk[- ]free|no risk|can'?t (lose|go wrong)|no catch|no strings)\b",
+            r"\b(free|no cost|won'?t cost|zero fees?|pre-?approved|approved)\b",
+            r"\b(returns?|interest|rate|fees?|price|cost)\b"
+        ],
+        "context_before": 1,
+        "context_after": 1
+    },
+    {
+        "code": "OPT_OUT_RESPECT",
+        "description": "Agent must respect do-not-call or opt-out requests",
+        "mode": "request",
+        "triggers": [
+            r"\b(do not|don'?t|stop) (call|contact|phon|ring)(ing)?\b",
+            r"\b(take|remove|delete) (me|my (name|number|details))( off| from)?\b",
+            r"\bdo[- ]not[- ]call\b",
+            r"\b(opt|opting) out\b",
+            r"\bunsubscribe\b",
+            r"\bnot interested\b"
+        ],
+        # What matters is how the agent carries on after the request
+        "context_before": 0,
+        "context_after": 4
+    }
+]
+
+AGENT_LABEL = re.compile(
+    r"^\s*(agent|rep|representative|advis[eo]r|associate|operator|specialist|support|csr)\b[\w .'-]{0,20}:",
+    re.IGNORECASE
+)
+NEGATION = re.compile(r"\b(not|never|no longer|isn'?t|aren'?t|won'?t|wasn'?t|doesn'?t|don'?t)\b", re.IGNORECASE)
+
+
+class RulePrescreen:
+    """
+    Cheap, deterministic first pass over a transcript. Settles the rules
+    that phrase matching can decide, sets aside request rules whose
+    request never came, and picks out the turns the LLM needs to see for
+    the rest.
+    """
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None, config: Optional[Dict[str, Any]] = None):
+        self.rules = rules or RULES
+        self.config = {**COMPLIANCE_CONFIG, **(config or {})}
+        self.matchers = {
+            rule["code"]: re.compile(
+                "|".join(f"(?:{p})" for p in rule.get("patterns") or rule.get("triggers")),
+                re.IGNORECASE
+            )
+            for rule in self.rules
+        }
+
+    def screen(self, transcript: str) -> Dict[str, Any]:
+        """
+        Returns {settled, not_applicable, ambiguous, turns, total_turns,
+        excerpt}: `settled` maps each rule code decided as compliant to the
+        quote that decided it, `not_applicable` lists request rules whose
+        request never came, `ambiguous` lists the rule codes left for the
+        LLM, and `excerpt` holds just the turns those rules need, in order,
+        with omitted stretches marked "[...]". When every turn is needed
+        `excerpt` is the transcript itself.
+        """
+        turns = split_turns(transcript)
+        opening = self.config["opening_turns"]
+        agent_turns = [i for i, turn in enumerate(turns) if AGENT_LABEL.match(turn)]
+        settled: Dict[str, str] = {}
+        not_applicable: List[str] = []
+        ambiguous: List[str] = []
+        needed: Set[int] = set()
+
+        for rule in self.rules:
+            code = rule["code"]
+            if rule["mode"] == "disclosure":
+                quote = next((q for q in map(self._agent_statement(code), turns[:opening]) if q), None)
+                if quote:
+                    settled[code] = quote
+                else:
+                    ambiguous.append(code)
+                    needed.update(range(min(opening, len(turns))))
+            else:
+                hits = [i for i, turn in enumerate(turns) if self.matchers[code].search(turn)]
+                if rule["mode"] == "request" and not hits:
+                    not_applicable.append(code)
+                    continue
+                ambiguous.append(code)
+                if rule["mode"] == "conduct":
+                    needed.update(agent_turns or range(len(turns)))
+                for i in hits:
+                    needed.update(range(max(0, i - rule["context_before"]), min(len(turns), i + rule["context_after"] + 1)))
+
+        if len(needed) == len(turns):
+            excerpt = transcript
+        else:
+            lines: List[str] = []
+            previous = -1
+            for i in sorted(needed):
+                if i != previous + 1:
+                    lines.append("[...]")
+                lines.append(turns[i])
+                previous = i
+            if previous != len(turns) - 1:
+                lines.append("[...]")
+            excerpt = "\n".join(lines)
+
+        return {
+            "settled": settled,
+            "not_applicable": not_applicable,
+            "ambiguous": ambiguous,
+            "turns": sorted(needed),
+            "total_turns": len(turns),
+            "excerpt": excerpt
+        }
+
+    def _agent_statement(self, code: str):
+        """
+        A function returning the sentence of an agent turn that states the
+        rule's pattern, or None. Unlabelled turns, other speakers,
+        questions and negated sentences never match.
+        """
+        matcher = self.matchers[code]
+
+        def find(turn: str) -> Optional[str]:
+            label = AGENT_LABEL.match(turn)
+            if not label:
+                return None
+            for sentence in SENTENCE_END.split(turn[label.end():].strip()):
+                if matcher.search(sentence) and not sentence.rstrip().endswith("?") and not NEGATION.search(sentence):
+                    return sentence.strip()
+            return None
+
+        return find
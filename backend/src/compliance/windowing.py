@@ -0,0 +1,49 @@
+import re
+from typing import Any, Dict, List
+
+SPEAKER_LINE = re.compile(r"^\s*[A-Za-z][\w .'-]{0,30}:\s")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_turns(transcript: str) -> List[str]:
+    """
+    Speaker turns of a transcript. Labelled transcripts ("Agent: ...") are
+    split on their labels; unlabelled ones (e.g. plain speech-to-text
+    output) on line breaks, or on sentence ends when there are none.
+    """
+    lines = [line.strip() for line in transcript.splitlines() if line.strip()]
+    if any(SPEAKER_LINE.match(line) for line in lines):
+        turns: List[str] = []
+        for line in lines:
+            if SPEAKER_LINE.match(line) or not turns:
+                turns.append(line)
+            else:
+                # Continuation of the previous speaker's turn
+                turns[-1] += " " + line
+        return turns
+    if len(lines) > 1:
+        return lines
+    return [sentence for sentence in SENTENCE_END.split(transcript.strip()) if sentence]
+
+
+def build_windows(turns: List[str], window_chars: int, overlap_turns: int) -> List[Dict[str, Any]]:
+    """
+    Pack consecutive turns into windows of at most `window_chars`
+    characters (a single longer turn gets a window of its own). Each window
+    after the first starts `overlap_turns` turns before the previous one
+    ended. Windows carry the index of their first and last turn.
+    """
+    windows = []
+    start = 0
+    while start < len(turns):
+        end = start
+        size = 0
+        while end < len(turns) and (end == start or size + len(turns[end]) + 1 <= window_chars):
+            size += len(turns[end]) + 1
+            end += 1
+        windows.append({"first_turn": start, "last_turn": end - 1, "text": "\n".join(turns[start:end])})
+        if end >= len(turns):
+            break
+        # Always make progress, even when the overlap covers the whole window
+        start = max(start + 1, end - overlap_turns)
+    return windows
@@ -7,5 +7,13 @@ AGENTQL_CONFIG = {
     "api_key": os.getenv("AGENTQL_API_KEY"),
     "extraction_mode": "semantic",  # Use semantic extraction
     "output_format": "json",
-    "include_confidence_scores": True
+    "include_confidence_scores": True,
+    # One query_data call per request
+    "rate_limit": {
+        "requests_per_minute": int(os.getenv("AGENTQL_RPM", 30)),
+        "burst": 5,
+        "max_in_flight": 4,
+        "max_wait": 60.0,
+        "max_queue": 50
+    }
 }
@@ -0,0 +1,54 @@
+import os
+from dotenv import load_dotenv
+from .env import env_flag
+
+load_dotenv()
+
+ANTHROPIC_CONFIG = {
+    "api_key": os.getenv("ANTHROPIC_API_KEY"),
+    "http2": True,
+    # One pool is shared by every LLM call site in the process
+    "max_connections": int(os.getenv("ANTHROPIC_MAX_CONNECTIONS", 20)),
+    "max_keepalive_connections": int(os.getenv("ANTHROPIC_MAX_KEEPALIVE", 10)),
+    "keepalive_expiry": 30.0,
+    "timeout": 120.0,
+    "connect_timeout": 10.0,
+    "max_retries": 2,
+    # Mark the shared profile prefix of Phase 5 prompts as cacheable
+    "prompt_caching": env_flag("ANTHROPIC_PROMPT_CACHING", True),
+    # Client-side governor (see src/governor). Requests past the token
+    # bucket or in-flight cap queue for up to max_wait seconds; beyond
+    # max_queue waiters callers get a BackpressureError instead.
+    "rate_limit": {
+        "requests_per_minute": int(os.getenv("ANTHROPIC_RPM", 50)),
+        "burst": 10,
+        "max_in_flight": int(os.getenv("ANTHROPIC_MAX_IN_FLIGHT", 10)),
+        "max_wait": 60.0,
+        "max_queue": 200
+    }
+}
+
+_DAY = 24 * 60 * 60
+
+LLM_CACHE_CONFIG = {
+    "enabled": env_flag("LLM_CACHE_ENABLED", True),
+    "path": os.path.join(os.path.dirname(__file__), "../../data/cache/llm_cache.sqlite"),
+    "memory_entries": 512,
+    # Seconds a response stays valid, by call site. Profile analysis only
+    # changes when the posts do (and the posts are part of the key), so it
+    # can live longer than the meeting-prep generators.
+    "ttls": {
+        "post_analysis": 7 * _DAY,
+        "profile_themes": 7 * _DAY,
+        "sentiment": 7 * _DAY,
+        "theme_identification": 7 * _DAY,
+        "talking_points": 1 * _DAY,
+        "likely_questions": 1 * _DAY,
+        "response_strategy": 1 * _DAY,
+        "response_strategy_batch": 1 * _DAY,
+        "pitch_simulation": 1 * _DAY,
+        "scenario": 1 * _DAY,
+        "compliance": 30 * _DAY,
+        "default": 1 * _DAY
+    }
+}
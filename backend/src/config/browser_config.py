@@ -0,0 +1,100 @@
+import os
+from .env import env_flag
+
+BROWSER_CONFIG = {
+    "headless": True,
+    # Maximum contexts leased out at once across all scraper agents
+    "max_contexts": int(os.getenv("BROWSER_POOL_SIZE", 4)),
+    # Contexts are closed and rebuilt after this many leases
+    "max_uses_per_context": int(os.getenv("BROWSER_CONTEXT_MAX_USES", 20)),
+    # Seconds a caller waits for a free context before giving up
+    "lease_timeout": 60,
+    # Seconds an idle context gets to answer the health check probe
+    "health_probe_timeout": 5,
+    "auth_state_path": os.path.join(os.path.dirname(__file__), "../../data/cache/auth_state.json"),
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    # Page sessions per site, enforced when a page is leased. LinkedIn and X
+    # throttle or challenge aggressive scraping long before a 429.
+    "site_rate_limits": {
+        "linkedin": {
+            "requests_per_minute": int(os.getenv("LINKEDIN_SESSIONS_PER_MINUTE", 6)),
+            "burst": 2,
+            "max_in_flight": 2,
+            "max_wait": 60.0,
+            "max_queue": 50
+        },
+        "twitter": {
+            "requests_per_minute": int(os.getenv("X_SESSIONS_PER_MINUTE", 10)),
+            "burst": 3,
+            "max_in_flight": 2,
+            "max_wait": 60.0,
+            "max_queue": 50
+        },
+        "duckduckgo": {
+            "requests_per_minute": 20,
+            "burst": 5,
+            "max_in_flight": 4,
+            "max_wait": 30.0,
+            "max_queue": 50
+        }
+    }
+}
+
+# Readiness waits replace fixed sleeps after navigation. A page is ready as
+# soon as any of the site's selectors attaches, or the network goes idle,
+# whichever comes first; max_wait_ms is the hard upper bound.
+READINESS_CONFIG = {
+    "default_max_wait_ms": int(os.getenv("PAGE_READY_MAX_WAIT_MS", 8000)),
+    "sites": {
+        "linkedin": {
+            "selectors": ["h1.text-heading-xlarge", "div.feed-shared-update-v2", "main section"],
+            "max_wait_ms": 8000
+        },
+        "twitter": {
+            "selectors": ['article[data-testid="tweet"]'],
+            "max_wait_ms": 8000,
+            # After scrolling, wait for new tweets to render rather than a fixed pause
+            "lazy_selector": 'article[data-testid="tweet"]',
+            "lazy_max_wait_ms": 3000
+        },
+        "duckduckgo": {
+            "selectors": ["a.result__a", "article h2", "h2"],
+            "max_wait_ms": 5000
+        }
+    }
+}
+
+# Request interception for scraper pages. We only read text, so heavy
+# assets and third-party trackers are aborted before they download.
+_TRACKER_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "facebook.net", "connect.facebook.net",
+    "scorecardresearch.com", "hotjar.com", "segment.io", "bat.bing.com"
+]
+
+BLOCKING_CONFIG = {
+    "enabled": env_flag("BROWSER_BLOCK_RESOURCES", True),
+    # Typical transfer sizes used to estimate bytes saved per aborted request
+    "estimated_bytes": {
+        "image": 45_000,
+        "media": 750_000,
+        "font": 35_000,
+        "script": 60_000,
+        "xhr": 8_000,
+        "other": 10_000
+    },
+    "sites": {
+        "linkedin": {
+            "resource_types": ["image", "media", "font"],
+            "blocked_domains": _TRACKER_DOMAINS + ["px.ads.linkedin.com", "ads.linkedin.com", "li.protechts.net"]
+        },
+        "twitter": {
+            "resource_types": ["image", "media", "font"],
+            "blocked_domains": _TRACKER_DOMAINS + ["ads-twitter.com", "ads-api.twitter.com", "analytics.twitter.com"]
+        },
+        "duckduckgo": {
+            "resource_types": ["image", "media", "font"],
+            "blocked_domains": _TRACKER_DOMAINS + ["improving.duckduckgo.com"]
+        }
+    }
+}
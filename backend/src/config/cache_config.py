@@ -0,0 +1,32 @@
+import os
+from .env import env_flag
+
+_DAY = 24 * 60 * 60
+
+BRIEFING_CACHE_CONFIG = {
+    # After stale_after seconds a briefing is still served but marked stale
+    "stale_after": float(os.getenv("BRIEFING_CACHE_STALE_AFTER", 1 * _DAY)),
+    # After ttl seconds a briefing is no longer served at all
+    "ttl": float(os.getenv("BRIEFING_CACHE_TTL", 7 * _DAY)),
+    "memory_entries": 128,
+    # Disk tier limits; the oldest unpinned briefings are deleted past them
+    "max_entries": int(os.getenv("BRIEFING_CACHE_MAX_ENTRIES", 1000)),
+    "max_bytes": int(os.getenv("BRIEFING_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+    # Writes between disk sweeps
+    "sweep_every": 25
+}
+
+COMPANY_INTEL_CONFIG = {
+    "enabled": env_flag("COMPANY_INTEL_ENABLED", True),
+    "path": os.path.join(os.path.dirname(__file__), "../../data/cache/company_intel.sqlite"),
+    # Seconds each researched field stays fresh. News moves daily; what a
+    # company does and who it competes with changes slowly.
+    "field_ttls": {
+        "recent_news": 1 * _DAY,
+        "talking_points": 1 * _DAY,
+        "funding": 7 * _DAY,
+        "industry": 7 * _DAY,
+        "competitors": 7 * _DAY,
+        "default": 1 * _DAY
+    }
+}
@@ -0,0 +1,27 @@
+import os
+from .env import env_flag
+
+COMPLIANCE_CONFIG = {
+    "model": "claude-sonnet-4-5",
+    "max_tokens": 2000,
+    # Transcripts longer than one window are split into speaker-turn
+    # windows of at most this many characters, analyzed concurrently
+    "window_chars": int(os.getenv("COMPLIANCE_WINDOW_CHARS", 12000)),
+    # Turns repeated at the start of the next window, so a violation that
+    # spans a boundary is still seen whole by one window
+    "overlap_turns": 2,
+    "max_concurrency": int(os.getenv("COMPLIANCE_MAX_CONCURRENCY", 4)),
+    # Settle the rules phrase matching can decide locally and send only the
+    # rest, with the turns they need, to the LLM
+    "prescreen": env_flag("COMPLIANCE_PRESCREEN", True),
+    # Turns at the start of the call that must contain the recording disclosure
+    "opening_turns": 3,
+    # Bulk analysis: calls in flight at once (transcription and analysis),
+    # and the directory /compliance/bulk may read from and write to
+    "bulk_concurrency": int(os.getenv("COMPLIANCE_BULK_CONCURRENCY", 8)),
+    "bulk_root": os.getenv("COMPLIANCE_BULK_ROOT", "data/compliance"),
+    # Message Batches mode: requests per batch (the API allows 100,000) and
+    # seconds between status checks
+    "batch_max_requests": 10000,
+    "batch_poll_interval": float(os.getenv("COMPLIANCE_BATCH_POLL_INTERVAL", 60))
+}
@@ -0,0 +1,50 @@
+import os
+from dotenv import load_dotenv
+from .env import env_flag
+
+load_dotenv()
+
+ELEVENLABS_CONFIG = {
+    "api_key": os.getenv("ELEVENLABS_API_KEY"),
+    "model_id": "scribe_v1",
+    "language_code": "en",
+    # Speech-to-text requests are long-running; concurrency is the real limit
+    "rate_limit": {
+        "requests_per_minute": int(os.getenv("ELEVENLABS_RPM", 60)),
+        "burst": 5,
+        "max_in_flight": int(os.getenv("ELEVENLABS_MAX_IN_FLIGHT", 4)),
+        "max_wait": 120.0,
+        "max_queue": 100
+    }
+}
+
+# Long recordings are split on silence and the chunks transcribed
+# concurrently. Durations are in seconds.
+TRANSCRIPTION_CONFIG = {
+    "chunking_enabled": env_flag("TRANSCRIBE_CHUNKING", True),
+    # Recordings shorter than this are sent in one request
+    "min_duration": float(os.getenv("TRANSCRIBE_MIN_CHUNKED_DURATION", 120)),
+    "target_chunk": 60.0,
+    "min_chunk": 20.0,
+    "max_chunk": 90.0,
+    # Audio shared by neighbouring chunks, so words at a cut are not lost
+    "overlap": 1.0,
+    "min_silence_ms": 400,
+    # Silence threshold relative to the recording's average loudness
+    "silence_thresh_db": -16,
+    # Chunks are re-encoded as mono PCM at this rate before upload
+    "sample_rate": 16000,
+    "max_concurrency": int(os.getenv("TRANSCRIBE_MAX_CONCURRENCY", 4)),
+    "max_attempts": 3,
+    "retry_backoff": 1.0
+}
+
+# Audio uploads are spooled to a temporary file in bounded pieces
+INGEST_CONFIG = {
+    # Spooled uploads stay in memory up to this size, then move to disk
+    "spool_memory_bytes": 8 * 1024 * 1024,
+    "read_chunk_bytes": 1024 * 1024,
+    "max_upload_bytes": int(os.getenv("AUDIO_MAX_UPLOAD_BYTES", 500 * 1024 * 1024)),
+    # JSON bodies must reach the audio field within this many bytes
+    "max_json_head_bytes": 64 * 1024
+}
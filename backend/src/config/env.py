@@ -0,0 +1,20 @@
+import os
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """
+    Read an on/off switch from the environment. Accepts 1/0, true/false,
+    yes/no and on/off in any case; unset or unrecognised values fall back
+    to the default.
+    """
+    value = os.getenv(name, "").strip().lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    if value:
+        print(f"Warning: ignoring {name}={value!r}, expected on/off; using {default}")
+    return default
@@ -1,8 +1,36 @@
 import os
+from .env import env_flag
 
 FABRICATE_CONFIG = {
     "api_key": os.getenv("TONIC_FABRICATE_API_KEY", "mock_key"),
     "endpoint": "https://api.tonic.ai/fabricate",
     "output_format": "json",
-    "generation_mode": "contextual"  # Our novel use case
+    "generation_mode": "contextual",  # Our novel use case
+    "rate_limit": {
+        "requests_per_minute": 30,
+        "burst": 5,
+        "max_in_flight": 4,
+        "max_wait": 30.0,
+        "max_queue": 50
+    }
+}
+
+SCENARIO_CONFIG = {
+    "contexts": ["first_meeting", "pitch", "advice_seeking", "partnership"],
+    # Scenario LLM calls in flight at once for one briefing
+    "max_concurrency": int(os.getenv("SCENARIO_MAX_CONCURRENCY", 4)),
+    # Kept below the pipeline's "scenarios" stage timeout so finished
+    # scenarios are returned even when a slow one is dropped
+    "scenario_timeout": float(os.getenv("SCENARIO_TIMEOUT", 60)),
+    # Only build the contexts that match the request's meeting_context
+    "relevant_only": env_flag("SCENARIO_RELEVANT_ONLY", False),
+    # Lower-case keywords in meeting_context that select each context
+    "context_keywords": {
+        "first_meeting": ["intro", "first", "meet", "coffee", "catch up", "get to know"],
+        "pitch": ["pitch", "demo", "sell", "sales", "proposal", "pricing", "product"],
+        "advice_seeking": ["advice", "mentor", "guidance", "feedback", "career", "learn"],
+        "partnership": ["partner", "collaborat", "integration", "alliance", "joint", "co-market"]
+    },
+    # Used when relevant_only is on but nothing in meeting_context matches
+    "default_contexts": ["first_meeting"]
 }
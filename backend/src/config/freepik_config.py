@@ -4,5 +4,13 @@ FREEPIK_CONFIG = {
     "api_key": os.getenv("FREEPIK_API_KEY"),
     "base_url": "https://api.freepik.com/v1",
     "default_model": "mystic",
-    "resolution": "1024x1024"
+    "resolution": "1024x1024",
+    # Image generation is slow and metered; keep only a couple in flight
+    "rate_limit": {
+        "requests_per_minute": 10,
+        "burst": 2,
+        "max_in_flight": 2,
+        "max_wait": 30.0,
+        "max_queue": 20
+    }
 }
@@ -0,0 +1,14 @@
+import os
+
+JOBS_CONFIG = {
+    "path": os.path.join(os.path.dirname(__file__), "../../data/cache/jobs.sqlite"),
+    # Pipelines running at once; each holds browser contexts and LLM/Yutori slots
+    "workers": int(os.getenv("BRIEFING_WORKERS", "2")),
+    # Submissions beyond this many queued jobs are rejected (HTTP 429)
+    "max_queued": int(os.getenv("BRIEFING_MAX_QUEUED", "50")),
+    "default_priority": 5,
+    # Upper bound for a single long-poll on a job result
+    "max_wait": 30.0,
+    # Finished jobs are purged after this many seconds
+    "retention": 24 * 60 * 60
+}
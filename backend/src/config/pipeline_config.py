@@ -0,0 +1,28 @@
+import os
+from .env import env_flag
+from .browser_config import BROWSER_CONFIG
+
+PIPELINE_CONFIG = {
+    # Per-stage timeouts in seconds. A stage that exceeds its timeout falls
+    # back to the same degraded output the agents return on error.
+    "stage_timeouts": {
+        "linkedin": float(os.getenv("PIPELINE_LINKEDIN_TIMEOUT", 90)),
+        "twitter": float(os.getenv("PIPELINE_TWITTER_TIMEOUT", 60)),
+        "company_research": float(os.getenv("PIPELINE_COMPANY_TIMEOUT", 45)),
+        "post_analysis": 60,
+        "themes": 45,
+        "sentiment": 45,
+        "theme_insights": 45,
+        "synthesis": 60,
+        "likely_questions": 60,
+        "response_strategies": 90,
+        "pitch_simulation": 60,
+        "scenarios": 90,
+    },
+    # Phase 2: identity, themes and sentiment from one LLM call instead of three
+    "unified_post_analysis": env_flag("PIPELINE_UNIFIED_POST_ANALYSIS", True),
+    # Batch briefings: items running at once. Defaults to the browser pool
+    # size, since every pipeline starts by leasing a browser context.
+    "batch_concurrency": int(os.getenv("BRIEFING_BATCH_CONCURRENCY", BROWSER_CONFIG["max_contexts"])),
+    "batch_max_items": int(os.getenv("BRIEFING_BATCH_MAX_ITEMS", 50))
+}
@@ -7,5 +7,21 @@ YUTORI_CONFIG = {
     "api_key": os.getenv("YUTORI_API_KEY"),
     "browser_mode": "cloud",  # Use cloud browser
     "timeout": 60,  # 60 second timeout
-    "decision_mode": "intelligent"  # Enable intelligent prioritization
+    "decision_mode": "intelligent",  # Enable intelligent prioritization
+    "base_url": os.getenv("YUTORI_BASE_URL", "https://api.yutori.com/v1"),
+    # Task polling: exponential backoff with full jitter, starting fast
+    "poll_initial_interval": 0.5,
+    "poll_max_interval": 8.0,
+    "poll_timeout": 90,
+    # Research tasks allowed in flight at once across the process
+    "max_concurrent_tasks": int(os.getenv("YUTORI_MAX_CONCURRENT_TASKS", 10)),
+    "max_connections": 20,
+    # Applies to every API request, task creation and polling alike
+    "rate_limit": {
+        "requests_per_minute": int(os.getenv("YUTORI_RPM", 120)),
+        "burst": 20,
+        "max_in_flight": 20,
+        "max_wait": 30.0,
+        "max_queue": 200
+    }
 }
@@ -1,13 +1,29 @@
+import asyncio
+import glob
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional
+import tempfile
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, unquote
+from ..config.cache_config import BRIEFING_CACHE_CONFIG
+from ..storage.lru_cache import LRUCache
 
 class CacheManager:
     """
-    Manages cached briefing data for reliable demos.
+    Tiered briefing store: an in-process LRU in front of one JSON file per
+    briefing on disk.
+
+    Entries carry staleness metadata (cached_at, stale_at, expires_at).
+    Stale entries are still served; expired entries are not, and their
+    files are deleted when found. Every `sweep_every` writes the directory
+    is swept: expired files go, then the oldest unpinned briefings until
+    the tier is within max_entries and max_bytes. Files are written
+    atomically so readers never see a partial briefing.
     """
-    
-    def __init__(self, cache_dir: str = "backend/data/cache"):
+
+    def __init__(self, cache_dir: str = "backend/data/cache", config: Optional[Dict[str, Any]] = None):
         # Adjust path if needed
         if not os.path.exists(cache_dir):
              # Try relative path
@@ -16,41 +32,311 @@ class CacheManager:
              else:
                  # Assume we are in backend dir
                  cache_dir = "data/cache"
-                 
+
         self.cache_dir = cache_dir
         os.makedirs(self.cache_dir, exist_ok=True)
 
-    def get_cache_key(self, linkedin_url: str) -> str:
+        self.config = {**BRIEFING_CACHE_CONFIG, **(config or {})}
+        self.memory = LRUCache(self.config["memory_entries"])
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "expired": 0, "writes": 0, "evicted": 0}
+        self._forget(self.sweep_disk())
+
+    @staticmethod
+    def canonicalize_url(url: Optional[str]) -> str:
         """
-        Generate a safe filename from the URL.
+        Normalize profile URLs so trivially different links share an entry:
+        scheme, www/mobile hosts, query strings, fragments, case and trailing
+        slashes are ignored, and twitter.com is folded into x.com.
         """
-        # Simple extraction of username or unique identifier
-        if "linkedin.com/in/" in linkedin_url:
-            username = linkedin_url.split("linkedin.com/in/")[-1].strip("/").replace("/", "_")
-            return f"profile_{username}.json"
-        return "profile_default.json"
+        if not url:
+            return ""
+        url = url.strip()
+        if "://" not in url:
+            url = "https://" + url
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        for prefix in ("www.", "m.", "mobile."):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+        if host == "twitter.com":
+            host = "x.com"
+        path = unquote(parsed.path).rstrip("/").lower()
+        return f"{host}{path}"
+
+    @staticmethod
+    def _normalize_context(meeting_context: Optional[str]) -> str:
+        return " ".join((meeting_context or "").lower().split())
+
+    def _profile_slug(self, linkedin_url: str) -> str:
+        canonical = self.canonicalize_url(linkedin_url)
+        if "linkedin.com/in/" in canonical:
+            return canonical.split("linkedin.com/in/")[-1].split("/")[0]
+        # Non-profile URLs get a stable hash instead of colliding on one file
+        return "url_" + hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
-    def save_to_cache(self, linkedin_url: str, data: Dict[str, Any]):
+    @staticmethod
+    def _legacy_key(linkedin_url: str) -> Optional[str]:
         """
-        Save briefing data to cache.
+        Filename earlier versions used: the raw URL path, case and all.
+        Their shared profile_default.json for non-profile URLs is not
+        served, since it belongs to whichever URL wrote it last.
         """
-        filename = self.get_cache_key(linkedin_url)
-        filepath = os.path.join(self.cache_dir, filename)
-        
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
-            
-    def get_from_cache(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
+        if "linkedin.com/in/" not in linkedin_url:
+            return None
+        username = linkedin_url.split("linkedin.com/in/")[-1].strip("/").replace("/", "_")
+        return f"profile_{username}.json"
+
+    def get_cache_key(self, linkedin_url: str, meeting_context: Optional[str] = None, twitter_url: Optional[str] = None) -> str:
         """
-        Retrieve data from cache if it exists.
+        Generate a safe filename from the canonical request.
         """
-        filename = self.get_cache_key(linkedin_url)
-        filepath = os.path.join(self.cache_dir, filename)
-        
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, "r") as f:
-                    return json.load(f)
-            except Exception:
-                return None
+        slug = self._profile_slug(linkedin_url)
+        if meeting_context is None and twitter_url is None:
+            # Context-agnostic entry (e.g. demo data) for this profile
+            return f"profile_{slug}_any.json"
+
+        request_id = json.dumps([
+            self.canonicalize_url(linkedin_url),
+            self.canonicalize_url(twitter_url),
+            self._normalize_context(meeting_context)
+        ])
+        digest = hashlib.sha256(request_id.encode()).hexdigest()[:16]
+        return f"profile_{slug}_{digest}.json"
+
+    def save_to_cache(
+        self,
+        linkedin_url: str,
+        data: Dict[str, Any],
+        meeting_context: Optional[str] = None,
+        twitter_url: Optional[str] = None,
+        pinned: bool = False
+    ):
+        """
+        Save briefing data to cache. Pinned entries never go stale or expire.
+        """
+        filename, entry = self._new_entry(linkedin_url, data, meeting_context, twitter_url, pinned)
+        self._write_atomic(os.path.join(self.cache_dir, filename), entry)
+        self._remember(filename, entry)
+        if self._sweep_due():
+            self._forget(self.sweep_disk())
+
+    async def save_to_cache_async(
+        self,
+        linkedin_url: str,
+        data: Dict[str, Any],
+        meeting_context: Optional[str] = None,
+        twitter_url: Optional[str] = None,
+        pinned: bool = False
+    ):
+        """
+        save_to_cache for async handlers: the fsync'd write and any sweep
+        run in a worker thread instead of on the event loop.
+        """
+        filename, entry = self._new_entry(linkedin_url, data, meeting_context, twitter_url, pinned)
+        await asyncio.to_thread(self._write_atomic, os.path.join(self.cache_dir, filename), entry)
+        self._remember(filename, entry)
+        if self._sweep_due():
+            self._forget(await asyncio.to_thread(self.sweep_disk))
+
+    def _new_entry(
+        self,
+        linkedin_url: str,
+        data: Dict[str, Any],
+        meeting_context: Optional[str],
+        twitter_url: Optional[str],
+        pinned: bool
+    ):
+        now = time.time()
+        entry = {
+            "linkedin_url": self.canonicalize_url(linkedin_url),
+            "cached_at": now,
+            "stale_at": None if pinned else now + self.config["stale_after"],
+            "expires_at": None if pinned else now + self.config["ttl"],
+            "data": data
+        }
+        return self.get_cache_key(linkedin_url, meeting_context, twitter_url), entry
+
+    def _remember(self, filename: str, entry: Dict[str, Any]):
+        self.memory.set(filename, entry, expires_at=entry["expires_at"])
+        self.stats["writes"] += 1
+
+    def _sweep_due(self) -> bool:
+        return self.stats["writes"] % self.config["sweep_every"] == 0
+
+    def _forget(self, filenames: List[str]):
+        for filename in filenames:
+            self.memory.delete(filename)
+
+    def sweep_disk(self) -> List[str]:
+        """
+        Delete expired briefing files, then the oldest unpinned ones until
+        the directory is within max_entries and max_bytes. Only briefing
+        files (profile_*.json) and abandoned temp files are touched; other
+        caches share the directory. Returns the deleted filenames.
+        """
+        now = time.time()
+        live = []
+        removed: List[str] = []
+        for item in os.scandir(self.cache_dir):
+            if not item.is_file() or not item.name.endswith(".json"):
+                continue
+            stat = item.stat()
+            if item.name.startswith(".tmp_"):
+                # Left behind by a writer that died mid-write
+                if stat.st_mtime < now - 3600:
+                    self._remove(item.name)
+                continue
+            if not item.name.startswith("profile_"):
+                continue
+            expires_at, pinned = self._read_expiry(item.path)
+            if expires_at is not None and expires_at <= now:
+                self._remove(item.name)
+                removed.append(item.name)
+            elif not pinned:
+                live.append((stat.st_mtime, stat.st_size, item.name))
+            else:
+                # Pinned entries count toward the limits but are never evicted
+                live.append((None, stat.st_size, item.name))
+
+        count = len(live)
+        size = sum(entry[1] for entry in live)
+        evictable = sorted((entry for entry in live if entry[0] is not None), key=lambda entry: entry[0])
+        for _, file_size, name in evictable:
+            if count <= self.config["max_entries"] and size <= self.config["max_bytes"]:
+                break
+            self._remove(name)
+            removed.append(name)
+            count -= 1
+            size -= file_size
+        self.stats["evicted"] += len(removed)
+        return removed
+
+    def _read_expiry(self, filepath: str):
+        """
+        (expires_at, pinned) of a briefing file. Legacy and unreadable
+        files are treated as pinned so they are never evicted.
+        """
+        try:
+            with open(filepath, "r") as f:
+                entry = json.load(f)
+        except Exception:
+            return None, True
+        if not isinstance(entry, dict) or "data" not in entry or "cached_at" not in entry:
+            return None, True
+        return entry.get("expires_at"), entry.get("expires_at") is None
+
+    def _remove(self, filename: str):
+        try:
+            os.remove(os.path.join(self.cache_dir, filename))
+        except FileNotFoundError:
+            pass
+
+    def get_entry(
+        self,
+        linkedin_url: str,
+        meeting_context: Optional[str] = None,
+        twitter_url: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cache entry with its metadata plus `is_stale` and
+        `age_seconds`, or None. An exact match wins; otherwise a
+        context-agnostic entry for the same profile is used.
+        """
+        candidates = [self.get_cache_key(linkedin_url, meeting_context, twitter_url)]
+        agnostic = self.get_cache_key(linkedin_url)
+        if agnostic not in candidates:
+            candidates.append(agnostic)
+        # Files written by earlier versions: profile_<username>.json, no metadata
+        legacy = self._legacy_key(linkedin_url)
+        if legacy:
+            candidates.append(legacy)
+
+        for filename in candidates:
+            entry = self._load(filename)
+            if entry is not None:
+                return self._describe(entry)
+
+        self.stats["misses"] += 1
+        return None
+
+    def get_from_cache(
+        self,
+        linkedin_url: str,
+        meeting_context: Optional[str] = None,
+        twitter_url: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve briefing data from cache if a live entry exists.
+        """
+        entry = self.get_entry(linkedin_url, meeting_context, twitter_url)
+        return entry["data"] if entry else None
+
+    def get_latest_for_profile(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Most recently cached briefing for a profile, whatever its context.
+        """
+        slug = glob.escape(self._profile_slug(linkedin_url))
+        paths = glob.glob(os.path.join(self.cache_dir, f"profile_{slug}_*.json"))
+        legacy = self._legacy_key(linkedin_url)
+        if legacy and os.path.exists(os.path.join(self.cache_dir, legacy)):
+            paths.append(os.path.join(self.cache_dir, legacy))
+        for path in sorted(paths, key=os.path.getmtime, reverse=True):
+            entry = self._load(os.path.basename(path))
+            if entry is not None:
+                return entry["data"]
+        self.stats["misses"] += 1
         return None
+
+    def _load(self, filename: str) -> Optional[Dict[str, Any]]:
+        entry = self.memory.get(filename)
+        if entry is not None:
+            self.stats["memory_hits"] += 1
+            return entry
+
+        filepath = os.path.join(self.cache_dir, filename)
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "r") as f:
+                entry = json.load(f)
+        except Exception:
+            return None
+
+        if "data" not in entry or "cached_at" not in entry:
+            # Legacy file: treat as a pinned entry
+            entry = {"cached_at": os.path.getmtime(filepath), "stale_at": None, "expires_at": None, "data": entry}
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self.stats["expired"] += 1
+            self._remove(filename)
+            return None
+
+        self.stats["disk_hits"] += 1
+        self.memory.set(filename, entry, expires_at=expires_at)
+        return entry
+
+    @staticmethod
+    def _describe(entry: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.time()
+        stale_at = entry.get("stale_at")
+        return {
+            **entry,
+            "age_seconds": round(now - entry["cached_at"], 1),
+            "is_stale": stale_at is not None and stale_at <= now
+        }
+
+    def _write_atomic(self, filepath: str, entry: Dict[str, Any]):
+        # Write to a temp file in the same directory, then rename over the
+        # target so concurrent readers see either the old or new briefing
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
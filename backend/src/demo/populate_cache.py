@@ -120,10 +120,10 @@ def populate_cache():
 
     # Save to cache
     print("Caching Dhruv Batra...")
-    cache_manager.save_to_cache("https://linkedin.com/in/dhruvbatra", dhruv_data)
+    cache_manager.save_to_cache("https://linkedin.com/in/dhruvbatra", dhruv_data, pinned=True)
     
     print("Caching Alex Chen (Backup)...")
-    cache_manager.save_to_cache("https://linkedin.com/in/alexc", engineer_data)
+    cache_manager.save_to_cache("https://linkedin.com/in/alexc", engineer_data, pinned=True)
     
     print("SUCCESS: Demo cache populated.")
 
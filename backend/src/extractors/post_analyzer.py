@@ -0,0 +1,131 @@
+import json
+from typing import List, Dict, Any
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from ..governor.provider_governor import BackpressureError
+from .profile_extractor import SemanticProfileExtractor
+from .theme_engine import ThemeIdentificationEngine
+
+
+class SentimentAnalysis(BaseModel):
+    overall_sentiment: str
+    passion_topics: List[str] = Field(default_factory=list)
+    concerns: List[str] = Field(default_factory=list)
+    communication_style: str = "professional"
+
+
+class PostAnalysis(BaseModel):
+    """
+    Schema for the single Phase 2 response.
+    """
+    professional_identity: str
+    primary_theme: str
+    secondary_themes: List[str] = Field(default_factory=list)
+    theme_frequency: Dict[str, float] = Field(default_factory=dict)
+    sentiment: SentimentAnalysis
+
+    @field_validator("theme_frequency")
+    @classmethod
+    def clamp_frequencies(cls, value: Dict[str, float]) -> Dict[str, float]:
+        return {theme: min(1.0, max(0.0, score)) for theme, score in value.items()}
+
+
+class PostAnalyzer:
+    """
+    Phase 2 analysis of a person's posts in one LLM request: professional
+    identity, themes with frequencies, and sentiment.
+
+    Results keep the shapes of extract_profile_themes,
+    extract_sentiment_patterns and identify_themes, so downstream stages are
+    unchanged. Without an LLM, or when the response fails validation, the
+    keyword analysis of those extractors is used instead.
+    """
+
+    def __init__(self, llm_client=None):
+        self.llm_client = llm_client
+        self.keyword_extractor = SemanticProfileExtractor()
+        self.keyword_themes = ThemeIdentificationEngine()
+
+    async def analyze_posts(self, raw_posts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns {"themes": ..., "sentiment": ..., "theme_insights": ...}.
+        """
+        safe_content = [p.get("content", "") for p in raw_posts if p and isinstance(p, dict) and p.get("content")]
+
+        if self.llm_client and " ".join(safe_content).strip():
+            try:
+                return self._to_outputs(await self._analyze_llm(safe_content))
+            except BackpressureError:
+                raise
+            except ValidationError as e:
+                print(f"Phase 2 analysis did not match the schema ({e.error_count()} errors). Falling back.")
+            except Exception as e:
+                print(f"LLM Phase 2 analysis failed: {e}. Falling back.")
+
+        return {
+            "themes": await self.keyword_extractor.extract_profile_themes(raw_posts),
+            "sentiment": await self.keyword_extractor.extract_sentiment_patterns(raw_posts),
+            "theme_insights": await self.keyword_themes.identify_themes(raw_posts)
+        }
+
+    async def _analyze_llm(self, posts: List[str]) -> PostAnalysis:
+        posts_text = "\n---\n".join(posts[:20])
+
+        prompt = f"""
+        Analyze these social media posts to construct a professional profile of their author.
+
+        POSTS:
+        {posts_text}
+
+        Determine:
+        1. Professional Identity (e.g., "AI Researcher", "Growth Marketer")
+        2. The Primary Theme (the single most dominant topic)
+        3. Secondary Themes (2-4 other important topics)
+        4. A frequency/importance score for each theme (0.0 to 1.0)
+        5. The overall sentiment, passion topics, concerns and communication style
+
+        Return JSON in this format:
+        {{
+            "professional_identity": "...",
+            "primary_theme": "Theme Name",
+            "secondary_themes": ["Theme 2", "Theme 3"],
+            "theme_frequency": {{ "Theme Name": 0.8, "Theme 2": 0.5, "Theme 3": 0.3 }},
+            "sentiment": {{
+                "overall_sentiment": "positive|neutral|concerned|analytical",
+                "passion_topics": ["topic1", "topic2"],
+                "concerns": ["concern1", "concern2"],
+                "communication_style": "e.g., formal, casual, visionary, technical"
+            }}
+        }}
+        """
+
+        message = await self.llm_client.messages.create(
+            call_site="post_analysis",
+            model="claude-3-5-sonnet-20240620",
+            max_tokens=800,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        response_text = message.content[0].text
+
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0]
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0]
+
+        return PostAnalysis.model_validate(json.loads(response_text))
+
+    @staticmethod
+    def _to_outputs(analysis: PostAnalysis) -> Dict[str, Dict[str, Any]]:
+        return {
+            "themes": {
+                "primary_theme": analysis.primary_theme,
+                "theme_frequency": analysis.theme_frequency,
+                "professional_identity": analysis.professional_identity
+            },
+            "sentiment": analysis.sentiment.model_dump(),
+            "theme_insights": {
+                "primary": analysis.primary_theme,
+                "secondary": analysis.secondary_themes,
+                "frequency_breakdown": analysis.theme_frequency
+            }
+        }
@@ -3,6 +3,7 @@ from typing import List, Dict, Any
 from collections import Counter
 import re
 import json
+from ..governor.provider_governor import BackpressureError
 
 class SemanticProfileExtractor:
     """
@@ -27,6 +28,8 @@ class SemanticProfileExtractor:
         if self.llm_client and text.strip():
             try:
                 return await self._extract_themes_llm(safe_content)
+            except BackpressureError:
+                raise
             except Exception as e:
                 print(f"LLM Profile extraction failed: {e}. Falling back.")
         
@@ -83,7 +86,8 @@ class SemanticProfileExtractor:
         }}
         """
         
-        message = self.llm_client.messages.create(
+        message = await self.llm_client.messages.create(
+            call_site="profile_themes",
             model="claude-3-5-sonnet-20240620",
             max_tokens=400,
             messages=[{"role": "user", "content": prompt}]
@@ -113,6 +117,8 @@ class SemanticProfileExtractor:
         if self.llm_client and text.strip():
              try:
                  return await self._extract_sentiment_llm(safe_content)
+             except BackpressureError:
+                 raise
              except Exception as e:
                  print(f"LLM Sentiment extraction failed: {e}")
 
@@ -153,7 +159,8 @@ class SemanticProfileExtractor:
         }}
         """
         
-        message = self.llm_client.messages.create(
+        message = await self.llm_client.messages.create(
+            call_site="sentiment",
             model="claude-3-5-sonnet-20240620",
             max_tokens=400,
             messages=[{"role": "user", "content": prompt}]
@@ -2,6 +2,7 @@ from typing import List, Dict, Any
 from collections import Counter
 import re
 import json
+from ..governor.provider_governor import BackpressureError
 
 class ThemeIdentificationEngine:
     """
@@ -11,7 +12,7 @@ class ThemeIdentificationEngine:
     def __init__(self, llm_client=None):
         self.llm_client = llm_client
 
-    def identify_themes(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def identify_themes(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Identify and rank themes from content using frequency analysis or LLM.
         """
@@ -25,7 +26,9 @@ class ThemeIdentificationEngine:
         
         if self.llm_client and text.strip():
             try:
-                return self._identify_themes_llm(safe_content)
+                return await self._identify_themes_llm(safe_content)
+            except BackpressureError:
+                raise
             except Exception as e:
                 print(f"LLM Theme extraction failed: {e}. Falling back to frequency analysis.")
 
@@ -55,7 +58,7 @@ class ThemeIdentificationEngine:
             "frequency_breakdown": frequency_breakdown
         }
 
-    def _identify_themes_llm(self, posts: List[str]) -> Dict[str, Any]:
+    async def _identify_themes_llm(self, posts: List[str]) -> Dict[str, Any]:
         """
         Use LLM to identify themes from posts.
         """
@@ -85,7 +88,8 @@ class ThemeIdentificationEngine:
         }}
         """
         
-        message = self.llm_client.messages.create(
+        message = await self.llm_client.messages.create(
+            call_site="theme_identification",
             model="claude-3-5-sonnet-20240620",
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}]
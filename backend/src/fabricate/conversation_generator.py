@@ -1,5 +1,7 @@
 from typing import List, Dict, Any
 from .tonic_client import FabricateClient
+from ..llm.prompt_context import cached_system, profile_context
+from ..governor.provider_governor import BackpressureError
 
 class MockConversationGenerator:
     """
@@ -24,16 +26,10 @@ class MockConversationGenerator:
         role = profile_data.get('role', 'Professional')
         company = profile_data.get('company', 'their company')
         
-        # Try Tonic Fabricate first
+        # The profile lives in a shared, cacheable prefix; only the task differs
         prompt = f"""
         Generate 3 likely questions this person would ask in a "{meeting_context}" meeting.
         
-        Profile:
-        Name: {name}
-        Role: {role}
-        Company: {company}
-        Professional Identity: {profile_data.get('professional_identity', 'Unknown')}
-        
         Return valid JSON in this format:
         [
             {{
@@ -45,7 +41,8 @@ class MockConversationGenerator:
         ]
         """
         
-        fabricate_result = self.fabricate_client.generate(prompt)
+        # Try Tonic Fabricate first
+        fabricate_result = await self.fabricate_client.generate(profile_context(profile_data) + "\n" + prompt)
 
         if fabricate_result:
             # Tonic might return a list directly or a wrapped response depending on API
@@ -68,9 +65,11 @@ class MockConversationGenerator:
             ]
 
         try:
-            message = self.llm_client.messages.create(
+            message = await self.llm_client.messages.create(
+                call_site="likely_questions",
                 model="claude-sonnet-4-5",
                 max_tokens=1000,
+                system=cached_system(profile_data),
                 messages=[{"role": "user", "content": prompt}]
             )
             response_text = message.content[0].text
@@ -84,6 +83,8 @@ class MockConversationGenerator:
                  response_text = response_text.split("```")[1].split("```")[0]
                  
             return json.loads(response_text)
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Error generating questions with LLM: {e}")
             # Fallback
@@ -121,7 +122,7 @@ class MockConversationGenerator:
         """
         
         # Try Tonic Fabricate first
-        fabricate_result = self.fabricate_client.generate(prompt)
+        fabricate_result = await self.fabricate_client.generate(profile_context(profile_data) + "\n" + prompt)
 
         if fabricate_result:
              if isinstance(fabricate_result, list):
@@ -156,9 +157,11 @@ class MockConversationGenerator:
             ]
         
         try:
-            message = self.llm_client.messages.create(
+            message = await self.llm_client.messages.create(
+                call_site="pitch_simulation",
                 model="claude-sonnet-4-5",
                 max_tokens=1000,
+                system=cached_system(profile_data),
                 messages=[{"role": "user", "content": prompt}]
             )
             response_text = message.content[0].text
@@ -168,6 +171,8 @@ class MockConversationGenerator:
             elif "```" in response_text:
                  response_text = response_text.split("```")[1].split("```")[0]
             return json.loads(response_text)
+        except BackpressureError:
+            raise
         except Exception as e:
              print(f"Error generating simulation: {e}")
              return []
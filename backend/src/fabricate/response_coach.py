@@ -1,11 +1,23 @@
-from typing import List, Dict, Any
+import asyncio
+import json
+from typing import List, Dict, Any, Optional
+from ..governor.provider_governor import BackpressureError
+from ..llm.prompt_context import cached_system
+
+STRATEGY_LIST_FIELDS = ["emphasize", "avoid", "pivot_options", "follow_up_prepared"]
+
 
 class ResponseCoach:
     """
     Generate suggested responses and coaching tips using LLM.
+
+    By default all questions are coached in one structured request; any
+    question whose strategy is missing or malformed is retried on its own,
+    concurrently with the others.
     """
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, batched: bool = True):
         self.llm_client = llm_client
+        self.batched = batched
 
     async def generate_response_strategies(
         self,
@@ -28,55 +40,157 @@ class ResponseCoach:
                  } for q in questions
              ]
 
-        strategies = []
-        
         name = profile_data.get('name', 'They')
         role = profile_data.get('role', 'Professional')
+        question_texts = [q.get("question", "") for q in questions]
+
+        strategies: List[Optional[Dict[str, Any]]] = [None] * len(question_texts)
+        system = cached_system(profile_data)
+        if self.batched and len(question_texts) > 1:
+            strategies = await self._generate_batch(question_texts, name, role, system)
+
+        # Anything the batch did not cover is coached per question, concurrently
+        missing = [i for i, strategy in enumerate(strategies) if strategy is None]
+        if missing:
+            singles = await asyncio.gather(*(self._generate_single(question_texts[i], name, role, system) for i in missing))
+            for i, strategy in zip(missing, singles):
+                strategies[i] = strategy
+
+        return strategies
 
-        for question_obj in questions:
-            question_text = question_obj.get("question", "")
-            
-            prompt = f"""
-            You are an executive negotiation coach. 
-            The person asking the question is {name}, a {role}.
-            
-            The question is: "{question_text}"
-            
-            Generate a response strategy.
-            Return valid JSON:
+    async def _generate_batch(
+        self, question_texts: List[str], name: str, role: str, system: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        One request for every question. Returns a strategy per question, or
+        None where the model's item was missing or invalid.
+        """
+        numbered = "\n".join(f"{i + 1}. {text}" for i, text in enumerate(question_texts))
+        prompt = f"""
+        You are an executive negotiation coach.
+        The person asking the questions is {name}, a {role}.
+
+        The questions are:
+        {numbered}
+
+        Generate a response strategy for each question, in the same order.
+        Return a valid JSON array with exactly {len(question_texts)} objects:
+        [
             {{
-                "question": "{question_text}",
+                "index": 1,
+                "question": "The question text",
                 "response_framework": "Name of framework (e.g. STAR, PPP)",
                 "emphasize": ["Key point 1", "Key point 2"],
                 "avoid": ["Pitfall 1", "Pitfall 2"],
                 "pivot_options": ["Pivot phrase 1", "Pivot phrase 2"],
                 "follow_up_prepared": ["Follow up 1", "Follow up 2"]
             }}
-            """
-            
-            try:
-                message = self.llm_client.messages.create(
-                    model="claude-sonnet-4-5",
-                    max_tokens=800,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                response_text = message.content[0].text
-                import json
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0]
-                elif "```" in response_text:
-                     response_text = response_text.split("```")[1].split("```")[0]
-                strategies.append(json.loads(response_text))
-            except Exception as e:
-                print(f"Error generating strategy: {e}")
-                strategies.append({
-                    "question": question_text,
-                    "response_framework": "Direct Answer",
-                    "emphasize": ["Clarity"],
-                    "avoid": ["Ambiguity"],
-                    "pivot_options": [],
-                    "follow_up_prepared": []
-                })
+        ]
+        """
 
-        return strategies
+        results: List[Optional[Dict[str, Any]]] = [None] * len(question_texts)
+        try:
+            message = await self.llm_client.messages.create(
+                call_site="response_strategy_batch",
+                model="claude-sonnet-4-5",
+                max_tokens=min(8000, 600 * len(question_texts)),
+                system=system,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            items = self._parse_json(message.content[0].text)
+        except BackpressureError:
+            raise
+        except Exception as e:
+            print(f"Error generating batched strategies: {e}")
+            return results
+
+        if not isinstance(items, list):
+            print("Batched strategies were not a JSON array; coaching per question.")
+            return results
+
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            # Trust the model's index when it gives one, else its position
+            index = item.get("index")
+            index = index - 1 if isinstance(index, int) else position
+            if 0 <= index < len(results) and results[index] is None:
+                results[index] = self._validate_strategy(item, question_texts[index])
+
+        invalid = sum(1 for strategy in results if strategy is None)
+        if invalid:
+            print(f"{invalid} of {len(results)} batched strategies missing or invalid; retrying them individually.")
+        return results
+
+    async def _generate_single(self, question_text: str, name: str, role: str, system: List[Dict[str, Any]]) -> Dict[str, Any]:
+        prompt = f"""
+        You are an executive negotiation coach.
+        The person asking the question is {name}, a {role}.
+
+        The question is: "{question_text}"
+
+        Generate a response strategy.
+        Return valid JSON:
+        {{
+            "question": "{question_text}",
+            "response_framework": "Name of framework (e.g. STAR, PPP)",
+            "emphasize": ["Key point 1", "Key point 2"],
+            "avoid": ["Pitfall 1", "Pitfall 2"],
+            "pivot_options": ["Pivot phrase 1", "Pivot phrase 2"],
+            "follow_up_prepared": ["Follow up 1", "Follow up 2"]
+        }}
+        """
+
+        try:
+            message = await self.llm_client.messages.create(
+                call_site="response_strategy",
+                model="claude-sonnet-4-5",
+                max_tokens=800,
+                system=system,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            strategy = self._validate_strategy(self._parse_json(message.content[0].text), question_text)
+            if strategy is not None:
+                return strategy
+            print(f"Invalid strategy returned for: {question_text}")
+        except BackpressureError:
+            raise
+        except Exception as e:
+            print(f"Error generating strategy: {e}")
+
+        return {
+            "question": question_text,
+            "response_framework": "Direct Answer",
+            "emphasize": ["Clarity"],
+            "avoid": ["Ambiguity"],
+            "pivot_options": [],
+            "follow_up_prepared": []
+        }
+
+    @staticmethod
+    def _validate_strategy(item: Any, question_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Normalize one strategy to the expected shape, or None if unusable.
+        """
+        if not isinstance(item, dict):
+            return None
+        framework = item.get("response_framework")
+        if not isinstance(framework, str) or not framework.strip():
+            return None
+        strategy = {"question": question_text, "response_framework": framework}
+        for field in STRATEGY_LIST_FIELDS:
+            value = item.get(field, [])
+            if isinstance(value, str):
+                value = [value]
+            if not isinstance(value, list):
+                return None
+            strategy[field] = [str(v) for v in value]
+        return strategy
 
+    @staticmethod
+    def _parse_json(response_text: str) -> Any:
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0]
+        elif "```" in response_text:
+             response_text = response_text.split("```")[1].split("```")[0]
+        return json.loads(response_text)
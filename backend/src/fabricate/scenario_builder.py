@@ -1,46 +1,88 @@
-from typing import Dict, Any, List
+import asyncio
+import json
+from typing import Callable, Dict, Any, List, Optional
+from ..config.fabricate_config import SCENARIO_CONFIG
+from ..governor.provider_governor import BackpressureError
+from ..llm.json_stream import JSONArrayStreamParser, strip_code_fence
+from ..llm.prompt_context import cached_system
 
 class ConversationScenarioBuilder:
     """
     Build complete conversation scenarios for different contexts.
+
+    Scenarios are independent LLM calls, so they run concurrently (up to
+    SCENARIO_CONFIG["max_concurrency"]). A scenario that exceeds its
+    timeout is dropped and the others are still returned.
     """
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, config: Optional[Dict[str, Any]] = None):
         self.llm_client = llm_client
+        self.config = {**SCENARIO_CONFIG, **(config or {})}
 
     async def build_scenarios(
         self,
         profile_data: Dict[str, Any],
-        meeting_contexts: List[str] = None
+        meeting_contexts: List[str] = None,
+        meeting_context: Optional[str] = None,
+        relevant_only: Optional[bool] = None,
+        on_turn: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
-        Build multiple conversation scenarios.
+        Build multiple conversation scenarios. With `relevant_only`, only the
+        contexts matching `meeting_context` are built. `on_turn(context, turn)`
+        receives each sample dialogue turn as soon as it is generated.
         """
-        contexts = meeting_contexts or [
-            "first_meeting",
-            "pitch",
-            "advice_seeking",
-            "partnership"
-        ]
+        if relevant_only is None:
+            relevant_only = self.config["relevant_only"]
+        contexts = meeting_contexts or (
+            self.select_contexts(meeting_context) if relevant_only else self.config["contexts"]
+        )
+
+        slots = asyncio.Semaphore(max(1, self.config["max_concurrency"]))
+
+        async def build(context: str) -> Optional[Dict[str, Any]]:
+            async with slots:
+                try:
+                    return await asyncio.wait_for(
+                        self._build_single_scenario(profile_data, context, on_turn),
+                        timeout=self.config["scenario_timeout"]
+                    )
+                except asyncio.TimeoutError:
+                    print(f"Scenario '{context}' timed out after {self.config['scenario_timeout']}s; skipping it.")
+                    return None
 
-        scenarios = {}
+        tasks = [asyncio.create_task(build(context)) for context in contexts]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        for context in contexts:
-            scenario = await self._build_single_scenario(profile_data, context)
-            scenarios[context] = scenario
+        return {context: scenario for context, scenario in zip(contexts, results) if scenario is not None}
 
-        return scenarios
+    def select_contexts(self, meeting_context: Optional[str]) -> List[str]:
+        """
+        Contexts whose keywords appear in the meeting context, in the
+        configured order.
+        """
+        text = (meeting_context or "").lower()
+        keywords = self.config["context_keywords"]
+        selected = [
+            context for context in self.config["contexts"]
+            if any(keyword in text for keyword in keywords.get(context, []))
+        ]
+        return selected or list(self.config["default_contexts"])
 
     async def _build_single_scenario(
         self,
         profile_data: Dict[str, Any],
-        context: str
+        context: str,
+        on_turn: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Build a single conversation scenario using LLM.
         """
         name = profile_data.get('name', 'They')
         role = profile_data.get('role', 'Professional')
-        company = profile_data.get('company', 'their company')
         
         if not self.llm_client:
             # Fallback
@@ -57,10 +99,7 @@ class ConversationScenarioBuilder:
             }
 
         prompt = f"""
-        Generate a conversation scenario for a "{context}" meeting with:
-        Name: {name}
-        Role: {role}
-        Company: {company}
+        Generate a conversation scenario for a "{context}" meeting with {name}.
         
         Return valid JSON:
         {{
@@ -76,19 +115,26 @@ class ConversationScenarioBuilder:
         }}
         """
 
+        request = {
+            "call_site": "scenario",
+            "model": "claude-sonnet-4-5",
+            "max_tokens": 1000,
+            "system": cached_system(profile_data),
+            "messages": [{"role": "user", "content": prompt}]
+        }
         try:
-            message = self.llm_client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            response_text = message.content[0].text
-            import json
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                 response_text = response_text.split("```")[1].split("```")[0]
-            return json.loads(response_text)
+            if on_turn is not None and hasattr(self.llm_client.messages, "stream_text"):
+                parser = JSONArrayStreamParser(array_key="sample_dialogue")
+                async for chunk in self.llm_client.messages.stream_text(**request):
+                    for turn in parser.feed(chunk):
+                        on_turn(context, turn)
+                response_text = parser.text
+            else:
+                message = await self.llm_client.messages.create(**request)
+                response_text = message.content[0].text
+            return json.loads(strip_code_fence(response_text))
+        except BackpressureError:
+            raise
         except Exception as e:
             import traceback
             print(f"Error generating scenario for {context}: {e}")
@@ -1,6 +1,8 @@
+import asyncio
 import requests
 from typing import Dict, Any, List, Optional
 from src.config.fabricate_config import FABRICATE_CONFIG
+from src.governor.provider_governor import governor, BackpressureError
 
 class FabricateClient:
     """
@@ -15,7 +17,7 @@ class FabricateClient:
         if not self.api_key:
             print("Warning: TONIC_FABRICATE_API_KEY not found in environment variables.")
 
-    def generate(self, prompt: str) -> List[Dict[str, Any]]:
+    async def generate(self, prompt: str) -> List[Dict[str, Any]]:
         """
         Send a generation request to Tonic Fabricate.
         """
@@ -35,12 +37,15 @@ class FabricateClient:
         }
         
         try:
-            response = requests.post(
-                self.endpoint,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            # requests is blocking, so the call runs in a worker thread
+            async with governor.limit("fabricate"):
+                response = await asyncio.to_thread(
+                    requests.post,
+                    self.endpoint,
+                    headers=headers,
+                    json=payload,
+                    timeout=30
+                )
             
             if response.status_code == 200:
                 return response.json()
@@ -48,6 +53,8 @@ class FabricateClient:
                 print(f"Error calling Tonic Fabricate API: {response.status_code} - {response.text}")
                 return []
                 
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Exception calling Tonic Fabricate API: {e}")
             return []
@@ -0,0 +1,345 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional
+from ..config.anthropic_config import ANTHROPIC_CONFIG
+from ..config.agentql_config import AGENTQL_CONFIG
+from ..config.browser_config import BROWSER_CONFIG
+from ..config.elevenlabs_config import ELEVENLABS_CONFIG
+from ..config.fabricate_config import FABRICATE_CONFIG
+from ..config.freepik_config import FREEPIK_CONFIG
+from ..config.yutori_config import YUTORI_CONFIG
+
+_SAMPLES_PER_PROVIDER = 500
+
+# Limits per provider, each defined next to the rest of its config
+PROVIDER_LIMITS: Dict[str, Dict[str, Any]] = {
+    "anthropic": ANTHROPIC_CONFIG["rate_limit"],
+    "elevenlabs": ELEVENLABS_CONFIG["rate_limit"],
+    "yutori": YUTORI_CONFIG["rate_limit"],
+    "fabricate": FABRICATE_CONFIG["rate_limit"],
+    "freepik": FREEPIK_CONFIG["rate_limit"],
+    "agentql": AGENTQL_CONFIG["rate_limit"],
+    **BROWSER_CONFIG["site_rate_limits"],
+}
+
+
+class BackpressureError(Exception):
+    """
+    Raised when a provider's queue is full or a caller would wait longer
+    than the provider's max_wait. `retry_after` is a hint in seconds.
+    """
+
+    def __init__(self, provider: str, retry_after: float, reason: str):
+        self.provider = provider
+        self.retry_after = max(1, int(retry_after + 0.999))
+        self.reason = reason
+        super().__init__(f"{provider} is at capacity ({reason}); retry in {self.retry_after}s")
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket. Each caller takes a token up front and
+    is told how long to wait for it, so waiters are served in arrival
+    order. Thread-safe, so blocking and async callers can share it.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float], burst: int):
+        self.rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_delay: float) -> Optional[float]:
+        """
+        Take a token and return the seconds to wait before using it, or None
+        (taking nothing) if that wait would exceed `max_delay`.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if delay > max_delay:
+                return None
+            self._tokens -= 1
+            return delay
+
+    def time_until_available(self) -> float:
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            tokens = min(self.capacity, self._tokens + (time.monotonic() - self._updated) * self.rate)
+        return max(0.0, (1 - tokens) / self.rate)
+
+
+class _SlotWaiter:
+    def __init__(self, wake):
+        self.wake = wake
+        self.granted = False
+
+
+class SharedSlots:
+    """
+    In-flight cap shared by async and blocking callers, granted in arrival
+    order. A released slot is handed straight to the oldest waiter, woken
+    on its own event loop or thread. Waiting never ties up a worker thread.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()
+
+    def _take(self) -> bool:
+        # Caller holds the lock; queued waiters go first
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            return True
+        return False
+
+    async def acquire(self, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        with self._lock:
+            if self._take():
+                return True
+            waiter = _SlotWaiter(wake)
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._abandon(waiter, keep=True)
+        except BaseException:
+            self._abandon(waiter, keep=False)
+            raise
+
+    def acquire_blocking(self, timeout: float) -> bool:
+        event = threading.Event()
+        with self._lock:
+            if self._take():
+                return True
+            waiter = _SlotWaiter(event.set)
+            self._waiters.append(waiter)
+        if event.wait(timeout):
+            return True
+        return self._abandon(waiter, keep=True)
+
+    def release(self):
+        with self._lock:
+            self._release_locked()
+
+    def _release_locked(self):
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.granted = True  # The slot moves over; in_use is unchanged
+            waiter.wake()
+        else:
+            self.in_use -= 1
+
+    def _abandon(self, waiter: _SlotWaiter, keep: bool) -> bool:
+        """
+        Stop waiting. A slot granted in the meantime is kept when `keep`,
+        otherwise passed on. Returns whether the caller holds a slot.
+        """
+        with self._lock:
+            if not waiter.granted:
+                self._waiters.remove(waiter)
+                return False
+            if keep:
+                return True
+            self._release_locked()
+            return False
+
+
+class ProviderLimiter:
+    """
+    Rate limit plus in-flight cap for one provider, with wait-time metrics.
+    """
+
+    def __init__(self, name: str, config: Dict[str, Any]):
+        self.name = name
+        self.config = config
+        self.bucket = TokenBucket(config.get("requests_per_minute"), config.get("burst", 1))
+        self.max_in_flight = config.get("max_in_flight", 1)
+        self.max_wait = config.get("max_wait", 30.0)
+        self.max_queue = config.get("max_queue", 100)
+        # One cap for async and blocking (requests-based) callers alike
+        self._slots = SharedSlots(self.max_in_flight)
+        self._counter_lock = threading.Lock()
+        self._waits_ms: deque = deque(maxlen=_SAMPLES_PER_PROVIDER)
+        self.waiting = 0
+        self.in_flight = 0
+        self.stats = {"acquired": 0, "rejected_queue_full": 0, "rejected_timeout": 0}
+
+    @asynccontextmanager
+    async def acquire(self):
+        self._join_queue()
+        started = time.monotonic()
+        try:
+            if not await self._slots.acquire(self.max_wait):
+                self._count("rejected_timeout")
+                raise BackpressureError(self.name, self._retry_after(), "max in flight")
+
+            delay = self.bucket.reserve(self.max_wait - (time.monotonic() - started))
+            if delay is None:
+                self._slots.release()
+                self._count("rejected_timeout")
+                raise BackpressureError(self.name, self.bucket.time_until_available(), "rate limit")
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    self._slots.release()
+                    raise
+        finally:
+            self._leave_queue()
+
+        self._record(started)
+        try:
+            yield
+        finally:
+            self._finished()
+            self._slots.release()
+
+    @contextmanager
+    def acquire_blocking(self):
+        """
+        Same limits for synchronous callers; blocks the calling thread, so
+        it must run in a worker thread (asyncio.to_thread), never on the
+        event loop.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(f"limit_blocking('{self.name}') called on the event loop; use limit() instead")
+
+        self._join_queue()
+        started = time.monotonic()
+        try:
+            if not self._slots.acquire_blocking(self.max_wait):
+                self._count("rejected_timeout")
+                raise BackpressureError(self.name, self._retry_after(), "max in flight")
+
+            delay = self.bucket.reserve(self.max_wait - (time.monotonic() - started))
+            if delay is None:
+                self._slots.release()
+                self._count("rejected_timeout")
+                raise BackpressureError(self.name, self.bucket.time_until_available(), "rate limit")
+            if delay:
+                try:
+                    time.sleep(delay)
+                except BaseException:
+                    self._slots.release()
+                    raise
+        finally:
+            self._leave_queue()
+
+        self._record(started)
+        try:
+            yield
+        finally:
+            self._finished()
+            self._slots.release()
+
+    def _join_queue(self):
+        # Async and blocking callers share the queue bound and counters
+        with self._counter_lock:
+            if self.waiting >= self.max_queue:
+                self.stats["rejected_queue_full"] += 1
+                raise BackpressureError(self.name, self._retry_after(), "queue full")
+            self.waiting += 1
+
+    def _leave_queue(self):
+        with self._counter_lock:
+            self.waiting -= 1
+
+    def _record(self, started: float):
+        # Blocking callers update these from worker threads
+        with self._counter_lock:
+            self.stats["acquired"] += 1
+            self.in_flight += 1
+            self._waits_ms.append(round((time.monotonic() - started) * 1000, 1))
+
+    def _finished(self):
+        with self._counter_lock:
+            self.in_flight -= 1
+
+    def _count(self, stat: str):
+        with self._counter_lock:
+            self.stats[stat] += 1
+
+    def _retry_after(self) -> float:
+        # Rough: the queue drains at the configured rate
+        rate = self.bucket.rate or self.max_in_flight
+        return max(1.0, self.waiting / rate)
+
+    def summary(self) -> Dict[str, Any]:
+        waits = sorted(self._waits_ms)
+        return {
+            **self.stats,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests_per_minute": self.config.get("requests_per_minute"),
+            "wait_p50_ms": self._percentile(waits, 0.5),
+            "wait_p90_ms": self._percentile(waits, 0.9),
+            "wait_max_ms": waits[-1] if waits else 0,
+        }
+
+    @staticmethod
+    def _percentile(values: List[float], pct: float) -> float:
+        if not values:
+            return 0
+        index = min(len(values) - 1, int(round(pct * (len(values) - 1))))
+        return values[index]
+
+
+class ProviderGovernor:
+    """
+    Central registry of per-provider limiters. Every outbound call to a
+    rate-limited provider goes through `limit(provider)` (or
+    `limit_blocking` from synchronous code running in a worker thread).
+    Unknown providers pass straight through.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None):
+        limits = PROVIDER_LIMITS if limits is None else limits
+        self.limiters = {name: ProviderLimiter(name, config) for name, config in limits.items()}
+
+    def limit(self, provider: Optional[str]):
+        limiter = self.limiters.get(provider) if provider else None
+        return limiter.acquire() if limiter else _unlimited()
+
+    def limit_blocking(self, provider: Optional[str]):
+        limiter = self.limiters.get(provider) if provider else None
+        return limiter.acquire_blocking() if limiter else _unlimited_blocking()
+
+    def summary(self) -> Dict[str, Any]:
+        return {name: limiter.summary() for name, limiter in self.limiters.items()}
+
+
+@asynccontextmanager
+async def _unlimited():
+    yield
+
+
+@contextmanager
+def _unlimited_blocking():
+    yield
+
+
+governor = ProviderGovernor()
@@ -0,0 +1,191 @@
+import asyncio
+import itertools
+from collections import Counter
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from ..config.jobs_config import JOBS_CONFIG
+from .job_store import JobStore, RUNNING, COMPLETED, FAILED, CANCELLED, FINISHED_STATUSES
+
+
+class QueueFullError(Exception):
+    """
+    Raised when a job is submitted while the queue is at capacity.
+    """
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Briefing queue is full; retry in {retry_after}s")
+
+
+class BriefingJobQueue:
+    """
+    In-process priority queue drained by a bounded pool of workers.
+
+    Jobs are persisted in a JobStore, so status survives the request that
+    submitted them and unfinished jobs are picked up again after a
+    restart. Lower priority numbers run first; ties run in submission
+    order. `handler(payload)` does the actual work.
+    """
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Awaitable[Any]], store: Optional[JobStore] = None, config: Optional[Dict[str, Any]] = None):
+        self.config = {**JOBS_CONFIG, **(config or {})}
+        self.store = store or JobStore(self.config["path"])
+        self.handler = handler
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._order = itertools.count()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._finished_events: Dict[str, asyncio.Event] = {}
+        self._waiters: Counter = Counter()
+        # Jobs waiting for a worker. A job cancelled while queued leaves
+        # this set at once, though its queue entry lingers until dequeued.
+        self._queued_ids: Set[str] = set()
+        self._workers = []
+        # Moving average of job run time, used for Retry-After hints
+        self._avg_duration = 60.0
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+
+    async def start(self):
+        if self._workers:
+            return
+        await asyncio.to_thread(self.store.purge_finished, self.config["retention"])
+
+        # Jobs interrupted by a restart run again
+        for job in await asyncio.to_thread(self.store.unfinished):
+            if job["status"] == RUNNING:
+                await asyncio.to_thread(self.store.requeue, job["id"])
+            self._enqueue(job)
+
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"briefing-worker-{i}")
+            for i in range(self.config["workers"])
+        ]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.store.close()
+
+    async def submit(self, payload: Dict[str, Any], priority: Optional[int] = None) -> Dict[str, Any]:
+        if self._queued() >= self.config["max_queued"]:
+            self.stats["rejected"] += 1
+            raise QueueFullError(self.retry_after())
+
+        if priority is None:
+            priority = self.config["default_priority"]
+        job = await asyncio.to_thread(self.store.create, payload, priority)
+        self._enqueue(job)
+        self.stats["submitted"] += 1
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Long-poll: return the job once it finishes or after `timeout`
+        seconds, whichever comes first.
+        """
+        # Register before reading so a job finishing in between still wakes us
+        event = self._finished_events.setdefault(job_id, asyncio.Event())
+        self._waiters[job_id] += 1
+        try:
+            job = await self.get(job_id)
+            if job is None or job["status"] in FINISHED_STATUSES or timeout <= 0:
+                return job
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(timeout, self.config["max_wait"]))
+            except asyncio.TimeoutError:
+                pass
+            return await self.get(job_id)
+        finally:
+            # The last waiter out drops the event, however it left
+            self._waiters[job_id] -= 1
+            if self._waiters[job_id] <= 0:
+                del self._waiters[job_id]
+                if self._finished_events.get(job_id) is event:
+                    del self._finished_events[job_id]
+
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = await self.get(job_id)
+        if job is None or job["status"] in FINISHED_STATUSES:
+            return job
+
+        if job_id in self._running:
+            self._running[job_id].cancel()
+            return await self.wait(job_id, timeout=5.0)
+
+        # Still queued: the worker that dequeues it will skip it
+        if await asyncio.to_thread(self.store.finish, job_id, CANCELLED, None, "Cancelled before start"):
+            self.stats["cancelled"] += 1
+            self._queued_ids.discard(job_id)
+            self._notify(job_id)
+        return await self.get(job_id)
+
+    def retry_after(self) -> int:
+        backlog = self._queued() / max(1, self.config["workers"])
+        return max(1, int(backlog * self._avg_duration))
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": self._queued(),
+            "running": len(self._running),
+            "workers": len(self._workers),
+            "avg_duration_s": round(self._avg_duration, 1),
+        }
+
+    def _queued(self) -> int:
+        return len(self._queued_ids)
+
+    def _enqueue(self, job: Dict[str, Any]):
+        self._queued_ids.add(job["id"])
+        self._queue.put_nowait((job["priority"], next(self._order), job["id"]))
+
+    def _notify(self, job_id: str):
+        event = self._finished_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _worker(self):
+        while True:
+            _, _, job_id = await self._queue.get()
+            self._queued_ids.discard(job_id)
+            try:
+                if not await asyncio.to_thread(self.store.mark_running, job_id):
+                    continue
+                job = await self.get(job_id)
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Dict[str, Any]):
+        job_id = job["id"]
+        started = time.monotonic()
+        task = asyncio.create_task(self.handler(job["payload"]), name=f"briefing-job-{job_id}")
+        self._running[job_id] = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # Worker shutdown: stop the job and leave it queued for the next process
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            self.store.requeue(job_id)
+            raise
+        finally:
+            self._running.pop(job_id, None)
+
+        if task.cancelled():
+            status, result, error = CANCELLED, None, "Cancelled while running"
+        elif task.exception() is not None:
+            exc = task.exception()
+            status, result, error = FAILED, None, str(exc) or exc.__class__.__name__
+            print(f"Briefing job {job_id} failed: {error}")
+        else:
+            status, result, error = COMPLETED, task.result(), None
+            self._avg_duration = 0.8 * self._avg_duration + 0.2 * (time.monotonic() - started)
+
+        await asyncio.to_thread(self.store.finish, job_id, status, result, error)
+        self.stats[status] += 1
+        self._notify(job_id)
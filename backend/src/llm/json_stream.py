@@ -0,0 +1,106 @@
+import json
+from typing import Any, List, Optional
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser for LLM output that is (or contains) a JSON array.
+
+    Text is fed in arbitrary chunks; `feed` returns each element of the
+    target array as soon as its closing token arrives. The target is the
+    top-level array, or with `array_key` the array stored under that key
+    of the top-level object (e.g. "violations"). Anything outside the JSON
+    document, such as a ```json fence, is ignored. The whole text stays in
+    `text` for parsing the complete document at the end.
+    """
+
+    def __init__(self, array_key: Optional[str] = None):
+        self.array_key = array_key
+        self.text = ""
+        self._pos = 0
+        # One entry per open container: ["{", last key] or ["[", None]
+        self._stack: List[list] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._target_depth: Optional[int] = None
+        self._element_start: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        self.text += chunk
+        items = []
+        text = self.text
+        while self._pos < len(text) and not self._done:
+            char = text[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start:self._pos]
+            elif char == '"':
+                if self._stack:
+                    self._in_string = True
+                    self._string_start = self._pos + 1
+            elif char == ":" and self._stack and self._stack[-1][0] == "{":
+                self._stack[-1][1] = self._last_string
+            elif char in "{[":
+                if self._stack or (char == "[") == (self.array_key is None):
+                    self._open(char)
+            elif char in "}]" and self._stack:
+                # A scalar last element ends at the target's closing bracket
+                items.extend(self._close_element(self._pos))
+                self._stack.pop()
+                if not self._stack or (self._target_depth is not None and len(self._stack) < self._target_depth):
+                    self._done = True
+                else:
+                    # An object or array element is complete at its own closing bracket
+                    items.extend(self._close_element(self._pos + 1))
+            elif char == "," and self._target_depth is not None and len(self._stack) == self._target_depth:
+                items.extend(self._close_element(self._pos))
+                self._element_start = self._pos + 1
+            self._pos += 1
+        return items
+
+    def _open(self, char: str):
+        is_target = (
+            char == "["
+            and self._target_depth is None
+            and (
+                (self.array_key is None and not self._stack)
+                or (self.array_key is not None and len(self._stack) == 1
+                    and self._stack[0][0] == "{" and self._stack[0][1] == self.array_key)
+            )
+        )
+        self._stack.append([char, None])
+        if is_target:
+            self._target_depth = len(self._stack)
+            self._element_start = self._pos + 1
+
+    def _close_element(self, end: int) -> List[Any]:
+        if self._target_depth is None or len(self._stack) != self._target_depth or self._element_start is None:
+            return []
+        raw = self.text[self._element_start:end].strip()
+        self._element_start = None
+        if not raw:
+            return []
+        try:
+            return [json.loads(raw)]
+        except json.JSONDecodeError:
+            # A malformed element is skipped; the final parse still sees it
+            return []
+
+
+def strip_code_fence(response_text: str) -> str:
+    """
+    The JSON document inside a ```json (or bare ```) fence, if any.
+    """
+    if "```json" in response_text:
+        return response_text.split("```json")[1].split("```")[0]
+    if "```" in response_text:
+        return response_text.split("```")[1].split("```")[0]
+    return response_text
@@ -0,0 +1,80 @@
+from typing import Optional
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+# Newer anthropic releases ship on httpx2 and reject plain httpx objects
+try:
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+from ..config.anthropic_config import ANTHROPIC_CONFIG, LLM_CACHE_CONFIG
+from .response_cache import CachedLLMClient, LLMResponseCache
+
+_shared_client: Optional[CachedLLMClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_llm_client(config: Optional[dict] = None) -> AsyncAnthropic:
+    """
+    Build an AsyncAnthropic client on a bounded, keep-alive connection pool.
+    """
+    config = {**ANTHROPIC_CONFIG, **(config or {})}
+
+    http2 = config.get("http2", True) and _http2_available()
+    if config.get("http2", True) and not http2:
+        print("Warning: h2 not installed, Anthropic client falling back to HTTP/1.1.")
+
+    http_client = DefaultAsyncHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=config["max_connections"],
+            max_keepalive_connections=config["max_keepalive_connections"],
+            keepalive_expiry=config["keepalive_expiry"],
+        ),
+        timeout=httpx.Timeout(config["timeout"], connect=config["connect_timeout"]),
+    )
+    return AsyncAnthropic(
+        api_key=config.get("api_key"),
+        http_client=http_client,
+        max_retries=config["max_retries"],
+    )
+
+
+def get_llm_client() -> Optional[CachedLLMClient]:
+    """
+    Return the process-wide async client, creating it on first use.
+    Responses are served from the LLM response cache when it is enabled.
+    Returns None if the client cannot be initialized.
+    """
+    global _shared_client
+    if _shared_client is None:
+        try:
+            client = create_llm_client()
+        except Exception as e:
+            print(f"Warning: Failed to initialize Anthropic client: {e}")
+            return None
+
+        cache = None
+        if LLM_CACHE_CONFIG["enabled"]:
+            try:
+                cache = LLMResponseCache()
+            except Exception as e:
+                print(f"Warning: LLM response cache unavailable: {e}")
+        _shared_client = CachedLLMClient(client, cache)
+    return _shared_client
+
+
+async def close_llm_client():
+    """
+    Close the shared client and its connection pool.
+    """
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+from ..config.anthropic_config import ANTHROPIC_CONFIG
+
+MAX_CONTEXT_POSTS = 20
+
+
+def profile_context(profile_data: Dict[str, Any]) -> str:
+    """
+    The profile block shared by every Phase 5 prompt. It must render
+    byte-for-byte the same for one person whichever generator asks, or the
+    provider cannot reuse its cached prefix.
+    """
+    posts = [
+        p.get("content", "") if isinstance(p, dict) else str(p)
+        for p in profile_data.get("posts") or []
+        if p
+    ][:MAX_CONTEXT_POSTS]
+
+    lines = [
+        "You are helping someone prepare for a meeting with the person profiled below.",
+        "Ground every answer in this profile.",
+        "",
+        "Profile:",
+        f"Name: {profile_data.get('name') or 'Unknown'}",
+        f"Role: {profile_data.get('role') or 'Professional'}",
+        f"Company: {profile_data.get('company') or 'their company'}",
+        f"Professional Identity: {profile_data.get('professional_identity') or 'Unknown'}",
+    ]
+    if posts:
+        lines += ["", "Recent posts:", "\n---\n".join(posts)]
+    return "\n".join(lines)
+
+
+def cached_system(profile_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    System blocks carrying the profile context, marked as a prompt-cache
+    breakpoint. Prefixes shorter than the model's minimum cacheable length
+    are simply sent uncached.
+    """
+    block = {"type": "text", "text": profile_context(profile_data)}
+    if ANTHROPIC_CONFIG["prompt_caching"]:
+        block["cache_control"] = {"type": "ephemeral"}
+    return [block]
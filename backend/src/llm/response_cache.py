@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import AsyncIterator, Dict, Any, Optional
+from ..config.anthropic_config import LLM_CACHE_CONFIG
+from ..governor.provider_governor import governor
+from ..storage.lru_cache import LRUCache
+from ..storage.sqlite_store import SQLiteKVStore
+from .usage_meter import UsageMeter, usage_meter
+
+
+class _TextBlock:
+    def __init__(self, text: str):
+        self.type = "text"
+        self.text = text
+
+
+class CachedMessage:
+    """
+    Minimal stand-in for an Anthropic Message rebuilt from the cache.
+    Call sites only read `content[0].text`, `stop_reason` and `usage`.
+    """
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.model = payload.get("model")
+        self.content = [_TextBlock(payload.get("text", ""))]
+        self.stop_reason = payload.get("stop_reason")
+        self.usage = None
+        self.from_cache = True
+
+
+class LLMResponseCache:
+    """
+    Content-addressed response cache: LRU memory tier over a SQLite tier.
+    Keys are sha256(model, max_tokens, request body).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = {**LLM_CACHE_CONFIG, **(config or {})}
+        self.memory = LRUCache(self.config["memory_entries"])
+        self.disk = SQLiteKVStore(self.config["path"], table="llm_responses")
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        # Only fields that change the completion take part in the key
+        keyed = {k: v for k, v in request.items() if k not in ("stream", "timeout", "extra_headers")}
+        prompt_hash = hashlib.sha256(json.dumps(keyed, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{request.get('model')}:{request.get('max_tokens')}:{prompt_hash}"
+
+    def ttl_for(self, call_site: Optional[str]) -> float:
+        ttls = self.config["ttls"]
+        return ttls.get(call_site or "default", ttls["default"])
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        payload = self.memory.get(key)
+        if payload is not None:
+            self.stats["memory_hits"] += 1
+            return payload
+
+        entry = await asyncio.to_thread(self.disk.get_entry, key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        payload, _, expires_at = entry
+        self.stats["disk_hits"] += 1
+        self.memory.set(key, payload, expires_at=expires_at)
+        return payload
+
+    async def set(self, key: str, payload: Dict[str, Any], ttl: float):
+        self.memory.set(key, payload, ttl=ttl)
+        await asyncio.to_thread(self.disk.set, key, payload, ttl)
+        self.stats["writes"] += 1
+
+    def close(self):
+        self.disk.close()
+
+
+class _CachedMessages:
+    def __init__(self, client, cache: Optional[LLMResponseCache], meter: UsageMeter):
+        self._client = client
+        self._cache = cache
+        self._meter = meter
+
+    async def create(self, call_site: Optional[str] = None, **kwargs):
+        """
+        Same contract as AsyncAnthropic.messages.create, plus `call_site`
+        which selects the cache TTL.
+        """
+        if self._cache is None:
+            return await self._create(call_site, kwargs)
+
+        key = self._cache.make_key(kwargs)
+        payload = await self._cache.get(key)
+        if payload is not None:
+            return CachedMessage(payload)
+
+        message = await self._create(call_site, kwargs)
+        await self._store(key, message, call_site)
+        return message
+
+    async def stream_text(self, call_site: Optional[str] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Like `create`, but yields the response text as it is generated. A
+        cache hit yields the whole text at once; a completed stream is cached
+        like a `create` response.
+        """
+        key = None
+        if self._cache is not None:
+            key = self._cache.make_key(kwargs)
+            payload = await self._cache.get(key)
+            if payload is not None:
+                yield payload.get("text", "")
+                return
+
+        async with governor.limit("anthropic"):
+            start = time.perf_counter()
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
+        self._meter.record(call_site, getattr(message, "usage", None), time.perf_counter() - start)
+        if key is not None:
+            await self._store(key, message, call_site)
+
+    async def _store(self, key: str, message, call_site: Optional[str]):
+        # Truncated or non-text responses are not worth replaying
+        text_blocks = [block.text for block in message.content if getattr(block, "type", None) == "text"]
+        if message.stop_reason == "end_turn" and text_blocks:
+            await self._cache.set(
+                key,
+                {"model": message.model, "text": "".join(text_blocks), "stop_reason": message.stop_reason},
+                self._cache.ttl_for(call_site),
+            )
+
+    async def _create(self, call_site: Optional[str], kwargs: Dict[str, Any]):
+        # Cache hits never reach the provider, so only misses are rate limited
+        async with governor.limit("anthropic"):
+            start = time.perf_counter()
+            message = await self._client.messages.create(**kwargs)
+        self._meter.record(call_site, getattr(message, "usage", None), time.perf_counter() - start)
+        return message
+
+    def __getattr__(self, name):
+        return getattr(self._client.messages, name)
+
+
+class CachedLLMClient:
+    """
+    Wraps an AsyncAnthropic client so messages.create is served from the
+    response cache when possible and otherwise goes through the provider
+    governor. Everything else passes through. With cache=None the wrapper
+    only strips `call_site` and applies the governor. Token usage of
+    provider calls, including prompt-cache reads, is recorded in `meter`.
+    """
+
+    def __init__(self, client, cache: Optional[LLMResponseCache], meter: UsageMeter = usage_meter):
+        self._client = client
+        self.cache = cache
+        self.meter = meter
+        self.messages = _CachedMessages(client, cache, meter)
+
+    async def close(self):
+        if self.cache is not None:
+            self.cache.close()
+        await self._client.close()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
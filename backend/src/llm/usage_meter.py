@@ -0,0 +1,49 @@
+from typing import Any, Dict, Optional
+
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+
+class UsageMeter:
+    """
+    Token usage and latency per call site, for provider calls only
+    (response-cache hits carry no usage).
+
+    `cache_read_ratio` is the share of prompt tokens served from the
+    provider's prompt cache, which are billed and processed at a fraction of
+    the uncached rate.
+    """
+
+    def __init__(self):
+        self.sites: Dict[str, Dict[str, float]] = {}
+
+    def record(self, call_site: Optional[str], usage: Any, elapsed: float):
+        site = self.sites.setdefault(call_site or "default", {
+            "calls": 0, "latency_total_ms": 0.0, **{field: 0 for field in USAGE_FIELDS}
+        })
+        site["calls"] += 1
+        site["latency_total_ms"] += elapsed * 1000
+        for field in USAGE_FIELDS:
+            site[field] += getattr(usage, field, None) or 0
+
+    @staticmethod
+    def _describe(site: Dict[str, float]) -> Dict[str, Any]:
+        prompt_tokens = site["input_tokens"] + site["cache_read_input_tokens"] + site["cache_creation_input_tokens"]
+        return {
+            **{field: site[field] for field in ("calls", *USAGE_FIELDS)},
+            "cache_read_ratio": round(site["cache_read_input_tokens"] / prompt_tokens, 3) if prompt_tokens else 0.0,
+            "avg_latency_ms": round(site["latency_total_ms"] / site["calls"], 1) if site["calls"] else 0.0
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        totals = {"calls": 0, "latency_total_ms": 0.0, **{field: 0 for field in USAGE_FIELDS}}
+        for site in self.sites.values():
+            for field in totals:
+                totals[field] += site[field]
+        return {
+            "total": self._describe(totals),
+            "call_sites": {name: self._describe(site) for name, site in sorted(self.sites.items())}
+        }
+
+
+usage_meter = UsageMeter()
+
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class BackgroundRefresher:
+    """
+    Runs cache refreshes in the background, at most one per key at a time.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.stats = {"scheduled": 0, "deduplicated": 0, "completed": 0, "failed": 0}
+
+    def schedule(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start `refresh()` unless a refresh for `key` is already running.
+        Returns True if a new refresh was started.
+        """
+        if key in self._tasks:
+            self.stats["deduplicated"] += 1
+            return False
+
+        task = asyncio.create_task(self._run(key, refresh), name=f"refresh:{key}")
+        self._tasks[key] = task
+        self.stats["scheduled"] += 1
+        return True
+
+    async def _run(self, key: str, refresh: Callable[[], Awaitable[Any]]):
+        try:
+            await refresh()
+            self.stats["completed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"Background refresh for {key} failed: {e}")
+        finally:
+            self._tasks.pop(key, None)
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def shutdown(self):
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Tasks cancelled before they started never reach their cleanup
+        self._tasks.clear()
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+
+async def run_batch(
+    items: List[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    concurrency: int
+) -> AsyncIterator[Tuple[int, Any, Optional[BaseException]]]:
+    """
+    Run `worker(item)` for every item with at most `concurrency` in flight
+    and yield (index, result, error) in completion order. Exactly one of
+    result and error is set. Closing the iterator early cancels whatever
+    is still running.
+    """
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(index: int, item: Any):
+        async with slots:
+            try:
+                return index, await worker(item), None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                return index, None, e
+
+    tasks = [asyncio.create_task(run_one(i, item)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,365 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional
+
+from ..config.pipeline_config import PIPELINE_CONFIG
+from ..agents.linkedin_browser import LinkedInBrowserAgent
+from ..agents.twitter_browser import TwitterBrowserAgent
+from ..agents.company_researcher import CompanyResearcher
+from ..extractors.profile_extractor import SemanticProfileExtractor
+from ..extractors.theme_engine import ThemeIdentificationEngine
+from ..extractors.post_analyzer import PostAnalyzer
+from ..extractors.data_transformer import StructuredDataTransformer
+from ..synthesis.adaptive_pipeline import AdaptiveSynthesisPipeline
+from ..fabricate.conversation_generator import MockConversationGenerator
+from ..fabricate.response_coach import ResponseCoach
+from ..fabricate.scenario_builder import ConversationScenarioBuilder
+from ..demo.cache_manager import CacheManager
+from .dag_executor import DAGExecutor, Stage
+from .single_flight import SingleFlight
+
+# Shared by every pipeline in the process, so concurrent briefings for the
+# same prospect reuse one browser session, research task and synthesis call
+browse_flight = SingleFlight("browse")
+research_flight = SingleFlight("research")
+synthesis_flight = SingleFlight("synthesis")
+
+# Stage -> (section name, payload) for the streamed briefing
+SECTION_STAGES: Dict[str, Any] = {
+    "linkedin": ("profile", lambda result: result.get("profile", {})),
+    "posts": ("posts", lambda result: result),
+    "company_research": ("company_context", lambda result: result),
+    "theme_insights": ("themes", lambda result: result),
+    "synthesis": ("talking_points", lambda result: result),
+    "response_strategies": ("questions", lambda result: result),
+    "scenarios": ("scenarios", lambda result: result),
+}
+
+
+class BriefingPipeline:
+    """
+    Builds the briefing as a dependency graph of stages.
+
+    Critical path: LinkedIn -> Phase 2 extraction -> synthesis / Phase 5.
+    Twitter runs alongside LinkedIn, company research alongside Phase 2,
+    and the Phase 5 generators alongside each other.
+    """
+
+    def __init__(self, api_key: str, llm_client=None, research_memo: Optional[Dict[str, Any]] = None):
+        self.browser = LinkedInBrowserAgent(api_key=api_key)
+        self.twitter_browser = TwitterBrowserAgent(api_key=api_key)
+        self.researcher = CompanyResearcher(api_key=api_key)
+        self.extractor = SemanticProfileExtractor(llm_client=llm_client)
+        self.theme_engine = ThemeIdentificationEngine(llm_client=llm_client)
+        self.post_analyzer = PostAnalyzer(llm_client=llm_client)
+        self.transformer = StructuredDataTransformer()
+        self.synthesis_pipeline = AdaptiveSynthesisPipeline(llm_client=llm_client)
+
+        # Phase 5 Components
+        self.mock_generator = MockConversationGenerator(llm_client=llm_client)
+        self.response_coach = ResponseCoach(llm_client=llm_client)
+        self.scenario_builder = ConversationScenarioBuilder(llm_client=llm_client)
+
+        self.timeouts = PIPELINE_CONFIG["stage_timeouts"]
+        self.unified_post_analysis = PIPELINE_CONFIG["unified_post_analysis"]
+        # Company research results shared between pipelines of one batch,
+        # so attendees from the same company are researched once
+        self.research_memo = research_memo
+        self.last_timings: Dict[str, Any] = {}
+
+    async def run(
+        self,
+        linkedin_url: str,
+        meeting_context: str,
+        twitter_url: Optional[str] = None,
+        on_stage_complete: Optional[Callable[[str, Any, Dict[str, Any]], None]] = None,
+        on_item: Optional[Callable[[str, Any, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the full briefing pipeline and return the briefing dict.
+        `on_item(section, item, meta)` receives talking points and scenario
+        dialogue turns as the LLM streams them.
+        """
+        stages = self.build_stages(linkedin_url, meeting_context, twitter_url, on_item=on_item)
+        executor = DAGExecutor(stages, on_stage_complete=on_stage_complete)
+        try:
+            results = await executor.run()
+        finally:
+            self.last_timings = executor.timings
+
+        final_output = self.transformer.transform_to_briefing_format(results["extraction"])
+
+        # Merge synthesis result into final output
+        final_output.update(results["synthesis"])
+
+        final_output["mock_conversations"] = {
+            "likely_questions": results["response_strategies"], # Strategies include the question + coaching
+            "pitch_simulation": results["pitch_simulation"],
+            "conversation_scenarios": results["scenarios"]
+        }
+        final_output["pipeline_metadata"] = {"stage_timings": executor.timings}
+
+        return final_output
+
+    async def stream(self, linkedin_url: str, meeting_context: str, twitter_url: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the pipeline, yielding a "section" event as each briefing section
+        is ready and a final "complete" event with the full briefing.
+        Talking points and scenario dialogue turns also arrive one by one as
+        "item" events while their sections are still being generated.
+        Closing the iterator early cancels the run.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        started = time.perf_counter()
+        item_counts: Dict[str, int] = {}
+
+        def on_item(section: str, item: Any, meta: Dict[str, Any]):
+            index = item_counts.get(section, 0)
+            item_counts[section] = index + 1
+            queue.put_nowait({
+                "event": "item",
+                "section": section,
+                "index": index,
+                **meta,
+                "data": item,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            })
+
+        def on_stage_complete(name: str, result: Any, timing: Dict[str, Any]):
+            if name not in SECTION_STAGES:
+                return
+            section, payload = SECTION_STAGES[name]
+            queue.put_nowait({
+                "event": "section",
+                "section": section,
+                "stage": name,
+                "data": payload(result),
+                "timing": timing,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            })
+
+        run_task = asyncio.create_task(self.run(
+            linkedin_url, meeting_context, twitter_url, on_stage_complete=on_stage_complete, on_item=on_item
+        ))
+        run_task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+
+            # Re-raises StageFailedError from the run
+            final_output = run_task.result()
+            yield {
+                "event": "complete",
+                "data": final_output,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+        finally:
+            if not run_task.done():
+                run_task.cancel()
+                await asyncio.gather(run_task, return_exceptions=True)
+
+    def build_stages(
+        self,
+        linkedin_url: str,
+        meeting_context: str,
+        twitter_url: Optional[str] = None,
+        on_item: Optional[Callable[[str, Any, Dict[str, Any]], None]] = None
+    ) -> List[Stage]:
+        timeouts = self.timeouts
+        unified = self.unified_post_analysis
+
+        # Phase 1: LinkedIn Browsing
+        async def linkedin(_):
+            key = SingleFlight.make_key("linkedin", CacheManager.canonicalize_url(linkedin_url), meeting_context)
+            profile_data = await browse_flight.do(key, lambda: self.browser.browse_profile(linkedin_url, meeting_context))
+
+            if profile_data.get("error"):
+                raise Exception(f"LinkedIn browsing failed: {profile_data['error']}")
+
+            if not profile_data.get("profile"):
+                raise Exception("Failed to extract profile data. Please check the URL or try again later.")
+            return profile_data
+
+        # Phase 1.5: Twitter Browsing (Optional)
+        async def twitter(_):
+            if not twitter_url:
+                return []
+            key = SingleFlight.make_key("twitter", CacheManager.canonicalize_url(twitter_url))
+            return await browse_flight.do(key, lambda: self.twitter_browser.browse_tweets(twitter_url))
+
+        # Combine LinkedIn posts and Tweets for analysis
+        async def posts(inputs):
+            return list(inputs["linkedin"].get("posts", [])) + list(inputs["twitter"] or [])
+
+        async def company_research(inputs):
+            profile = inputs["linkedin"]["profile"]
+            company_name = profile.get("company", "Unknown")
+            role = profile.get("current_role", "Unknown")
+            if not company_name or company_name == "Unknown":
+                return await self.researcher.research_company(company_name, role)
+
+            # The role is only logged by the researcher, so colleagues share one result
+            key = SingleFlight.make_key("company", " ".join(str(company_name).lower().split()))
+            if self.research_memo is not None and key in self.research_memo:
+                return self.research_memo[key]
+            research = await research_flight.do(key, lambda: self.researcher.research_company(company_name, role))
+            if self.research_memo is not None:
+                self.research_memo[key] = research
+            return research
+
+        # Phase 2: one LLM pass by default, or one call per extractor
+        async def post_analysis(inputs):
+            return await self.post_analyzer.analyze_posts(inputs["posts"])
+
+        async def themes(inputs):
+            if unified:
+                return inputs["post_analysis"]["themes"]
+            return await self.extractor.extract_profile_themes(inputs["posts"])
+
+        async def sentiment(inputs):
+            if unified:
+                return inputs["post_analysis"]["sentiment"]
+            return await self.extractor.extract_sentiment_patterns(inputs["posts"])
+
+        async def theme_insights(inputs):
+            if unified:
+                return inputs["post_analysis"]["theme_insights"]
+            return await self.theme_engine.identify_themes(inputs["posts"])
+
+        async def person(inputs):
+            profile = inputs["linkedin"]["profile"]
+            return {
+                "name": profile.get("name"),
+                "role": profile.get("current_role"),
+                "company": profile.get("company"),
+                "professional_identity": inputs["themes"].get("professional_identity", ""),
+                "career_trajectory": "IC -> Lead -> CTO" # Still somewhat mocked unless we extract history
+            }
+
+        async def extraction(inputs):
+            company_context = inputs["company_research"]
+            return {
+                "person": inputs["person"],
+                "themes": inputs["theme_insights"],
+                "sentiment": inputs["sentiment"],
+                "insights": self.theme_engine.generate_theme_insights(inputs["theme_insights"]),
+                "company_context": {
+                    "name": company_context.get("name"),
+                    "relevance_score": 0.85,
+                    "key_facts": company_context.get("recent_news", []),
+                    "recent_developments": company_context.get("recent_news", [])
+                },
+                "extraction_metadata": {
+                    "confidence_score": 0.95,
+                    "data_quality": "high",
+                    "extraction_time": "1.2s"
+                }
+            }
+
+        # Phase 4: Adaptive Synthesis
+        async def synthesis(inputs):
+            key = SingleFlight.make_key(inputs["extraction"], meeting_context)
+            on_talking_point = (lambda point: on_item("talking_points", point, {})) if on_item else None
+            return await synthesis_flight.do(key, lambda: self.synthesis_pipeline.synthesize(
+                inputs["extraction"], meeting_context, on_talking_point=on_talking_point
+            ))
+
+        # Phase 5: Tonic Fabricate Mock Conversations. Every generator gets
+        # the same profile and posts, which become their shared prompt prefix.
+        async def prep_profile(inputs):
+            return {**inputs["person"], "posts": inputs["posts"]}
+
+        async def likely_questions(inputs):
+            return await self.mock_generator.generate_likely_questions(inputs["prep_profile"], meeting_context)
+
+        async def response_strategies(inputs):
+            return await self.response_coach.generate_response_strategies(inputs["likely_questions"], inputs["prep_profile"])
+
+        async def pitch_simulation(inputs):
+            return await self.mock_generator.generate_pitch_simulation(inputs["prep_profile"], "I'd like to propose a partnership...")
+
+        async def scenarios(inputs):
+            on_turn = (lambda context, turn: on_item("scenarios", turn, {"context": context})) if on_item else None
+            return await self.scenario_builder.build_scenarios(
+                inputs["prep_profile"], meeting_context=meeting_context, on_turn=on_turn
+            )
+
+        phase2_source = ["post_analysis"] if unified else ["posts"]
+        stages = [
+            Stage("linkedin", linkedin, timeout=timeouts.get("linkedin")),
+            Stage("twitter", twitter, timeout=timeouts.get("twitter"), fallback=[]),
+            Stage("posts", posts, depends_on=["linkedin", "twitter"]),
+            Stage("company_research", company_research, depends_on=["linkedin"],
+                  timeout=timeouts.get("company_research"), fallback=self._company_fallback),
+            Stage("themes", themes, depends_on=phase2_source,
+                  timeout=timeouts.get("themes"), fallback={"professional_identity": ""}),
+            Stage("sentiment", sentiment, depends_on=phase2_source,
+                  timeout=timeouts.get("sentiment"), fallback=self._sentiment_fallback),
+            Stage("theme_insights", theme_insights, depends_on=phase2_source,
+                  timeout=timeouts.get("theme_insights"), fallback=self._themes_fallback),
+            Stage("person", person, depends_on=["linkedin", "themes"]),
+            Stage("extraction", extraction, depends_on=["person", "theme_insights", "sentiment", "company_research"]),
+            Stage("synthesis", synthesis, depends_on=["extraction"],
+                  timeout=timeouts.get("synthesis"), fallback={}),
+            Stage("prep_profile", prep_profile, depends_on=["person", "posts"]),
+            Stage("likely_questions", likely_questions, depends_on=["prep_profile"],
+                  timeout=timeouts.get("likely_questions"), fallback=[]),
+            Stage("response_strategies", response_strategies, depends_on=["likely_questions", "prep_profile"],
+                  timeout=timeouts.get("response_strategies"), fallback=self._strategies_fallback),
+            Stage("pitch_simulation", pitch_simulation, depends_on=["prep_profile"],
+                  timeout=timeouts.get("pitch_simulation"), fallback=[]),
+            Stage("scenarios", scenarios, depends_on=["prep_profile"],
+                  timeout=timeouts.get("scenarios"), fallback={}),
+        ]
+        if unified:
+            stages.append(Stage("post_analysis", post_analysis, depends_on=["posts"],
+                                timeout=timeouts.get("post_analysis"), fallback=self._post_analysis_fallback))
+        return stages
+
+    @staticmethod
+    def _company_fallback(inputs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        company_name = inputs["linkedin"]["profile"].get("company") or "Unknown"
+        return {
+            "name": company_name,
+            "industry": "Unknown",
+            "funding": {"stage": "Unknown", "amount": "Unknown"},
+            "recent_news": [f"No specific news found for {company_name}"],
+            "competitors": []
+        }
+
+    @classmethod
+    def _post_analysis_fallback(cls, inputs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        return {
+            "themes": {"professional_identity": ""},
+            "sentiment": cls._sentiment_fallback(inputs, error),
+            "theme_insights": cls._themes_fallback(inputs, error)
+        }
+
+    @staticmethod
+    def _sentiment_fallback(inputs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        return {
+            "overall_sentiment": "neutral",
+            "passion_topics": [],
+            "concerns": [],
+            "communication_style": "professional"
+        }
+
+    @staticmethod
+    def _themes_fallback(inputs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        return {"primary": "technology", "secondary": [], "frequency_breakdown": {}}
+
+    @staticmethod
+    def _strategies_fallback(inputs: Dict[str, Any], error: BaseException) -> List[Dict[str, Any]]:
+        return [
+            {
+                "question": q.get("question", ""),
+                "response_framework": "Direct Answer",
+                "emphasize": ["Clarity"],
+                "avoid": ["Ambiguity"],
+                "pivot_options": [],
+                "follow_up_prepared": []
+            } for q in inputs["likely_questions"] if isinstance(q, dict)
+        ]
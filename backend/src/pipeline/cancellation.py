@@ -0,0 +1,25 @@
+import asyncio
+from typing import Any, Awaitable
+
+
+async def cancel_on_disconnect(http_request, work: Awaitable[Any], poll_interval: float = 0.5) -> Any:
+    """
+    Await `work`, cancelling it if the client that made `http_request`
+    disconnects first. Cancellation propagates into the pipeline, so
+    browser leases, Yutori polling and LLM calls stop with it.
+    """
+    task = asyncio.ensure_future(work)
+
+    async def watch():
+        while not task.done():
+            if await http_request.is_disconnected():
+                print("Client disconnected; cancelling in-flight work.")
+                task.cancel()
+                return
+            await asyncio.sleep(poll_interval)
+
+    watcher = asyncio.create_task(watch())
+    try:
+        return await task
+    finally:
+        watcher.cancel()
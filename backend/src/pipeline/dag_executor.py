@@ -0,0 +1,164 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ..governor.provider_governor import BackpressureError
+
+
+class StageFailedError(Exception):
+    """
+    Raised when a stage without a fallback fails or times out.
+    """
+
+    def __init__(self, stage_name: str, cause: BaseException):
+        self.stage_name = stage_name
+        self.cause = cause
+        super().__init__(f"Stage '{stage_name}' failed: {cause}")
+
+
+class Stage:
+    """
+    A single node in the pipeline graph.
+
+    `func` is an async callable that receives a dict of its dependencies'
+    results keyed by stage name. `fallback` is either a plain value or a
+    callable taking (inputs, error) that produces a substitute result when
+    the stage raises or exceeds its timeout. Stages without a fallback
+    abort the whole run, as does provider backpressure in any stage.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Awaitable[Any]],
+        depends_on: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        fallback: Any = None,
+        has_fallback: Optional[bool] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on or [])
+        self.timeout = timeout
+        self.fallback = fallback
+        # A fallback of None is a legitimate substitute value, so allow callers
+        # to opt in explicitly; otherwise any non-None fallback counts.
+        self.has_fallback = has_fallback if has_fallback is not None else fallback is not None
+
+    def resolve_fallback(self, inputs: Dict[str, Any], error: BaseException) -> Any:
+        if callable(self.fallback):
+            return self.fallback(inputs, error)
+        return self.fallback
+
+
+class DAGExecutor:
+    """
+    Runs pipeline stages as soon as their dependencies are satisfied, so
+    independent stages execute concurrently and end-to-end latency tracks
+    the longest dependency chain instead of the sum of all stages.
+
+    `on_stage_complete(name, result, timing)` is called as each stage
+    finishes (including fallbacks), so callers can stream partial results.
+    """
+
+    def __init__(self, stages: List[Stage], on_stage_complete: Optional[Callable[[str, Any, Dict[str, Any]], None]] = None):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in pipeline graph")
+        self._validate()
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.on_stage_complete = on_stage_complete
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        # Kahn's algorithm: any stage left unvisited sits on a cycle
+        remaining = {name: len(stage.depends_on) for name, stage in self.stages.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for stage in self.stages.values():
+                if current in stage.depends_on:
+                    remaining[stage.name] -= 1
+                    if remaining[stage.name] == 0:
+                        ready.append(stage.name)
+        if visited != len(self.stages):
+            raise ValueError("Pipeline graph contains a cycle")
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute every stage and return their results keyed by stage name.
+        """
+        self.timings = {}
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        run_started = time.perf_counter()
+
+        async def run_stage(stage: Stage) -> Any:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+            inputs = {dep: results[dep] for dep in stage.depends_on}
+
+            started = time.perf_counter()
+            status = "ok"
+            error: Optional[BaseException] = None
+            try:
+                if stage.timeout:
+                    result = await asyncio.wait_for(stage.func(inputs), timeout=stage.timeout)
+                else:
+                    result = await stage.func(inputs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+                if isinstance(e, asyncio.TimeoutError):
+                    status = "timeout"
+                    print(f"Stage '{stage.name}' timed out after {stage.timeout}s")
+                else:
+                    status = "error"
+                    print(f"Stage '{stage.name}' failed: {e}")
+
+                # Backpressure means "retry later", not "degrade": never fall back
+                if not stage.has_fallback or isinstance(e, BackpressureError):
+                    self._record(stage, status, started, run_started, error)
+                    raise StageFailedError(stage.name, e) from e
+                result = stage.resolve_fallback(inputs, e)
+                status = f"{status}_fallback"
+
+            self._record(stage, status, started, run_started, error)
+            results[stage.name] = result
+            if self.on_stage_complete:
+                try:
+                    self.on_stage_complete(stage.name, result, self.timings[stage.name])
+                except Exception as e:
+                    print(f"on_stage_complete hook failed for '{stage.name}': {e}")
+            return result
+
+        for name, stage in self.stages.items():
+            tasks[name] = asyncio.create_task(run_stage(stage), name=f"stage:{name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self.timings["_total"] = {"duration_ms": round((time.perf_counter() - run_started) * 1000, 1)}
+        return results
+
+    def _record(self, stage: Stage, status: str, started: float, run_started: float, error: Optional[BaseException]):
+        finished = time.perf_counter()
+        entry = {
+            "status": status,
+            "started_at_ms": round((started - run_started) * 1000, 1),
+            "duration_ms": round((finished - started) * 1000, 1),
+        }
+        if error is not None:
+            entry["error"] = str(error) or error.__class__.__name__
+        self.timings[stage.name] = entry
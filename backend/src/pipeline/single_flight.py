@@ -0,0 +1,65 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key onto one in-flight task.
+
+    The first caller for a key starts the work; callers arriving while it
+    runs await the same result (or exception). A caller that is cancelled
+    only detaches itself: the shared task is cancelled when its last
+    waiter goes away. Results are not kept once the task finishes.
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.stats = {"started": 0, "coalesced": 0}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Stable key for arbitrary JSON-serializable arguments.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+            self.stats["started"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters.get(key) == 1:
+                print(f"{self.name}: last waiter for {key[:12]} left; cancelling shared work.")
+                # Detach now so a caller arriving mid-cancel starts fresh work
+                del self._tasks[key]
+                del self._waiters[key]
+                task.cancel()
+            raise
+        finally:
+            if self._tasks.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._waiters[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has already left
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
@@ -0,0 +1,84 @@
+import asyncio
+import re
+from typing import Any, Dict, Iterable, Optional
+from ..config.cache_config import COMPANY_INTEL_CONFIG
+from .sqlite_store import SQLiteKVStore
+
+_shared_store: Optional["CompanyIntelStore"] = None
+
+# Legal suffixes that do not distinguish one company from another
+_SUFFIXES = {"inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc", "sa", "ag"}
+
+
+class CompanyIntelStore:
+    """
+    Company research shared across every person at the same company.
+
+    Each field (recent_news, industry, competitors, ...) is stored as its
+    own row with its own TTL, so daily news can expire while slower-moving
+    facts stay fresh. Keys are normalized company names.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = {**COMPANY_INTEL_CONFIG, **(config or {})}
+        self.disk = SQLiteKVStore(self.config["path"], table="company_intel")
+        self.stats = {"hits": 0, "partial_hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def normalize_name(company_name: str) -> str:
+        words = re.sub(r"[^\w\s]", " ", (company_name or "").lower()).split()
+        while len(words) > 1 and words[-1] in _SUFFIXES:
+            words.pop()
+        return " ".join(words)
+
+    def ttl_for(self, field: str) -> float:
+        ttls = self.config["field_ttls"]
+        return ttls.get(field.split(":", 1)[0], ttls["default"])
+
+    async def get(self, company_name: str, fields: Iterable[str]) -> Dict[str, Any]:
+        """
+        Return the fresh subset of `fields` known for the company.
+        """
+        fields = list(fields)
+        company = self.normalize_name(company_name)
+        found: Dict[str, Any] = {}
+        for field in fields:
+            value = await asyncio.to_thread(self.disk.get, f"{company}|{field}")
+            if value is not None:
+                found[field] = value
+
+        if len(found) == len(fields):
+            self.stats["hits"] += 1
+        elif found:
+            self.stats["partial_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+        return found
+
+    async def put(self, company_name: str, fields: Dict[str, Any]):
+        company = self.normalize_name(company_name)
+        for field, value in fields.items():
+            await asyncio.to_thread(self.disk.set, f"{company}|{field}", value, self.ttl_for(field))
+        self.stats["writes"] += 1
+
+    def close(self):
+        self.disk.close()
+
+
+def get_company_store() -> Optional[CompanyIntelStore]:
+    """
+    Process-wide store, or None when company intel caching is disabled.
+    """
+    global _shared_store
+    if not COMPANY_INTEL_CONFIG["enabled"]:
+        return None
+    if _shared_store is None:
+        _shared_store = CompanyIntelStore()
+    return _shared_store
+
+
+def close_company_store():
+    global _shared_store
+    if _shared_store is not None:
+        _shared_store.close()
+        _shared_store = None
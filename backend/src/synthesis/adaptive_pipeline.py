@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 from .person_classifier import PersonTypeClassifier
 from .talking_points import TalkingPointsGenerator
 from .reasoning_chain import ReasoningChainGenerator
@@ -14,9 +14,15 @@ class AdaptiveSynthesisPipeline:
         self.tp_generator = TalkingPointsGenerator(llm_client=llm_client)
         self.reasoning_generator = ReasoningChainGenerator()
 
-    async def synthesize(self, extracted_data: Dict[str, Any], meeting_context: str) -> Dict[str, Any]:
+    async def synthesize(
+        self,
+        extracted_data: Dict[str, Any],
+        meeting_context: str,
+        on_talking_point: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
         """
-        Run adaptive synthesis pipeline.
+        Run adaptive synthesis pipeline. `on_talking_point` receives each
+        talking point as soon as it is generated.
         """
         if extracted_data is None:
             extracted_data = {}
@@ -34,7 +40,11 @@ class AdaptiveSynthesisPipeline:
         
         # Step 2: Generate Talking Points
         themes = extracted_data.get("themes", {})
-        talking_points = await self.tp_generator.generate(themes, person_type, meeting_context, profile_name=profile_data.get("name", "Candidate"))
+        talking_points = await self.tp_generator.generate(
+            themes, person_type, meeting_context,
+            profile_name=profile_data.get("name", "Candidate"),
+            on_point=on_talking_point
+        )
         
         # Step 3: Generate Reasoning Chain
         reasoning_chain = self.reasoning_generator.generate_chain(talking_points)
@@ -1,4 +1,7 @@
-from typing import List, Dict, Any
+import json
+from typing import Callable, List, Dict, Any, Optional
+from ..governor.provider_governor import BackpressureError
+from ..llm.json_stream import JSONArrayStreamParser, strip_code_fence
 
 class TalkingPointsGenerator:
     """
@@ -8,9 +11,18 @@ class TalkingPointsGenerator:
     def __init__(self, llm_client=None):
         self.llm_client = llm_client
 
-    async def generate(self, themes: Dict[str, Any], person_type: str, context: str, profile_name: str = "Candidate") -> List[Dict[str, Any]]:
+    async def generate(
+        self,
+        themes: Dict[str, Any],
+        person_type: str,
+        context: str,
+        profile_name: str = "Candidate",
+        on_point: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Generate 3 talking points with reasoning.
+        Generate 3 talking points with reasoning. With `on_point`, the LLM
+        response is streamed and each point is passed to it as soon as it
+        is complete.
         """
         talking_points = []
         
@@ -63,19 +75,20 @@ class TalkingPointsGenerator:
         ]
         """
 
+        request = {
+            "call_site": "talking_points",
+            "model": "claude-sonnet-4-5",
+            "max_tokens": 1000,
+            "messages": [{"role": "user", "content": prompt}]
+        }
         try:
-            message = self.llm_client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            response_text = message.content[0].text
-            import json
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                 response_text = response_text.split("```")[1].split("```")[0]
-            talking_points = json.loads(response_text)
+            if on_point is not None and hasattr(self.llm_client.messages, "stream_text"):
+                talking_points = await self._stream_points(request, on_point)
+            else:
+                message = await self.llm_client.messages.create(**request)
+                talking_points = json.loads(strip_code_fence(message.content[0].text))
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Error generating talking points: {e}")
             # Fallback
@@ -91,6 +104,21 @@ class TalkingPointsGenerator:
 
         return talking_points
 
+    async def _stream_points(self, request: Dict[str, Any], on_point: Callable[[Dict[str, Any]], None]) -> List[Dict[str, Any]]:
+        parser = JSONArrayStreamParser()
+        points = []
+        async for chunk in self.llm_client.messages.stream_text(**request):
+            for point in parser.feed(chunk):
+                points.append(point)
+                on_point(point)
+        try:
+            return json.loads(strip_code_fence(parser.text))
+        except json.JSONDecodeError:
+            # Trailing junk after the array; the streamed points are complete
+            if points:
+                return points
+            raise
+
 
     def adapt_to_person_type(self, points: List[Dict[str, Any]], person_type: str) -> List[Dict[str, Any]]:
         """
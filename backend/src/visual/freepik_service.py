@@ -2,6 +2,7 @@ import requests
 import base64
 import io
 from src.config.freepik_config import FREEPIK_CONFIG
+from src.governor.provider_governor import governor, BackpressureError
 
 class FreepikService:
     def __init__(self):
@@ -13,6 +14,7 @@ class FreepikService:
         """
         Generate an image using Freepik Mystic API.
         Returns the base64 string of the generated image.
+        Blocking: call it from a worker thread, not the event loop.
         """
         if not self.api_key:
             print("Warning: FREEPIK_API_KEY not found.")
@@ -32,7 +34,8 @@ class FreepikService:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            with governor.limit_blocking("freepik"):
+                response = requests.post(url, headers=headers, json=payload, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
@@ -49,6 +52,8 @@ class FreepikService:
             else:
                 print(f"Freepik API Error: {response.status_code} - {response.text}")
                 return None
+        except BackpressureError:
+            raise
         except Exception as e:
             print(f"Freepik Service Exception: {e}")
             return None
@@ -1,6 +1,7 @@
 from fpdf import FPDF
 import io
 from .freepik_service import FreepikService
+from ..governor.provider_governor import BackpressureError
 
 class PDFGenerator:
     """
@@ -10,6 +11,7 @@ class PDFGenerator:
     def generate(self, briefing_data: dict) -> bytes:
         """
         Generate PDF bytes from briefing data.
+        Blocking (Freepik is called with requests), so run it in a worker thread.
         """
         pdf = FPDF(orientation="P", unit="mm", format="Letter")
         pdf.add_page()
@@ -72,6 +74,8 @@ class PDFGenerator:
                     current_y = pdf.get_y()
                     # Using io.BytesIO(img_data)
                     pdf.image(io.BytesIO(img_data), x=150, y=current_y - 20, w=30)
+            except BackpressureError:
+                raise
             except Exception as e:
                 print(f"Failed to add Freepik icon: {e}")
 
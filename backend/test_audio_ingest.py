@@ -0,0 +1,117 @@
+import asyncio
+import sys
+import os
+import base64
+import io
+import json
+import tracemalloc
+from types import SimpleNamespace
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.audio.ingest import (
+    IncrementalBase64Decoder, UploadTooLargeError, new_spool, spool_base64_text, spool_json_base64
+)
+from src.audio.transcriber import ChunkedTranscriber
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+SMALL_SPOOL = {"spool_memory_bytes": 256 * 1024, "read_chunk_bytes": 64 * 1024}
+CHUNKED = {"min_duration": 30.0, "target_chunk": 30.0, "min_chunk": 10.0, "max_chunk": 45.0, "overlap": 1.0}
+
+def make_wav(seconds):
+    """
+    A real recording: 16kHz mono 16-bit, a short tone every second.
+    """
+    beat = Sine(440).to_audio_segment(duration=400, volume=-6).set_frame_rate(16000).set_channels(1).set_sample_width(2)
+    beat += AudioSegment.silent(duration=600, frame_rate=16000)
+    buffer = io.BytesIO()
+    (beat * seconds).export(buffer, format="wav")
+    return buffer.getvalue()
+
+async def body_chunks(body: bytes, size: int):
+    for offset in range(0, len(body), size):
+        yield body[offset:offset + size]
+
+class StubSpeechToText:
+    def __init__(self):
+        self.received = []
+
+    def convert(self, file, model_id, language_code):
+        name, stream = file[0], file[1]
+        self.received.append((name, stream.read()))
+        return SimpleNamespace(text="hello world", words=[])
+
+async def verify_audio_ingest():
+    print("--- Testing Streaming Audio Ingest ---")
+    audio = make_wav(100)
+    encoded = base64.b64encode(audio).decode()
+
+    print("\n[Test 1: Base64 decodes correctly from arbitrary pieces]")
+    spool = new_spool(SMALL_SPOOL)
+    decoder = IncrementalBase64Decoder(spool)
+    wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+    for offset in range(0, len(wrapped), 1001):
+        decoder.feed(wrapped[offset:offset + 1001])
+    decoder.finish()
+    spool.seek(0)
+    decode_ok = spool.read() == audio and spool._rolled
+    spool.close()
+    try:
+        spool_base64_text("abc$", new_spool())
+        invalid_ok = False
+    except ValueError as e:
+        print(f"Invalid input rejected: {e}")
+        invalid_ok = True
+    try:
+        spool_base64_text(encoded, new_spool(), {"max_upload_bytes": 1024})
+        limit_ok = False
+    except UploadTooLargeError as e:
+        print(f"Oversized input rejected: {e}")
+        limit_ok = True
+
+    print("\n[Test 2: JSON body is decoded as it streams in, with low peak memory]")
+    escaped = encoded.replace("/", "\\/")
+    body = ('{"audio_base64": "' + escaped + '", "filename": "call.wav", "note": "café"}').encode()
+    spool = new_spool(SMALL_SPOOL)
+    tracemalloc.start()
+    fields = await spool_json_base64(body_chunks(body, 64 * 1024 + 3), "audio_base64", spool, SMALL_SPOOL)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    spool.seek(0)
+    print(f"Fields: {fields}, payload {len(audio) // 1024}KB, peak {peak // 1024}KB")
+    stream_ok = fields == {"filename": "call.wav", "note": "café"} and spool.read() == audio and peak < len(audio) / 4
+
+    other_order = json.dumps({"filename": "call.mp3", "audio_base64": encoded[:4000]}).encode()
+    sink = new_spool()
+    fields = await spool_json_base64(body_chunks(other_order, 7), "audio_base64", sink)
+    sink.seek(0)
+    order_ok = fields == {"filename": "call.mp3"} and sink.read() == audio[:3000]
+
+    print("\n[Test 3: A short recording is measured from its header and sent whole from the spool]")
+    stub = StubSpeechToText()
+    transcription = await ChunkedTranscriber(stub.convert, config={"min_duration": 600}).transcribe(spool, "wav")
+    print(f"Stub received {stub.received[0][0]} ({len(stub.received[0][1])} bytes)")
+    transcribe_ok = transcription["text"] == "hello world" and stub.received == [("recording.wav", audio)]
+
+    print("\n[Test 4: A long recording is chunked from the spool one window at a time]")
+    stub = StubSpeechToText()
+    transcription = await ChunkedTranscriber(stub.convert, config=CHUNKED).transcribe(spool, "wav")
+    lengths = [len(AudioSegment.from_wav(io.BytesIO(data))) / 1000 for _, data in stub.received]
+    print(f"Chunks: {[name for name, _ in stub.received]}, seconds: {lengths}")
+    chunked_ok = (
+        transcription["chunks"] == len(stub.received) > 1
+        and max(lengths) <= CHUNKED["max_chunk"] + 2 * CHUNKED["overlap"]
+        and abs(transcription["segments"][-1]["end"] - 100) < 0.01
+    )
+    spool.close()
+
+    if decode_ok and invalid_ok and limit_ok and stream_ok and order_ok and transcribe_ok and chunked_ok:
+        print("\nSUCCESS: Streaming audio ingest working correctly.")
+    else:
+        print("\nFAILURE: Streaming audio ingest checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_audio_ingest())
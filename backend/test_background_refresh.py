@@ -0,0 +1,49 @@
+import asyncio
+import sys
+import os
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.pipeline.background_refresh import BackgroundRefresher
+
+async def verify_background_refresh():
+    print("--- Testing Background Refresh ---")
+    refresher = BackgroundRefresher()
+    runs = []
+
+    async def slow_refresh(profile):
+        runs.append(profile)
+        await asyncio.sleep(0.1)
+
+    print("\n[Test 1: Concurrent refreshes for one profile are deduplicated]")
+    started = [refresher.schedule("profile_jane", lambda: slow_refresh("jane")) for _ in range(5)]
+    refresher.schedule("profile_john", lambda: slow_refresh("john"))
+    await asyncio.sleep(0)
+    print(f"Started: {started}, in flight: {refresher.in_flight()}")
+    dedupe_ok = started == [True, False, False, False, False] and refresher.in_flight() == 2
+
+    await asyncio.sleep(0.2)
+    print(f"Runs: {runs}, stats: {refresher.stats}")
+    done_ok = sorted(runs) == ["jane", "john"] and refresher.in_flight() == 0
+
+    print("\n[Test 2: A finished refresh can be scheduled again; failures are contained]")
+    async def failing_refresh():
+        raise RuntimeError("scrape failed")
+
+    again_ok = refresher.schedule("profile_jane", failing_refresh)
+    await asyncio.sleep(0.05)
+    failure_ok = again_ok and refresher.stats["failed"] == 1 and refresher.in_flight() == 0
+
+    print("\n[Test 3: Shutdown cancels outstanding refreshes]")
+    refresher.schedule("profile_slow", lambda: asyncio.sleep(10))
+    await refresher.shutdown()
+    shutdown_ok = refresher.in_flight() == 0
+
+    if dedupe_ok and done_ok and failure_ok and shutdown_ok:
+        print("\nSUCCESS: Background refresh working correctly.")
+    else:
+        print("\nFAILURE: Background refresh checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_background_refresh())
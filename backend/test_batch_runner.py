@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import os
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.pipeline.batch_runner import run_batch
+from src.pipeline.briefing_pipeline import BriefingPipeline
+
+class FakeResearcher:
+    def __init__(self):
+        self.calls = []
+
+    async def research_company(self, company_name, person_role):
+        self.calls.append(company_name)
+        await asyncio.sleep(0.05)
+        return {"name": company_name, "recent_news": []}
+
+async def verify_batch_runner():
+    print("--- Testing Batch Briefing Runner ---")
+
+    print("\n[Test 1: Concurrency is bounded and results stream as they finish]")
+    in_flight = 0
+    peak = 0
+
+    async def worker(delay):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(delay)
+        in_flight -= 1
+        if delay == 0.02:
+            raise RuntimeError("profile not found")
+        return delay
+
+    items = [0.3, 0.1, 0.02, 0.1, 0.1, 0.1]
+    finished = [(index, result, error) async for index, result, error in run_batch(items, worker, concurrency=3)]
+    print(f"Completion order: {[i for i, _, _ in finished]}, peak concurrency: {peak}")
+    order_ok = finished[0][0] == 2 and isinstance(finished[0][2], RuntimeError) and finished[-1][0] == 0
+    bound_ok = peak == 3 and len(finished) == len(items)
+
+    print("\n[Test 2: Closing the stream cancels remaining items]")
+    started = []
+
+    async def slow(item):
+        started.append(item)
+        await asyncio.sleep(0.05 if item == 0 else 10)
+        return item
+
+    stream = run_batch(list(range(5)), slow, concurrency=2)
+    first = await stream.__anext__()
+    await stream.aclose()
+    close_ok = first[0] == 0 and len(started) <= 3
+    print(f"Started before close: {started}")
+
+    print("\n[Test 3: Attendees from one company share research]")
+    researcher = FakeResearcher()
+    memo = {}
+
+    async def research(company):
+        pipeline = BriefingPipeline(api_key="mock_key", research_memo=memo)
+        pipeline.researcher = researcher
+        stage = next(s for s in pipeline.build_stages("https://linkedin.com/in/x", "Intro") if s.name == "company_research")
+        return await stage.func({"linkedin": {"profile": {"company": company, "current_role": "VP"}}})
+
+    companies = ["Acme", "acme", "Globex", "Acme "]
+    results = [r async for r in run_batch(companies, research, concurrency=2)]
+    results += [r async for r in run_batch(["Acme"], research, concurrency=1)]
+    print(f"Research calls: {researcher.calls}")
+    share_ok = sorted(researcher.calls) == ["Acme", "Globex"] and all(error is None for _, _, error in results)
+
+    if order_ok and bound_ok and close_ok and share_ok:
+        print("\nSUCCESS: Batch briefing runner working correctly.")
+    else:
+        print("\nFAILURE: Batch briefing runner checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_batch_runner())
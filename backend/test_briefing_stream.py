@@ -0,0 +1,85 @@
+import asyncio
+import sys
+import os
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.pipeline.briefing_pipeline import BriefingPipeline
+from src.pipeline.dag_executor import Stage, StageFailedError
+
+class FakeStagePipeline(BriefingPipeline):
+    """
+    BriefingPipeline whose stages return canned data after fixed delays.
+    """
+
+    def __init__(self, fail_stage=None):
+        super().__init__(api_key="mock_key")
+        self.fail_stage = fail_stage
+
+    def build_stages(self, linkedin_url, meeting_context, twitter_url=None, on_item=None):
+        def fake(name, value, delay):
+            async def run(inputs):
+                await asyncio.sleep(delay)
+                if name == self.fail_stage:
+                    raise RuntimeError(f"{name} broke")
+                return value
+            return run
+
+        person = {"name": "Jane Doe", "role": "CTO", "company": "Acme"}
+        return [
+            Stage("linkedin", fake("linkedin", {"profile": person, "posts": ["post"]}, 0.05)),
+            Stage("posts", fake("posts", ["post"], 0.0), depends_on=["linkedin"]),
+            Stage("company_research", fake("company_research", {"name": "Acme"}, 0.1), depends_on=["linkedin"]),
+            Stage("theme_insights", fake("theme_insights", {"primary": "ai"}, 0.05), depends_on=["posts"]),
+            Stage("extraction", fake("extraction", {"person": person}, 0.0), depends_on=["theme_insights", "company_research"]),
+            Stage("synthesis", fake("synthesis", {"talking_points": ["tp"]}, 0.05), depends_on=["extraction"]),
+            Stage("response_strategies", fake("response_strategies", [{"question": "q"}], 0.3), depends_on=["linkedin"]),
+            Stage("pitch_simulation", fake("pitch_simulation", [], 0.0), depends_on=["linkedin"]),
+            Stage("scenarios", fake("scenarios", {"skeptic": []}, 0.05), depends_on=["linkedin"]),
+        ]
+
+async def verify_briefing_stream():
+    print("--- Testing Streaming Briefing ---")
+
+    print("\n[Test 1: Sections arrive as their stages finish]")
+    events = [e async for e in FakeStagePipeline().stream("https://linkedin.com/in/jane", "Partnership")]
+    names = [e.get("section", e["event"]) for e in events]
+    print(f"Events: {names}")
+    first_elapsed = events[0]["elapsed_ms"]
+    complete = events[-1]
+    order_ok = (
+        names[0] == "profile"
+        and names[-1] == "complete"
+        and set(names[:-1]) == {"profile", "posts", "company_context", "themes", "talking_points", "questions", "scenarios"}
+        and names.index("questions") == len(names) - 2
+    )
+    timing_ok = all("duration_ms" in e["timing"] for e in events[:-1]) and first_elapsed < complete["elapsed_ms"] / 2
+    complete_ok = complete["data"]["person"]["name"] == "Jane Doe" and "stage_timings" in complete["data"]["pipeline_metadata"]
+    print(f"First section after {first_elapsed}ms, complete after {complete['elapsed_ms']}ms")
+
+    print("\n[Test 2: Required stage failure ends the stream with an error]")
+    try:
+        async for _ in FakeStagePipeline(fail_stage="linkedin").stream("https://linkedin.com/in/jane", "Partnership"):
+            pass
+        error_ok = False
+    except StageFailedError as e:
+        print(f"Raised for stage: {e.stage_name}")
+        error_ok = e.stage_name == "linkedin"
+
+    print("\n[Test 3: Closing the stream early cancels the run]")
+    pipeline = FakeStagePipeline()
+    stream = pipeline.stream("https://linkedin.com/in/jane", "Partnership")
+    first = await stream.__anext__()
+    await stream.aclose()
+    await asyncio.sleep(0.4)
+    cancel_ok = first["section"] == "profile" and "response_strategies" not in pipeline.last_timings
+    print(f"Stages recorded before cancel: {sorted(pipeline.last_timings)}")
+
+    if order_ok and timing_ok and complete_ok and error_ok and cancel_ok:
+        print("\nSUCCESS: Streaming briefing working correctly.")
+    else:
+        print("\nFAILURE: Streaming briefing checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_briefing_stream())
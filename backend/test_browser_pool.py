@@ -0,0 +1,167 @@
+import asyncio
+import sys
+import os
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.browser_pool import BrowserPool
+
+class FakePage:
+    def __init__(self):
+        self.handlers = {}
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+class FakeContext:
+    def __init__(self, index):
+        self.index = index
+        self.closed = False
+        self.hung = False
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def cookies(self):
+        if self.hung:
+            await asyncio.sleep(10)
+        return []
+
+    async def close(self):
+        self.closed = True
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = FakeContext(len(self.contexts))
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+class FakePlaywright:
+    """
+    Stands in for async_playwright(): launches fake browsers.
+    """
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+    async def stop(self):
+        self.stopped = True
+
+def make_pool(**config):
+    pool = BrowserPool({"max_contexts": 2, "max_uses_per_context": 3, "auth_state_path": None, "health_probe_timeout": 0.05, **config})
+    pool._playwright = FakePlaywright()
+    return pool
+
+async def verify_browser_pool():
+    print("--- Testing Browser Pool ---")
+
+    print("\n[Test 1: Contexts are reused, then recycled after N uses]")
+    pool = make_pool()
+    used = []
+    for _ in range(4):
+        async with pool.lease_page() as page:
+            used.append(pool._browser.contexts.index(next(c for c in pool._browser.contexts if page in c.pages)))
+    contexts = pool._browser.contexts
+    print(f"Contexts used per lease: {used}, stats: {pool.stats}")
+    recycle_ok = (
+        used == [0, 0, 0, 1]
+        and contexts[0].closed and not contexts[1].closed
+        and pool.stats["contexts_recycled"] == 1
+        and all(page.closed for c in contexts for page in c.pages)
+    )
+
+    print("\n[Test 2: A crashed context is replaced]")
+    pool = make_pool()
+    async with pool.lease_page() as page:
+        page.handlers["crash"](page)
+    async with pool.lease_page() as page:
+        pass
+    contexts = pool._browser.contexts
+    print(f"Contexts created: {len(contexts)}, first closed: {contexts[0].closed}")
+    crash_ok = len(contexts) == 2 and contexts[0].closed and page in contexts[1].pages
+
+    print("\n[Test 3: Health check drops unresponsive idle contexts]")
+    async with pool.lease_page():
+        async with pool.lease_page():
+            pass
+    idle = list(pool._idle)
+    idle[0].context.hung = True
+    health = await pool.health_check()
+    print(f"Health: {health}")
+    health_ok = (
+        health["idle_contexts"] == len(idle) - 1
+        and idle[0].context.closed
+        and health["browser_running"]
+    )
+
+    print("\n[Test 4: A dead browser is restarted on the next lease]")
+    pool._browser.connected = False
+    async with pool.lease_page():
+        pass
+    restart_ok = pool.stats["browser_restarts"] == 1 and len(pool._playwright.browsers) == 2
+
+    print("\n[Test 5: A context leased before a restart is not returned to the pool]")
+    async with pool.lease_page() as stale_page:
+        stale = next(c for c in pool._browser.contexts if stale_page in c.pages)
+        pool._browser.connected = False
+        async with pool.lease_page():
+            pass
+    fresh_browser = pool._playwright.browsers[-1]
+    idle_contexts = [pooled.context for pooled in pool._idle]
+    print(f"Restarts: {pool.stats['browser_restarts']}, stale closed: {stale.closed}")
+    stale_ok = (
+        pool.stats["browser_restarts"] == 2
+        and stale.closed and stale not in idle_contexts
+        and all(context in fresh_browser.contexts for context in idle_contexts)
+    )
+    # The same ownership check applies to the health probe
+    pool._idle[0].browser = pool._playwright.browsers[0]
+    orphan = pool._idle[0].context
+    await pool.health_check()
+    stale_ok = stale_ok and orphan.closed and all(pooled.context is not orphan for pooled in pool._idle)
+
+    print("\n[Test 6: Shutdown closes contexts, browser and Playwright]")
+    playwright, browser = pool._playwright, pool._browser
+    idle = list(pool._idle)
+    await pool.close()
+    shutdown_ok = (
+        playwright.stopped and browser.closed
+        and all(pooled.context.closed for pooled in idle)
+        and pool._browser is None and not pool._idle
+    )
+
+    if recycle_ok and crash_ok and health_ok and restart_ok and stale_ok and shutdown_ok:
+        print("\nSUCCESS: Browser pool working correctly.")
+    else:
+        print("\nFAILURE: Browser pool checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_browser_pool())
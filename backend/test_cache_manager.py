@@ -0,0 +1,99 @@
+import asyncio
+import sys
+import os
+import json
+import tempfile
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.demo.cache_manager import CacheManager
+
+def verify_cache_manager():
+    print("--- Testing Briefing Cache Manager ---")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CacheManager(cache_dir=tmp)
+        briefing = {"person": {"name": "Jane Doe"}}
+
+        print("\n[Test 1: URL variants share one entry]")
+        cache.save_to_cache("https://www.linkedin.com/in/JaneDoe/?trk=abc", briefing, "Partnership  intro", "https://twitter.com/jane")
+        hit = cache.get_from_cache("linkedin.com/in/janedoe", "partnership intro", "https://x.com/jane/")
+        print(f"Hit: {hit is not None}")
+        canonical_ok = hit == briefing
+
+        print("\n[Test 2: Meeting context is part of the key]")
+        miss = cache.get_from_cache("https://linkedin.com/in/janedoe", "technical deep dive", "https://x.com/jane")
+        context_ok = miss is None
+
+        print("\n[Test 3: Non-profile URLs no longer collide]")
+        cache.save_to_cache("https://example.com/a", {"id": "a"}, "ctx")
+        cache.save_to_cache("https://example.com/b", {"id": "b"}, "ctx")
+        collide_ok = cache.get_from_cache("https://example.com/a", "ctx") == {"id": "a"}
+
+        print("\n[Test 4: Staleness and expiry]")
+        aging = CacheManager(cache_dir=tmp, config={"stale_after": -1, "ttl": 3600})
+        aging.save_to_cache("https://linkedin.com/in/old", briefing, "ctx")
+        entry = aging.get_entry("https://linkedin.com/in/old", "ctx")
+        expired = CacheManager(cache_dir=tmp, config={"stale_after": -1, "ttl": -1})
+        expired.save_to_cache("https://linkedin.com/in/gone", briefing, "ctx")
+        print(f"Stale entry served: {entry is not None and entry['is_stale']}")
+        ttl_ok = entry["is_stale"] and expired.get_from_cache("https://linkedin.com/in/gone", "ctx") is None
+
+        print("\n[Test 5: Demo and legacy files still serve any context]")
+        cache.save_to_cache("https://linkedin.com/in/demo", {"demo": True}, pinned=True)
+        with open(os.path.join(tmp, "profile_legacy.json"), "w") as f:
+            json.dump({"legacy": True}, f)
+        # Earlier versions kept the URL's own case in the filename
+        with open(os.path.join(tmp, "profile_Jane-Doe-42.json"), "w") as f:
+            json.dump({"mixed_case": True}, f)
+        fresh = CacheManager(cache_dir=tmp)
+        demo_ok = (fresh.get_from_cache("https://linkedin.com/in/demo", "Demo Run") == {"demo": True}
+                   and fresh.get_from_cache("https://linkedin.com/in/legacy", "Demo Run") == {"legacy": True}
+                   and fresh.get_from_cache("https://www.linkedin.com/in/Jane-Doe-42/", "Demo Run") == {"mixed_case": True}
+                   and fresh.get_latest_for_profile("https://linkedin.com/in/Jane-Doe-42") == {"mixed_case": True})
+
+        print("\n[Test 6: Writes are atomic and counters move]")
+        leftovers = [f for f in os.listdir(tmp) if f.startswith(".tmp_")]
+        print(f"Stats: {cache.stats}")
+        stats_ok = not leftovers and cache.stats["writes"] == 4 and cache.stats["misses"] >= 1
+
+        print("\n[Test 7: Expired files are deleted when found]")
+        gone = os.path.join(tmp, expired.get_cache_key("https://linkedin.com/in/gone", "ctx"))
+        expired_deleted_ok = not os.path.exists(gone)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("\n[Test 8: The disk tier is swept down to max_entries, oldest first, pinned kept]")
+        with open(os.path.join(tmp, "auth_state.json"), "w") as f:
+            json.dump({"cookies": []}, f)
+        small = CacheManager(cache_dir=tmp, config={"max_entries": 3, "sweep_every": 1})
+        small.save_to_cache("https://linkedin.com/in/pinned", {"demo": True}, pinned=True)
+        for i in range(5):
+            small.save_to_cache(f"https://linkedin.com/in/user{i}", {"i": i}, "ctx")
+            path = os.path.join(tmp, small.get_cache_key(f"https://linkedin.com/in/user{i}", "ctx"))
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        files = sorted(f for f in os.listdir(tmp) if f.startswith("profile_"))
+        print(f"Files left: {len(files)}, stats: {small.stats}")
+        sweep_ok = (
+            len(files) == 3
+            and small.get_from_cache("https://linkedin.com/in/pinned", "any") == {"demo": True}
+            and small.get_from_cache("https://linkedin.com/in/user4", "ctx") == {"i": 4}
+            and small.get_from_cache("https://linkedin.com/in/user0", "ctx") is None
+            and os.path.exists(os.path.join(tmp, "auth_state.json"))
+        )
+
+        print("\n[Test 9: Async saves write through a worker thread]")
+        async def save_async():
+            await small.save_to_cache_async("https://linkedin.com/in/async", {"async": True}, "ctx")
+        asyncio.run(save_async())
+        async_ok = CacheManager(cache_dir=tmp).get_from_cache("https://linkedin.com/in/async", "ctx") == {"async": True}
+
+    if (canonical_ok and context_ok and collide_ok and ttl_ok and demo_ok and stats_ok
+            and expired_deleted_ok and sweep_ok and async_ok):
+        print("\nSUCCESS: Cache manager working correctly.")
+    else:
+        print("\nFAILURE: Cache manager checks failed.")
+
+if __name__ == "__main__":
+    verify_cache_manager()
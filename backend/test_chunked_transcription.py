@@ -0,0 +1,191 @@
+import asyncio
+import io
+import sys
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+from pydub.silence import detect_nonsilent
+
+from src.audio import chunker
+from src.audio.chunker import AudioSource
+from src.audio.transcriber import ChunkedTranscriber
+
+WORD_MS = 300
+BASE_HZ = 300
+STEP_HZ = 25
+FAST_CONFIG = {
+    "min_duration": 5.0, "target_chunk": 5.0, "min_chunk": 2.0, "max_chunk": 8.0,
+    "overlap": 0.5, "max_concurrency": 3, "retry_backoff": 0.01
+}
+
+def make_recording(word_count):
+    """
+    One tone per "word", each at its own pitch. Every fourth gap is a long
+    pause the chunker can cut in; the others are too short to count.
+    """
+    audio = AudioSegment.silent(duration=200)
+    starts, pauses = [], []
+    for i in range(word_count):
+        starts.append(len(audio) / 1000)
+        audio += Sine(BASE_HZ + STEP_HZ * i).to_audio_segment(duration=WORD_MS, volume=-6)
+        gap = 600 if i % 4 == 3 else 150
+        if gap == 600:
+            pauses.append((len(audio) / 1000, (len(audio) + gap) / 1000))
+        audio += AudioSegment.silent(duration=gap)
+    return audio, starts, pauses
+
+def estimate_hz(segment):
+    samples = segment.get_array_of_samples()
+    crossings = sum(1 for a, b in zip(samples, samples[1:]) if (a < 0) != (b < 0))
+    return crossings / 2 / (len(segment) / 1000)
+
+class StubSpeechToText:
+    """
+    Local stand-in for ElevenLabs speech_to_text.convert: every tone in the
+    uploaded audio becomes a word named after its pitch, with timings.
+    """
+    def __init__(self, fail_once=()):
+        self.fail_once = set(fail_once)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def convert(self, file, model_id, language_code):
+        name, stream = (file[0], file[1]) if isinstance(file, tuple) else ("whole.wav", file)
+        with self.lock:
+            self.calls.append(name)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.1)
+            if name in self.fail_once:
+                self.fail_once.discard(name)
+                raise ConnectionError(f"upstream reset while sending {name}")
+            audio = AudioSegment.from_wav(stream)
+            words = []
+            for start, end in detect_nonsilent(audio, min_silence_len=100, silence_thresh=-40):
+                index = round((estimate_hz(audio[start:end]) - BASE_HZ) / STEP_HZ)
+                words.append(SimpleNamespace(text=f"w{index}", start=start / 1000, end=end / 1000, type="word"))
+            return SimpleNamespace(text=" ".join(w.text for w in words), words=words)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+async def verify_chunked_transcription():
+    print("--- Testing Chunked Transcription ---")
+
+    audio, starts, pauses = make_recording(40)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        audio.export(tmp, format="wav")
+        path = tmp.name
+
+    try:
+        print("\n[Test 1: Chunks are cut in pauses and stitched without gaps or duplicates]")
+        stub = StubSpeechToText(fail_once={"chunk-1.wav"})
+        result = await ChunkedTranscriber(stub.convert, config=FAST_CONFIG).transcribe(path)
+        print(f"{result['chunks']} chunks, {len(result['words'])} words, retried {result['retried_chunks']}")
+        print(f"Segments: {[(s['start'], s['end']) for s in result['segments']]}")
+        expected = [f"w{i}" for i in range(40)]
+        cuts = [segment["start"] for segment in result["segments"][1:]]
+        stitch_ok = (
+            result["chunks"] > 2
+            and [w["text"] for w in result["words"]] == expected
+            and result["text"] == " ".join(expected)
+            and all(abs(w["start"] - s) < 0.05 for w, s in zip(result["words"], starts))
+            and all(any(a <= cut <= b for a, b in pauses) for cut in cuts)
+        )
+
+        print("\n[Test 2: Only the failed chunk is retried; chunks run concurrently]")
+        print(f"Calls: {stub.calls}, max in flight: {stub.max_in_flight}")
+        retry_ok = (
+            result["retried_chunks"] == [1]
+            and stub.calls.count("chunk-1.wav") == 2
+            and all(stub.calls.count(f"chunk-{i}.wav") == 1 for i in range(result["chunks"]) if i != 1)
+            and 1 < stub.max_in_flight <= FAST_CONFIG["max_concurrency"]
+        )
+
+        print("\n[Test 3: Short recordings are sent whole]")
+        stub = StubSpeechToText()
+        short = await ChunkedTranscriber(stub.convert, config={**FAST_CONFIG, "min_duration": 600}).transcribe(path)
+        print(f"Calls: {stub.calls}")
+        whole_ok = stub.calls == ["whole.wav"] and short["chunks"] == 1 and short["text"] == " ".join(expected)
+
+        print("\n[Test 4: The recording is never decoded whole, only a window at a time]")
+        spans = []
+        original_window = AudioSource.window
+
+        def recording_window(self, start, end):
+            spans.append(end - start)
+            return original_window(self, start, end)
+
+        AudioSource.window = recording_window
+        try:
+            with open(path, "rb") as recording:
+                streamed = await ChunkedTranscriber(StubSpeechToText().convert, config=FAST_CONFIG).transcribe(recording, "wav")
+        finally:
+            AudioSource.window = original_window
+        duration = AudioSource(path).duration()
+        widest = FAST_CONFIG["max_chunk"] + 2 * FAST_CONFIG["overlap"]
+        print(f"Duration {duration:.1f}s read in {len(spans)} windows, widest {max(spans):.1f}s")
+        window_ok = (
+            abs(duration - len(audio) / 1000) < 0.01
+            and max(spans) <= widest
+            and [w["text"] for w in streamed["words"]] == expected
+        )
+
+        print("\n[Test 5: ffmpeg gets a seekable input for non-WAV uploads]")
+        commands = []
+
+        def fake_ffmpeg(command, capture_output, check, pass_fds=()):
+            source = command[command.index("-i") + 1]
+            with open(source, "rb") as f:
+                f.seek(1024)  # A pipe would fail here
+            commands.append((command, pass_fds))
+            if command[0] == "ffprobe":
+                return SimpleNamespace(stdout=f"{len(audio) / 1000}\n".encode())
+            start = float(command[command.index("-ss") + 1])
+            length = float(command[command.index("-t") + 1])
+            buffer = io.BytesIO()
+            audio[int(start * 1000):int((start + length) * 1000)].export(buffer, format="wav")
+            return SimpleNamespace(stdout=buffer.getvalue())
+
+        original_run = chunker.subprocess.run
+        chunker.subprocess.run = fake_ffmpeg
+        copies = []
+        try:
+            with open(path, "rb") as upload:
+                on_disk = await ChunkedTranscriber(StubSpeechToText().convert, config=FAST_CONFIG).transcribe(upload, "mp3")
+            source = AudioSource(io.BytesIO(open(path, "rb").read()), "mp3")
+            source.duration()
+            copies.append(source._copy)
+            source.close()
+        finally:
+            chunker.subprocess.run = original_run
+        inputs = sorted({command[command.index("-i") + 1] for command, _ in commands})
+        print(f"{len(commands)} ffmpeg/ffprobe runs, inputs: {inputs}")
+        seek_ok = (
+            [w["text"] for w in on_disk["words"]] == expected
+            and all(path.startswith("/dev/fd/") or path == copies[0] for path in inputs)
+            and all(fds for command, fds in commands if command[command.index("-i") + 1].startswith("/dev/fd/"))
+            and all(command.index("-ss") < command.index("-i") for command, _ in commands if command[0] == "ffmpeg")
+            and copies[0] is not None and not os.path.exists(copies[0])
+        )
+    finally:
+        os.unlink(path)
+
+    if stitch_ok and retry_ok and whole_ok and window_ok and seek_ok:
+        print("\nSUCCESS: Chunked transcription working correctly.")
+    else:
+        print("\nFAILURE: Chunked transcription checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_chunked_transcription())
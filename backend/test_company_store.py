@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import os
+import tempfile
+from contextlib import asynccontextmanager
+import httpx
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.storage.company_store import CompanyIntelStore
+from src.agents.company_researcher import CompanyResearcher
+from src.agents.yutori_researcher import YutoriResearcher
+from src.agents.yutori_client import AsyncYutoriClient
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    async def inner_text(self):
+        return self.text
+
+class FakePage:
+    async def goto(self, url):
+        pass
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return None
+
+    async def wait_for_load_state(self, state, **kwargs):
+        return None
+
+    async def query_selector_all(self, selector):
+        return [FakeElement("Acme raises Series B to expand robotics line")]
+
+class FakePool:
+    def __init__(self):
+        self.leases = 0
+
+    @asynccontextmanager
+    async def lease_page(self, site=None):
+        self.leases += 1
+        yield FakePage()
+
+def mock_yutori():
+    """
+    Local stand-in for the Yutori API that records task prompts.
+    """
+    prompts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            prompts.append(request.content.decode())
+            return httpx.Response(200, json={"task_id": f"task-{len(prompts)}"})
+        output = '{"name": "Acme", "industry": "Robotics", "funding": {"stage": "Series B"}, "recent_news": ["Acme ships v2"], "competitors": ["Globex"], "talking_points": ["Automation ROI"]}'
+        return httpx.Response(200, json={"status": "completed", "output": output})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncYutoriClient("test-key", config={"poll_initial_interval": 0.01}, http_client=http), prompts
+
+async def verify_company_store():
+    print("--- Testing Company Intel Store ---")
+    tmp_dir = tempfile.mkdtemp()
+
+    print("\n[Test 1: Names normalize and fields expire independently]")
+    store = CompanyIntelStore({"path": os.path.join(tmp_dir, "intel.sqlite"), "field_ttls": {"recent_news": 0.1, "default": 60}})
+    await store.put("Acme, Inc.", {"recent_news": ["news"], "industry": "Robotics"})
+    fresh = await store.get("acme", ["recent_news", "industry"])
+    await asyncio.sleep(0.15)
+    later = await store.get("ACME Corp", ["recent_news", "industry"])
+    print(f"Fresh: {sorted(fresh)}, after news TTL: {sorted(later)}")
+    ttl_ok = sorted(fresh) == ["industry", "recent_news"] and sorted(later) == ["industry"]
+
+    print("\n[Test 2: CompanyResearcher scrapes once per company]")
+    store = CompanyIntelStore({"path": os.path.join(tmp_dir, "scrape.sqlite")})
+    pool = FakePool()
+    researcher = CompanyResearcher(api_key="mock_key", browser_pool=pool, company_store=store)
+    first = await researcher.research_company("Acme", "CTO")
+    second = await researcher.research_company("Acme Inc", "VP Sales")
+    print(f"Browser leases: {pool.leases}, news: {second['recent_news']}")
+    scrape_ok = pool.leases == 1 and first["recent_news"] == second["recent_news"]
+
+    print("\n[Test 3: YutoriResearcher only asks for what is missing]")
+    store = CompanyIntelStore({"path": os.path.join(tmp_dir, "yutori.sqlite")})
+    researcher = YutoriResearcher(api_key="test-key", company_store=store)
+    researcher.client, prompts = mock_yutori()
+    first = await researcher.research_company("Acme", "CTO")
+    same_role = await researcher.research_company("Acme", "CTO")
+    other_role = await researcher.research_company("Acme", "CFO")
+    print(f"Yutori tasks: {len(prompts)}; second prompt asks for news: {'recent news' in prompts[-1]}")
+    yutori_ok = (
+        len(prompts) == 2
+        and "recent news" in prompts[0]
+        and "recent news" not in prompts[1]
+        and "'CFO'" in prompts[1]
+        and same_role == first
+        and other_role["industry"] == "Robotics"
+    )
+
+    # A fresh store with the scraped news lets Yutori skip that part too
+    mixed = CompanyIntelStore({"path": os.path.join(tmp_dir, "mixed.sqlite")})
+    await mixed.put("Globex", {"recent_news": ["Globex opens Berlin office"]})
+    researcher = YutoriResearcher(api_key="test-key", company_store=mixed)
+    researcher.client, prompts = mock_yutori()
+    result = await researcher.research_company("Globex", "CTO")
+    shared_ok = "recent news" not in prompts[0] and result["recent_news"] == ["Globex opens Berlin office"]
+
+    if ttl_ok and scrape_ok and yutori_ok and shared_ok:
+        print("\nSUCCESS: Company intel store working correctly.")
+    else:
+        print("\nFAILURE: Company intel store checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_company_store())
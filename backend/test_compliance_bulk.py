@@ -0,0 +1,268 @@
+import asyncio
+import sys
+import os
+import json
+import tempfile
+from types import SimpleNamespace
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.compliance.bulk import (
+    BulkComplianceRunner, OutputLock, OutputLockedError, discover_inputs, parquet_available, read_results
+)
+from src.compliance.engine import ComplianceEngine
+
+FAST_CONFIG = {"bulk_concurrency": 3, "batch_poll_interval": 0.01}
+CLEAN = "Agent: This call is being recorded.\nCaller: Where is my parcel?\nAgent: It ships tomorrow."
+PUSHY = "Agent: This call is being recorded.\nAgent: You must decide right now, the offer expires today."
+
+def report_for(prompt):
+    violations = []
+    if "decide right now" in prompt:
+        violations.append({"rule_code": "NO_PRESSURE_TACTICS", "severity": "HIGH", "quote": "decide right now"})
+    return json.dumps({
+        "total_violations": len(violations), "risk_level": "HIGH" if violations else "NONE",
+        "violations": violations, "compliant_areas": [], "summary": "Reviewed"
+    })
+
+class AsyncEntries:
+    def __init__(self, entries):
+        self.entries = entries
+
+    async def __aiter__(self):
+        for entry in self.entries:
+            yield entry
+
+class FakeBatches:
+    def __init__(self, fail_retrieve=False, fail_create_after=None):
+        self.created = []
+        self.polls = 0
+        self.fail_retrieve = fail_retrieve
+        self.fail_create_after = fail_create_after
+
+    async def create(self, requests):
+        if self.fail_create_after is not None and len(self.created) >= self.fail_create_after:
+            raise ConnectionError("lost connection while submitting")
+        self.created.append(requests)
+        return SimpleNamespace(id=f"batch-{len(self.created)}")
+
+    async def retrieve(self, batch_id):
+        if self.fail_retrieve:
+            raise ConnectionError("lost connection while polling")
+        self.polls += 1
+        status = "ended" if self.polls > 1 else "in_progress"
+        return SimpleNamespace(processing_status=status, request_counts=None)
+
+    async def results(self, batch_id):
+        requests = self.created[int(batch_id.split("-")[1]) - 1]
+        return AsyncEntries([
+            SimpleNamespace(custom_id=r["custom_id"], result=SimpleNamespace(
+                type="succeeded",
+                message=SimpleNamespace(content=[SimpleNamespace(type="text", text=report_for(r["params"]["messages"][0]["content"]))])
+            ))
+            for r in requests
+        ])
+
+class FakeMessages:
+    def __init__(self, batches=None):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches = batches or FakeBatches()
+
+    async def create(self, call_site, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(content=[SimpleNamespace(text=report_for(kwargs["messages"][0]["content"]))])
+
+def make_inputs(root):
+    calls = os.path.join(root, "calls")
+    os.makedirs(os.path.join(calls, "night"))
+    for i in range(8):
+        with open(os.path.join(calls, "night", f"call-{i}.txt"), "w") as f:
+            f.write(PUSHY if i % 2 else CLEAN)
+    with open(os.path.join(calls, "night", "call-8.wav"), "wb") as f:
+        f.write(b"RIFF")
+    with open(os.path.join(calls, "notes.md"), "w") as f:
+        f.write("not a call")
+    jsonl = os.path.join(root, "calls.jsonl")
+    with open(jsonl, "w") as f:
+        for i in range(4):
+            f.write(json.dumps({"id": f"j{i}", "transcript": PUSHY if i % 2 else CLEAN}) + "\n")
+    return calls, jsonl
+
+async def verify_compliance_bulk():
+    print("--- Testing Bulk Compliance Analysis ---")
+    root = tempfile.mkdtemp()
+    calls, jsonl = make_inputs(root)
+
+    print("\n[Test 1: Inputs are discovered from a directory and a JSONL file]")
+    items = discover_inputs(calls)
+    print(f"Directory items: {[item['id'] for item in items]}")
+    discover_ok = (
+        len(items) == 9
+        and items[0]["id"] == os.path.join("night", "call-0.txt")
+        and "audio_path" in items[-1]
+        and [item["id"] for item in discover_inputs(jsonl)] == ["j0", "j1", "j2", "j3"]
+    )
+
+    print("\n[Test 1b: Paths that resolve outside the root are rejected]")
+    outside = tempfile.mkdtemp()
+    with open(os.path.join(outside, "secret.wav"), "wb") as f:
+        f.write(b"RIFF")
+    escapes = os.path.join(root, "escapes.jsonl")
+    with open(escapes, "w") as f:
+        f.write(json.dumps({"id": "x", "audio_path": os.path.relpath(os.path.join(outside, "secret.wav"), root)}) + "\n")
+    linked = os.path.join(root, "linked")
+    os.makedirs(linked)
+    os.symlink(os.path.join(outside, "secret.wav"), os.path.join(linked, "call.wav"))
+    rejected = []
+    for source in (escapes, linked):
+        try:
+            discover_inputs(source, root)
+        except ValueError as e:
+            rejected.append(str(e))
+    print(f"Rejected: {rejected}")
+    confine_ok = (
+        len(rejected) == 2
+        and len(discover_inputs(calls, root)) == 9
+        and discover_inputs(escapes)[0]["audio_path"] == os.path.realpath(os.path.join(outside, "secret.wav"))
+    )
+
+    print("\n[Test 2: An interrupted realtime run resumes without redoing calls]")
+    output = os.path.join(root, "results.jsonl")
+    llm = SimpleNamespace(messages=FakeMessages())
+    runner = BulkComplianceRunner(ComplianceEngine(llm), transcriber=None, config=FAST_CONFIG)
+    run = runner.run(items, output)
+    first = [await run.__anext__() for _ in range(3)]
+    await run.aclose()
+    events = [event async for event in runner.run(items, output)]
+    summary = events[-1]["data"]
+    records = read_results(output)
+    print(f"First pass: {len(first)} items; resumed summary: {summary}")
+    completed_before = sum(1 for event in first if event["data"]["status"] == "completed")
+    resume_ok = (
+        summary["skipped"] == completed_before
+        and summary["completed"] + summary["failed"] == len(items) - completed_before
+        and len(records) == len(items)
+        and records[os.path.join("night", "call-1.txt")]["risk_level"] == "HIGH"
+        and records[os.path.join("night", "call-0.txt")]["risk_level"] == "NONE"
+        and records[os.path.join("night", "call-8.wav")]["status"] == "failed"
+        and all(r["latency_ms"] is not None for r in records.values() if r["status"] == "completed")
+    )
+    # Every transcript reaches the LLM once, plus the calls cut off by the interruption
+    concurrency_ok = llm.messages.calls <= 8 + 3 and 1 < llm.messages.max_in_flight <= FAST_CONFIG["bulk_concurrency"]
+    print(f"LLM calls: {llm.messages.calls}, max in flight: {llm.messages.max_in_flight}")
+
+    print("\n[Test 3: Batch mode submits one batch and resumes polling after a crash]")
+    output = os.path.join(root, "batch.jsonl")
+    items = discover_inputs(jsonl)
+    batches = FakeBatches(fail_retrieve=True)
+    llm = SimpleNamespace(messages=FakeMessages(batches))
+    runner = BulkComplianceRunner(ComplianceEngine(llm), config=FAST_CONFIG)
+    crashed = []
+    try:
+        async for event in runner.run(items, output, mode="batch"):
+            crashed.append(event)
+    except ConnectionError as e:
+        print(f"First run stopped: {e}")
+    state_kept = os.path.exists(output + ".batch.json")
+    batches.fail_retrieve = False
+    parquet = os.path.join(root, "batch.parquet") if parquet_available() else None
+    events = [event async for event in runner.run(items, output, mode="batch", parquet_path=parquet)]
+    records = read_results(output)
+    kinds = [event["event"] for event in events]
+    print(f"Events: {kinds}; batches created: {len(batches.created)}")
+    batch_ok = (
+        state_kept
+        and len(batches.created) == 1
+        and len(batches.created[0]) == 4
+        and llm.messages.calls == 0
+        and "progress" in kinds
+        and [records[f"j{i}"]["risk_level"] for i in range(4)] == ["NONE", "HIGH", "NONE", "HIGH"]
+        and not os.path.exists(output + ".batch.json")
+    )
+
+    print("\n[Test 4: A resumed batch run submits calls that never reached a batch]")
+    output = os.path.join(root, "partial.jsonl")
+    batches = FakeBatches(fail_create_after=1)
+    llm = SimpleNamespace(messages=FakeMessages(batches))
+    runner = BulkComplianceRunner(ComplianceEngine(llm), config={**FAST_CONFIG, "batch_max_requests": 2})
+    try:
+        [event async for event in runner.run(items[:3], output, mode="batch")]
+    except ConnectionError as e:
+        print(f"First run stopped: {e}")
+    with open(output + ".batch.json") as f:
+        checkpoint = json.load(f)
+    batches.fail_create_after = None
+    extra = {"id": "j4", "transcript": PUSHY}
+    events = [event async for event in runner.run(items + [extra], output, mode="batch")]
+    records = read_results(output)
+    submitted = [sorted(r["custom_id"] for r in batch) for batch in batches.created]
+    print(f"Checkpointed calls: {sorted(checkpoint['calls'])}; batches: {submitted}")
+    partial_ok = (
+        sorted(checkpoint["calls"]) == ["j0", "j1"] and checkpoint["batches"] == ["batch-1"]
+        and len(batches.created) == 3
+        and sorted(c for batch in submitted for c in batch) == sorted(set(c for batch in submitted for c in batch))
+        and sorted(records) == ["j0", "j1", "j2", "j3", "j4"]
+        and all(record["status"] == "completed" for record in records.values())
+        and records["j4"]["risk_level"] == "HIGH"
+        and events[-1]["data"]["completed"] == 5
+    )
+
+    print("\n[Test 5: A batch run stopped while writing records does not write them twice]")
+    output = os.path.join(root, "stopped.jsonl")
+    batches = FakeBatches()
+    runner = BulkComplianceRunner(ComplianceEngine(SimpleNamespace(messages=FakeMessages(batches))), config=FAST_CONFIG)
+    run = runner.run(items, output, mode="batch")
+    async for event in run:
+        if event["event"] == "item":
+            break
+    await run.aclose()
+    state_kept = os.path.exists(output + ".batch.json")
+    events = [event async for event in runner.run(items, output, mode="batch")]
+    with open(output) as f:
+        written = [json.loads(line)["id"] for line in f]
+    print(f"State kept: {state_kept}; records written: {written}; summary: {events[-1]['data']}")
+    stopped_ok = (
+        state_kept
+        and sorted(written) == ["j0", "j1", "j2", "j3"]
+        and events[-1]["data"]["skipped"] == 1
+        and events[-1]["data"]["completed"] == 3
+        and len(batches.created) == 1
+    )
+
+    print("\n[Test 6: Only one run at a time writes to an output file]")
+    held = OutputLock(output).acquire()
+    try:
+        [event async for event in runner.run(items, output, mode="batch")]
+        blocked = False
+    except OutputLockedError as e:
+        print(f"Second run refused: {e}")
+        blocked = True
+    held.release()
+    events = [event async for event in runner.run(items, output, mode="batch")]
+    print(f"After release: {events[-1]['data']}")
+    lock_ok = blocked and events[-1]["data"]["skipped"] == 4
+
+    parquet_ok = True
+    if parquet:
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(parquet)
+        print(f"Parquet: {table.num_rows} rows, columns {table.column_names}")
+        parquet_ok = table.num_rows == 4 and "latency_ms" in table.column_names
+
+    if (discover_ok and confine_ok and resume_ok and concurrency_ok and batch_ok and partial_ok and stopped_ok
+            and lock_ok and parquet_ok):
+        print("\nSUCCESS: Bulk compliance analysis working correctly.")
+    else:
+        print("\nFAILURE: Bulk compliance analysis checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_compliance_bulk())
@@ -0,0 +1,158 @@
+import asyncio
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.compliance.engine import ComplianceEngine
+from src.compliance.prescreen import RULES, RulePrescreen
+
+ALL_RULES = [rule["code"] for rule in RULES]
+OPT_OUT = "Caller: Please take me off your list, I don't want these calls."
+PUSHBACK = "Agent: Before you go, let me tell you about our premium plan."
+
+def make_call(filler_turns, disclosure=True, extra=()):
+    opening = "Agent: Thanks for calling Acme, this call is being recorded." if disclosure else "Agent: Thanks for calling Acme."
+    lines = [opening, "Caller: Hi, I'm calling about my delivery."]
+    for i in range(filler_turns):
+        lines.append("Agent: Let me check the shipping status for you." if i % 2 else "Caller: It was supposed to arrive Tuesday.")
+    lines.extend(extra)
+    lines.append("Agent: Is there anything else I can help with?")
+    return "\n".join(lines)
+
+class FakeMessages:
+    def __init__(self, violations=()):
+        self.prompts = []
+        self.violations = list(violations)
+
+    async def create(self, call_site, **kwargs):
+        self.prompts.append(kwargs["messages"][0]["content"])
+        report = {
+            "total_violations": len(self.violations),
+            "risk_level": "HIGH" if self.violations else "NONE",
+            "violations": self.violations,
+            "compliant_areas": [],
+            "summary": "Checked the remaining rules"
+        }
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(report))])
+
+def sent_transcript(prompt):
+    return prompt.split("TRANSCRIPT:\n", 1)[-1]
+
+async def verify_compliance_prescreen():
+    print("--- Testing Compliance Rule Pre-screen ---")
+    conduct = ["IDENTITY_VERIFICATION", "NO_PRESSURE_TACTICS", "ACCURATE_INFORMATION"]
+
+    print("\n[Test 1: A clean call settles the disclosure; the agent's turns still reach the LLM]")
+    call = make_call(20)
+    llm = SimpleNamespace(messages=FakeMessages())
+    result = await ComplianceEngine(llm).analyze(call)
+    prompt = llm.messages.prompts[0] if llm.messages.prompts else ""
+    sent = sent_transcript(prompt)
+    print(f"LLM calls: {len(llm.messages.prompts)}, sent {len(sent)} of {len(call)} characters, result: {json.dumps(result)}")
+    agent_lines = [line for line in call.splitlines() if line.startswith("Agent:")]
+    clean_ok = (
+        len(llm.messages.prompts) == 1
+        and all(code in prompt for code in conduct)
+        and "RECORDING_DISCLOSURE" not in prompt and "OPT_OUT_RESPECT" not in prompt
+        and all(line in sent for line in agent_lines)
+        and "arrive Tuesday" not in sent and "[...]" in sent
+        and result["risk_level"] == "NONE"
+        and result["compliant_areas"] == ["RECORDING_DISCLOSURE"]
+    )
+
+    print("\n[Test 2: A false promise with no trigger words is still checked by the LLM]")
+    promise = make_call(2, extra=["Agent: This fund will double your money by next year, you can't go wrong."])
+    llm = SimpleNamespace(messages=FakeMessages(violations=[{
+        "rule_code": "ACCURATE_INFORMATION",
+        "severity": "HIGH",
+        "quote": "This fund will double your money by next year",
+        "explanation": "Promises a return",
+        "suggestion": "Describe the fund's risks"
+    }]))
+    result = await ComplianceEngine(llm).analyze(promise)
+    print(f"Result: {json.dumps(result)}")
+    promise_ok = (
+        len(llm.messages.prompts) == 1
+        and "double your money" in sent_transcript(llm.messages.prompts[0])
+        and result["risk_level"] == "HIGH"
+        and "ACCURATE_INFORMATION" not in result["compliant_areas"]
+    )
+
+    print("\n[Test 3: Only an agent's statement settles the disclosure]")
+    openings = {
+        "caller question": "Agent: Thanks for calling Acme.\nCustomer: Is this call being recorded?",
+        "agent negation": "Agent: Thanks for calling Acme, this call is not being recorded.",
+        "agent question": "Agent: Did you know this call is recorded?",
+        "unlabelled": "Thanks for calling Acme, this call is being recorded.",
+        "agent statement": "Agent: Hi there. Just so you know, this call is being recorded for quality purposes."
+    }
+    prescreen = RulePrescreen()
+    decided = {name: prescreen.screen(opening + "\nCaller: Hi.")["settled"].get("RECORDING_DISCLOSURE") for name, opening in openings.items()}
+    print(f"Disclosure quotes: {decided}")
+    disclosure_ok = (
+        all(decided[name] is None for name in ("caller question", "agent negation", "agent question", "unlabelled"))
+        and decided["agent statement"] == "Just so you know, this call is being recorded for quality purposes."
+    )
+    missing = make_call(20, disclosure=False)
+    screen = prescreen.screen(missing)
+    missing_ok = (
+        "RECORDING_DISCLOSURE" in screen["ambiguous"]
+        and screen["excerpt"].startswith("\n".join(missing.splitlines()[:3]))
+    )
+    unlabelled = prescreen.screen("Hello, thanks for calling.\nI'd like my balance.\nSure, it is fifty dollars.\nThanks, bye.")
+    unlabelled_ok = unlabelled["turns"] == [0, 1, 2, 3]
+
+    print("\n[Test 3b: Caller turns around account details are sent for the verification check]")
+    call = make_call(10, extra=[
+        "Caller: Sure, my date of birth is May 2nd.",
+        "Agent: Thanks. Your account balance is 240 dollars."
+    ])
+    screen = prescreen.screen(call)
+    print(screen["excerpt"])
+    context_ok = "Caller: Sure, my date of birth is May 2nd." in screen["excerpt"] and "IDENTITY_VERIFICATION" in screen["ambiguous"]
+
+    print("\n[Test 4: Opt-out applies only after an explicit request, and only its turns are sent]")
+    request_rules = [rule for rule in RULES if rule["mode"] != "conduct"]
+    prescreen = RulePrescreen(rules=request_rules)
+    quiet = prescreen.screen(make_call(20))
+    call = make_call(20, extra=[OPT_OUT, PUSHBACK, "Caller: I said no."])
+    screen = prescreen.screen(call)
+    print(f"Without a request: {quiet['not_applicable']}; with one: {screen['ambiguous']}\n{screen['excerpt']}")
+    request_ok = (
+        quiet["not_applicable"] == ["OPT_OUT_RESPECT"] and quiet["ambiguous"] == []
+        and screen["ambiguous"] == ["OPT_OUT_RESPECT"]
+        and OPT_OUT in screen["excerpt"] and PUSHBACK in screen["excerpt"]
+        and "[...]" in screen["excerpt"] and "shipping status" not in screen["excerpt"]
+    )
+    llm = SimpleNamespace(messages=FakeMessages(violations=[{
+        "rule_code": "OPT_OUT_RESPECT",
+        "severity": "HIGH",
+        "quote": "let me tell you about our premium plan",
+        "explanation": "Kept pitching after an opt-out request",
+        "suggestion": "Confirm the removal and end the pitch"
+    }]))
+    result = await ComplianceEngine(llm).analyze(call)
+    print(f"Result: {json.dumps(result)}")
+    merged_ok = (
+        "OPT_OUT_RESPECT" in llm.messages.prompts[0]
+        and result["total_violations"] == 1
+        and result["compliant_areas"] == ["RECORDING_DISCLOSURE"]
+    )
+
+    print("\n[Test 5: With the pre-screen off every rule goes to the LLM]")
+    llm = SimpleNamespace(messages=FakeMessages())
+    await ComplianceEngine(llm, {"prescreen": False}).analyze(make_call(4))
+    off_ok = len(llm.messages.prompts) == 1 and all(code in llm.messages.prompts[0] for code in ALL_RULES)
+
+    if (clean_ok and promise_ok and disclosure_ok and missing_ok and unlabelled_ok and context_ok
+            and request_ok and merged_ok and off_ok):
+        print("\nSUCCESS: Compliance rule pre-screen working correctly.")
+    else:
+        print("\nFAILURE: Compliance rule pre-screen checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_compliance_prescreen())
@@ -0,0 +1,162 @@
+import asyncio
+import sys
+import os
+import json
+import re
+from types import SimpleNamespace
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.compliance.engine import ComplianceEngine
+from src.compliance.windowing import build_windows, split_turns
+
+SMALL_WINDOWS = {"window_chars": 400, "overlap_turns": 2, "max_concurrency": 3, "prescreen": False}
+PRESSURE = "Agent: You have to decide right now, this offer expires in ten minutes."
+
+def make_transcript(turn_count, pressure_at):
+    lines = ["Agent: Hi, this call is recorded for quality purposes."]
+    for i in range(1, turn_count):
+        if i == pressure_at:
+            lines.append(PRESSURE)
+        elif i % 2:
+            lines.append(f"Caller: I have a question about invoice number {i} on my account.")
+        else:
+            lines.append(f"Agent: Sure, let me look at invoice number {i - 1} for you.")
+    return "\n".join(lines)
+
+class FakeMessages:
+    """
+    Stands in for the compliance model: reports NO_PRESSURE_TACTICS for
+    every excerpt containing the pressure line, quoting it differently in
+    odd and even excerpts, and RECORDING_DISCLOSURE as compliant. With
+    `even_delay` the even excerpts answer that much later (or earlier).
+    """
+    def __init__(self, even_delay=0.0):
+        self.even_delay = even_delay
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, call_site, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        excerpt = re.search(r"excerpt (\d+) of", prompt)
+        odd = not excerpt or int(excerpt.group(1)) % 2 == 1
+        try:
+            await asyncio.sleep(0.05 if odd else 0.05 + self.even_delay)
+        finally:
+            self.in_flight -= 1
+        transcript = prompt.split("TRANSCRIPT:\n", 1)[1]
+        violations = []
+        if "decide right now" in transcript:
+            quote = "decide right now!" if odd else "You have to decide right now, this offer expires"
+            violations.append({
+                "rule_code": "NO_PRESSURE_TACTICS",
+                "severity": "MEDIUM" if odd else "HIGH",
+                "quote": quote,
+                "explanation": "False urgency",
+                "suggestion": "Give the caller time"
+            })
+        report = {
+            "total_violations": len(violations),
+            "risk_level": "LOW",
+            "violations": violations,
+            "compliant_areas": ["RECORDING_DISCLOSURE", "NO_PRESSURE_TACTICS"],
+            "summary": "Window summary"
+        }
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(report))])
+
+async def verify_compliance_windows():
+    print("--- Testing Map-Reduce Compliance Analysis ---")
+
+    print("\n[Test 1: Windows follow speaker turns and overlap]")
+    transcript = make_transcript(30, pressure_at=12)
+    turns = split_turns(transcript)
+    windows = build_windows(turns, SMALL_WINDOWS["window_chars"], SMALL_WINDOWS["overlap_turns"])
+    print(f"{len(turns)} turns in {len(windows)} windows: {[(w['first_turn'], w['last_turn']) for w in windows]}")
+    window_ok = (
+        len(turns) == 30
+        and len(windows) > 2
+        and windows[0]["first_turn"] == 0 and windows[-1]["last_turn"] == 29
+        and all(b["first_turn"] == a["last_turn"] - 1 for a, b in zip(windows, windows[1:]))
+        and all(len(w["text"]) <= SMALL_WINDOWS["window_chars"] for w in windows)
+    )
+
+    print("\n[Test 2: Windows run concurrently and duplicates merge]")
+    llm = SimpleNamespace(messages=FakeMessages())
+    # Put the pressure line in the overlap of two windows
+    for pressure_at in range(1, 30):
+        transcript = make_transcript(30, pressure_at=pressure_at)
+        windows = build_windows(split_turns(transcript), SMALL_WINDOWS["window_chars"], SMALL_WINDOWS["overlap_turns"])
+        if sum(1 for w in windows if w["first_turn"] <= pressure_at <= w["last_turn"]) == 2:
+            break
+    result = await ComplianceEngine(llm, SMALL_WINDOWS).analyze(transcript)
+    seen_in = sum(1 for p in llm.messages.prompts if "decide right now" in p.split("TRANSCRIPT:\n", 1)[1])
+    print(f"{len(llm.messages.prompts)} calls, max in flight {llm.messages.max_in_flight}, pressure seen by {seen_in}")
+    print(f"Result: {json.dumps(result)}")
+    merge_ok = (
+        seen_in == 2
+        and 1 < llm.messages.max_in_flight <= SMALL_WINDOWS["max_concurrency"]
+        and result["total_violations"] == 1
+        and result["violations"][0]["severity"] == "HIGH"
+        and result["violations"][0]["quote"].startswith("You have to decide")
+        and result["risk_level"] == "HIGH"
+        and result["compliant_areas"] == ["RECORDING_DISCLOSURE"]
+        and result["summary"] != "Window summary"
+    )
+    first_prompts = [p for p in llm.messages.prompts if "excerpt 1 of" in p]
+    later_prompts = [p for p in llm.messages.prompts if "excerpt 1 of" not in p]
+    note_ok = (
+        len(first_prompts) == 1
+        and "do not report RECORDING_DISCLOSURE" not in first_prompts[0]
+        and all("do not report RECORDING_DISCLOSURE" in p for p in later_prompts)
+    )
+    # Once the pre-screen has settled the disclosure, later excerpts don't name it
+    later = next(w for w in windows if w["first_turn"] > 0)
+    settled_prompt = ComplianceEngine(llm, SMALL_WINDOWS)._window_request(
+        {**later, "total_turns": 30}, 1, len(windows), ["NO_PRESSURE_TACTICS"], False
+    )["messages"][0]["content"]
+    note_ok = note_ok and "RECORDING_DISCLOSURE" not in settled_prompt and "does not include the start" in settled_prompt
+
+    print("\n[Test 3: Short transcripts make one unchanged call]")
+    llm = SimpleNamespace(messages=FakeMessages())
+    short = make_transcript(6, pressure_at=3)
+    result = await ComplianceEngine(llm, {"prescreen": False}).analyze(short)
+    single_ok = (
+        len(llm.messages.prompts) == 1
+        and llm.messages.prompts[0].endswith("TRANSCRIPT:\n" + short + "\n")
+        and "excerpt" not in llm.messages.prompts[0]
+        and result["summary"] == "Window summary"
+        and result["total_violations"] == 1
+    )
+
+    print("\n[Test 4: Streaming emits each distinct violation once, then the copy the merge keeps]")
+    llm = SimpleNamespace(messages=FakeMessages(even_delay=0.05))
+    events = [event async for event in ComplianceEngine(llm, SMALL_WINDOWS).stream(transcript)]
+    kinds = [event["event"] for event in events]
+    print(f"Events: {kinds}")
+    streamed = [event["data"] for event in events if event["event"] == "violation"]
+    for event in events:
+        if event["event"] == "violation_update":
+            streamed[event["data"]["index"]] = event["data"]["violation"]
+    stream_ok = (
+        kinds == ["violation", "violation_update", "complete"]
+        and events[0]["data"]["severity"] == "MEDIUM"
+        and streamed == events[-1]["data"]["violations"]
+        and events[-1]["data"]["total_violations"] == 1
+    )
+    # A less preferred copy arriving later is not streamed again
+    llm = SimpleNamespace(messages=FakeMessages(even_delay=-0.04))
+    kinds = [event["event"] async for event in ComplianceEngine(llm, SMALL_WINDOWS).stream(transcript)]
+    stream_ok = stream_ok and kinds == ["violation", "complete"]
+
+    if window_ok and merge_ok and note_ok and single_ok and stream_ok:
+        print("\nSUCCESS: Map-reduce compliance analysis working correctly.")
+    else:
+        print("\nFAILURE: Map-reduce compliance analysis checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_compliance_windows())
@@ -0,0 +1,72 @@
+import asyncio
+import sys
+import os
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.pipeline.dag_executor import DAGExecutor, Stage, StageFailedError
+
+async def verify_dag_executor():
+    print("--- Testing Pipeline DAG Executor ---")
+
+    def sleeper(value, delay):
+        async def run(inputs):
+            await asyncio.sleep(delay)
+            return value
+        return run
+
+    async def combine(inputs):
+        return inputs["a"] + inputs["b"]
+
+    print("\n[Test 1: Independent stages run concurrently]")
+    executor = DAGExecutor([
+        Stage("a", sleeper(1, 0.2)),
+        Stage("b", sleeper(2, 0.2)),
+        Stage("sum", combine, depends_on=["a", "b"]),
+    ])
+    start = time.perf_counter()
+    results = await executor.run()
+    elapsed = time.perf_counter() - start
+    print(f"Result: {results['sum']} in {elapsed:.2f}s")
+    concurrent_ok = results["sum"] == 3 and elapsed < 0.35
+
+    print("\n[Test 2: Timeout falls back]")
+    executor = DAGExecutor([
+        Stage("slow", sleeper("real", 1.0), timeout=0.1, fallback="fallback"),
+    ])
+    results = await executor.run()
+    print(f"Result: {results['slow']} ({executor.timings['slow']['status']})")
+    fallback_ok = results["slow"] == "fallback" and executor.timings["slow"]["status"] == "timeout_fallback"
+
+    print("\n[Test 3: Required stage failure aborts the run]")
+    async def broken(inputs):
+        raise RuntimeError("boom")
+
+    executor = DAGExecutor([
+        Stage("broken", broken),
+        Stage("after", sleeper("never", 0.0), depends_on=["broken"]),
+    ])
+    try:
+        await executor.run()
+        abort_ok = False
+    except StageFailedError as e:
+        print(f"Raised for stage: {e.stage_name}")
+        abort_ok = e.stage_name == "broken"
+
+    print("\n[Test 4: Cycles are rejected]")
+    try:
+        DAGExecutor([Stage("x", combine, depends_on=["y"]), Stage("y", combine, depends_on=["x"])])
+        cycle_ok = False
+    except ValueError as e:
+        print(f"Rejected: {e}")
+        cycle_ok = True
+
+    if concurrent_ok and fallback_ok and abort_ok and cycle_ok:
+        print("\nSUCCESS: DAG executor working correctly.")
+    else:
+        print("\nFAILURE: DAG executor checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_dag_executor())
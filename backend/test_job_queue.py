@@ -0,0 +1,109 @@
+import asyncio
+import sys
+import os
+import tempfile
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.jobs.job_queue import BriefingJobQueue, QueueFullError
+from src.jobs.job_store import JobStore
+
+async def verify_job_queue():
+    print("--- Testing Briefing Job Queue ---")
+    tmp_dir = tempfile.mkdtemp()
+    order = []
+
+    async def handler(payload):
+        order.append(payload["name"])
+        await asyncio.sleep(payload.get("delay", 0.05))
+        if payload.get("fail"):
+            raise RuntimeError("pipeline failed")
+        return {"briefing": payload["name"]}
+
+    config = {"path": os.path.join(tmp_dir, "jobs.sqlite"), "workers": 1, "max_queued": 4}
+    queue = BriefingJobQueue(handler, config=config)
+    await queue.start()
+
+    print("\n[Test 1: Higher-priority jobs run first]")
+    blocker = await queue.submit({"name": "blocker", "delay": 0.1})
+    low = await queue.submit({"name": "low"}, priority=9)
+    high = await queue.submit({"name": "high"}, priority=1)
+    result = await queue.wait(low["id"], timeout=2)
+    print(f"Run order: {order}")
+    priority_ok = order == ["blocker", "high", "low"] and result["result"] == {"briefing": "low"}
+
+    print("\n[Test 2: Long-poll returns before the timeout once the job finishes]")
+    job = await queue.submit({"name": "poll", "delay": 0.1})
+    pending = await queue.wait(job["id"], timeout=0)
+    done = await queue.wait(job["id"], timeout=5)
+    longpoll_ok = pending["status"] in ("queued", "running") and done["status"] == "completed"
+    print(f"Status before: {pending['status']}, after: {done['status']}")
+
+    print("\n[Test 3: Failures and cancellation are recorded]")
+    failing = await queue.submit({"name": "failing", "fail": True})
+    running = await queue.submit({"name": "running", "delay": 5})
+    queued = await queue.submit({"name": "queued"})
+    failed = await queue.wait(failing["id"], timeout=2)
+    await asyncio.sleep(0.05)
+    cancelled_running = await queue.cancel(running["id"])
+    cancelled_queued = await queue.cancel(queued["id"])
+    print(f"Failed: {failed['error']}; running -> {cancelled_running['status']}; queued -> {cancelled_queued['status']}")
+    cancel_ok = (
+        failed["status"] == "failed"
+        and cancelled_running["status"] == "cancelled"
+        and cancelled_queued["status"] == "cancelled"
+        and "queued" not in order
+    )
+
+    print("\n[Test 4: A full queue pushes back]")
+    await queue.submit({"name": "busy", "delay": 0.5})
+    await asyncio.sleep(0.05)
+    burst = []
+    try:
+        for i in range(10):
+            burst.append(await queue.submit({"name": f"burst-{i}"}))
+        backpressure_ok = False
+    except QueueFullError as e:
+        print(f"Rejected with Retry-After {e.retry_after}s after {i} extra jobs")
+        backpressure_ok = i == 4 and e.retry_after >= 1
+
+    print("\n[Test 5: Cancelling a queued job frees its slot]")
+    await queue.cancel(burst[0]["id"])
+    try:
+        burst.append(await queue.submit({"name": "after-cancel"}))
+        slot_ok = queue.summary()["queued"] == 4
+    except QueueFullError:
+        slot_ok = False
+    print(f"Queued after cancel and resubmit: {queue.summary()['queued']}")
+
+    print("\n[Test 6: Polling finished or timed-out jobs leaves no waiters behind]")
+    for _ in range(3):
+        await queue.wait(done["id"], timeout=5)
+        await queue.wait(burst[1]["id"], timeout=0)
+        await queue.wait(burst[1]["id"], timeout=0.01)
+    print(f"Events left: {len(queue._finished_events)}, waiters left: {dict(queue._waiters)}")
+    waiters_ok = not queue._finished_events and not queue._waiters
+    await queue.stop()
+
+    print("\n[Test 7: Unfinished jobs survive a restart]")
+    store = JobStore(config["path"])
+    leftover_ids = [job["id"] for job in store.unfinished()]
+    leftover = len(leftover_ids)
+    store.close()
+    order.clear()
+    restarted = BriefingJobQueue(handler, config={**config, "workers": 2})
+    await restarted.start()
+    await asyncio.gather(*(restarted.wait(job_id, timeout=5) for job_id in leftover_ids))
+    remaining = restarted.store.unfinished()
+    await restarted.stop()
+    print(f"Jobs left over: {leftover}, re-run: {len(order)}, still unfinished: {len(remaining)}")
+    restart_ok = leftover == 5 and len(order) == 5 and not remaining
+
+    if priority_ok and longpoll_ok and cancel_ok and backpressure_ok and slot_ok and waiters_ok and restart_ok:
+        print("\nSUCCESS: Briefing job queue working correctly.")
+    else:
+        print("\nFAILURE: Briefing job queue checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_job_queue())
@@ -0,0 +1,141 @@
+import asyncio
+import sys
+import os
+import json
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.llm.json_stream import JSONArrayStreamParser
+from src.llm.response_cache import CachedLLMClient
+from src.llm.usage_meter import UsageMeter
+from src.synthesis.talking_points import TalkingPointsGenerator
+from src.fabricate.scenario_builder import ConversationScenarioBuilder
+
+POINTS = [
+    {"point": "Inference costs [at scale]", "context": "They said \"GPUs are {scarce}\"", "why_selected": "a",
+     "conversation_opener": "b", "expected_reaction": "c"},
+    {"point": "Hiring", "context": "Team growth", "why_selected": "a", "conversation_opener": "b", "expected_reaction": "c"},
+    {"point": "Open source", "context": "Community", "why_selected": "a", "conversation_opener": "b", "expected_reaction": "c"}
+]
+
+REPORT = {
+    "total_violations": 2,
+    "risk_level": "HIGH",
+    "violations": [
+        {"rule_code": "RECORDING_DISCLOSURE", "severity": "HIGH", "quote": "Hi [agent]", "explanation": "x", "suggestion": "y"},
+        {"rule_code": "NO_PRESSURE_TACTICS", "severity": "MEDIUM", "quote": "Act now!", "explanation": "x", "suggestion": "y"}
+    ],
+    "compliant_areas": ["OPT_OUT_RESPECT"],
+    "summary": "Two issues."
+}
+
+def chunks(text, size=7):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+class FakeBlock:
+    type = "text"
+    def __init__(self, text):
+        self.text = text
+
+class FakeMessage:
+    def __init__(self, text):
+        self.model = "claude-sonnet-4-5"
+        self.content = [FakeBlock(text)]
+        self.stop_reason = "end_turn"
+        self.usage = None
+
+class FakeStream:
+    def __init__(self, text, delay):
+        self.text = text
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in chunks(self.text):
+            await asyncio.sleep(self.delay)
+            yield chunk
+
+    async def get_final_message(self):
+        return FakeMessage(self.text)
+
+class FakeAnthropic:
+    """
+    Streams a canned reply a few characters at a time.
+    """
+    def __init__(self, reply, delay=0.01):
+        self.reply = reply
+        self.delay = delay
+        self.streams = 0
+        self.messages = self
+
+    def stream(self, **kwargs):
+        self.streams += 1
+        return FakeStream(self.reply, self.delay)
+
+async def verify_json_stream():
+    print("--- Testing Streaming JSON Parsing ---")
+
+    print("\n[Test 1: Array elements are emitted as soon as they close]")
+    parser = JSONArrayStreamParser()
+    text = "```json\n" + json.dumps(POINTS, indent=2) + "\n```"
+    emitted_at = []
+    for position, chunk in enumerate(chunks(text, 3)):
+        for item in parser.feed(chunk):
+            emitted_at.append((position * 3, item))
+    second_start = text.index('"point": "Hiring"')
+    print(f"Emitted {len(emitted_at)} items, first at char {emitted_at[0][0]} of {len(text)}")
+    parser_ok = (
+        [item for _, item in emitted_at] == POINTS
+        and emitted_at[0][0] < second_start - 3
+        and json.loads(text.split("```json")[1].split("```")[0]) == POINTS
+    )
+
+    print("\n[Test 2: Array under a key of the top-level object]")
+    parser = JSONArrayStreamParser(array_key="violations")
+    violations = [v for chunk in chunks(json.dumps(REPORT), 5) for v in parser.feed(chunk)]
+    print(f"Violations: {[v['rule_code'] for v in violations]}")
+    keyed_ok = violations == REPORT["violations"] and json.loads(parser.text) == REPORT
+
+    print("\n[Test 3: First talking point arrives before the stream ends]")
+    meter = UsageMeter()
+    client = CachedLLMClient(FakeAnthropic(json.dumps(POINTS)), cache=None, meter=meter)
+    started = time.perf_counter()
+    arrivals = []
+    generator = TalkingPointsGenerator(llm_client=client)
+    points = await generator.generate(
+        {"primary": "AI", "secondary": ["Hiring"]}, "Technical Leader", "Partnership",
+        on_point=lambda point: arrivals.append(time.perf_counter() - started)
+    )
+    total = time.perf_counter() - started
+    print(f"Arrivals: {[round(a, 2) for a in arrivals]}, total {total:.2f}s")
+    streaming_ok = points == POINTS and len(arrivals) == 3 and arrivals[0] < total / 2 and meter.summary()["total"]["calls"] == 1
+
+    print("\n[Test 4: Scenario dialogue turns are streamed per context]")
+    scenario = {
+        "context": "first_meeting", "likely_opener": "Hi", "questions_they_might_ask": [],
+        "topics_to_avoid": [], "topics_to_lean_into": [],
+        "sample_dialogue": [{"speaker": "You", "message": "Hi [there]"}, {"speaker": "Jane", "message": "Hello"}]
+    }
+    client = CachedLLMClient(FakeAnthropic(json.dumps(scenario), delay=0), cache=None, meter=UsageMeter())
+    turns = []
+    result = await ConversationScenarioBuilder(llm_client=client).build_scenarios(
+        {"name": "Jane"}, meeting_contexts=["first_meeting"], on_turn=lambda context, turn: turns.append((context, turn))
+    )
+    print(f"Turns: {turns}")
+    scenario_ok = result == {"first_meeting": scenario} and turns == [("first_meeting", t) for t in scenario["sample_dialogue"]]
+
+    if parser_ok and keyed_ok and streaming_ok and scenario_ok:
+        print("\nSUCCESS: Streaming JSON parsing working correctly.")
+    else:
+        print("\nFAILURE: Streaming JSON parsing checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_json_stream())
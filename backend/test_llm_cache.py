@@ -0,0 +1,85 @@
+import asyncio
+import sys
+import os
+import tempfile
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.llm.response_cache import CachedLLMClient, LLMResponseCache
+
+class FakeBlock:
+    type = "text"
+    def __init__(self, text):
+        self.text = text
+
+class FakeMessage:
+    def __init__(self, text, stop_reason="end_turn"):
+        self.model = "claude-sonnet-4-5"
+        self.content = [FakeBlock(text)]
+        self.stop_reason = stop_reason
+
+class FakeAnthropic:
+    """
+    Counts calls instead of hitting the API.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.messages = self
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        prompt = kwargs["messages"][0]["content"]
+        return FakeMessage(f"answer to {prompt}", stop_reason="max_tokens" if "truncate" in prompt else "end_turn")
+
+    async def close(self):
+        pass
+
+async def verify_llm_cache():
+    print("--- Testing LLM Response Cache ---")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {"path": os.path.join(tmp, "llm_cache.sqlite")}
+        fake = FakeAnthropic()
+        client = CachedLLMClient(fake, LLMResponseCache(config))
+        request = {"model": "claude-sonnet-4-5", "max_tokens": 400, "messages": [{"role": "user", "content": "themes"}]}
+
+        print("\n[Test 1: Repeat prompt served from memory]")
+        first = await client.messages.create(call_site="profile_themes", **request)
+        second = await client.messages.create(call_site="profile_themes", **request)
+        print(f"API calls: {fake.calls}, cached text: {second.content[0].text}")
+        memory_ok = fake.calls == 1 and second.content[0].text == first.content[0].text
+
+        print("\n[Test 2: Different max_tokens is a different key]")
+        await client.messages.create(call_site="profile_themes", **{**request, "max_tokens": 800})
+        key_ok = fake.calls == 2
+
+        print("\n[Test 3: Disk tier survives a restart]")
+        restarted = CachedLLMClient(fake, LLMResponseCache(config))
+        await restarted.messages.create(call_site="profile_themes", **request)
+        print(f"API calls: {fake.calls}, stats: {restarted.cache.stats}")
+        disk_ok = fake.calls == 2 and restarted.cache.stats["disk_hits"] == 1
+
+        print("\n[Test 4: Truncated responses are not cached]")
+        truncated = {**request, "messages": [{"role": "user", "content": "truncate me"}]}
+        await client.messages.create(**truncated)
+        await client.messages.create(**truncated)
+        truncated_ok = fake.calls == 4
+
+        print("\n[Test 5: Expired entries miss]")
+        expiring = CachedLLMClient(fake, LLMResponseCache({**config, "ttls": {"default": -1}}))
+        fresh_request = {**request, "messages": [{"role": "user", "content": "fresh"}]}
+        await expiring.messages.create(**fresh_request)
+        await expiring.messages.create(**fresh_request)
+        ttl_ok = fake.calls == 6
+
+        for c in (client, restarted, expiring):
+            c.cache.close()
+
+    if memory_ok and key_ok and disk_ok and truncated_ok and ttl_ok:
+        print("\nSUCCESS: LLM response cache working correctly.")
+    else:
+        print("\nFAILURE: LLM response cache checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_llm_cache())
@@ -0,0 +1,98 @@
+import asyncio
+import sys
+import os
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.page_readiness import readiness_recorder, wait_for_lazy_content, wait_until_ready
+
+class FakePage:
+    """
+    Each waiter settles after its configured delay (seconds), or raises
+    like a Playwright timeout when the delay is an exception.
+    """
+    def __init__(self, selector=None, network_idle=None, lazy=None):
+        self.delays = {"selector": selector, "network_idle": network_idle, "lazy": lazy}
+        self.cancelled = []
+        self.selector_args = None
+
+    async def _settle(self, name):
+        delay = self.delays[name]
+        try:
+            if isinstance(delay, Exception):
+                await asyncio.sleep(0.01)
+                raise delay
+            await asyncio.sleep(10 if delay is None else delay)
+            return name
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+
+    def wait_for_selector(self, selector, state, timeout):
+        self.selector_args = (selector, state, timeout)
+        return self._settle("selector")
+
+    def wait_for_load_state(self, state, timeout):
+        return self._settle("network_idle")
+
+    def wait_for_function(self, expression, arg, timeout):
+        self.selector_args = (expression, arg, timeout)
+        return self._settle("lazy")
+
+async def verify_page_readiness():
+    print("--- Testing Page Readiness Waits ---")
+
+    print("\n[Test 1: The selector wins when it attaches first]")
+    page = FakePage(selector=0.02, network_idle=0.5)
+    result = await wait_until_ready(page, "linkedin")
+    print(f"Result: {result}, cancelled: {page.cancelled}")
+    selector_ok = (
+        result["outcome"] == "selector"
+        and result["waited_ms"] < 300
+        and page.cancelled == ["network_idle"]
+        and "h1.text-heading-xlarge" in page.selector_args[0]
+    )
+
+    print("\n[Test 2: Network idle wins when it settles first]")
+    page = FakePage(selector=0.5, network_idle=0.02)
+    result = await wait_until_ready(page, "linkedin")
+    print(f"Result: {result}")
+    idle_ok = result["outcome"] == "network_idle" and page.cancelled == ["selector"]
+
+    print("\n[Test 3: A failed waiter does not count as ready]")
+    page = FakePage(selector=TimeoutError("selector timed out"), network_idle=0.1)
+    result = await wait_until_ready(page, "linkedin")
+    print(f"Result: {result}")
+    error_ok = result["outcome"] == "network_idle" and result["waited_ms"] >= 90
+
+    print("\n[Test 4: Nothing settles, so the wait times out at max_wait_ms without raising]")
+    page = FakePage()
+    started = time.perf_counter()
+    result = await wait_until_ready(page, "linkedin", max_wait_ms=150)
+    elapsed = time.perf_counter() - started
+    print(f"Result: {result}, elapsed {elapsed:.2f}s, cancelled: {sorted(page.cancelled)}")
+    timeout_ok = (
+        result["outcome"] == "timeout"
+        and 0.14 <= elapsed < 0.5
+        and sorted(page.cancelled) == ["network_idle", "selector"]
+    )
+
+    print("\n[Test 5: Lazy content waits for more items than before]")
+    page = FakePage(lazy=0.02, network_idle=0.5)
+    result = await wait_for_lazy_content(page, "twitter", previous_count=7)
+    print(f"Result: {result}")
+    lazy_ok = result["outcome"] == "selector" and result["phase"] == "lazy_load" and page.selector_args[1][1] == 7
+
+    summary = readiness_recorder.summary()
+    print(f"Recorder: {summary}")
+    recorder_ok = summary["linkedin:load"]["count"] == 4 and summary["linkedin:load"]["outcomes"]["timeout"] == 1
+
+    if selector_ok and idle_ok and error_ok and timeout_ok and lazy_ok and recorder_ok:
+        print("\nSUCCESS: Page readiness waits working correctly.")
+    else:
+        print("\nFAILURE: Page readiness checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_page_readiness())
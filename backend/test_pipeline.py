@@ -10,6 +10,7 @@ from src.config.yutori_config import YUTORI_CONFIG
 from src.agents.linkedin_browser import LinkedInBrowserAgent
 from src.agents.company_researcher import CompanyResearcher
 from src.agents.twitter_browser import TwitterBrowserAgent
+from src.agents.browser_pool import close_browser_pool
 from src.extractors.profile_extractor import SemanticProfileExtractor
 from src.extractors.theme_engine import ThemeIdentificationEngine
 from src.extractors.data_transformer import StructuredDataTransformer
@@ -65,7 +66,7 @@ async def main():
     sentiment = await extractor.extract_sentiment_patterns(phase1_output["posts"])
     
     print("Identifying deep themes...")
-    theme_insights = theme_engine.identify_themes(phase1_output["posts"])
+    theme_insights = await theme_engine.identify_themes(phase1_output["posts"])
     insights = theme_engine.generate_theme_insights(theme_insights)
     
     # Construct intermediate extraction object
@@ -104,5 +105,8 @@ async def main():
         json.dump(final_output, f, indent=2)
     print("\nSaved to pipeline_output.json")
 
+    # Release the shared browser before the event loop closes
+    await close_browser_pool()
+
 if __name__ == "__main__":
     asyncio.run(main())
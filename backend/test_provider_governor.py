@@ -0,0 +1,186 @@
+import asyncio
+import sys
+import os
+import time
+import threading
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.governor.provider_governor import ProviderGovernor, BackpressureError
+from src.pipeline.dag_executor import DAGExecutor, Stage, StageFailedError
+from src.fabricate import tonic_client
+
+LIMITS = {
+    # 600/min = one token every 0.1s after a burst of 2
+    "paced": {"requests_per_minute": 600, "burst": 2, "max_in_flight": 10, "max_wait": 5.0, "max_queue": 100},
+    "narrow": {"requests_per_minute": None, "burst": 1, "max_in_flight": 2, "max_wait": 5.0, "max_queue": 100},
+    "tiny": {"requests_per_minute": None, "burst": 1, "max_in_flight": 1, "max_wait": 0.1, "max_queue": 1},
+}
+
+async def verify_provider_governor():
+    print("--- Testing Provider Governor ---")
+    gov = ProviderGovernor(LIMITS)
+
+    print("\n[Test 1: Token bucket paces calls after the burst]")
+    stamps = []
+
+    async def paced_call():
+        async with gov.limit("paced"):
+            stamps.append(time.perf_counter())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(paced_call() for _ in range(5)))
+    offsets = [round(t - start, 2) for t in sorted(stamps)]
+    print(f"Call offsets: {offsets}")
+    rate_ok = offsets[1] < 0.05 and 0.25 <= offsets[-1] < 0.45
+
+    print("\n[Test 2: In-flight cap queues callers]")
+    in_flight = 0
+    peak = 0
+
+    async def narrow_call():
+        nonlocal in_flight, peak
+        async with gov.limit("narrow"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+    await asyncio.gather(*(narrow_call() for _ in range(6)))
+    summary = gov.summary()["narrow"]
+    print(f"Peak in flight: {peak}, wait p90: {summary['wait_p90_ms']}ms")
+    cap_ok = peak == 2 and summary["acquired"] == 6 and summary["wait_p90_ms"] >= 50
+
+    print("\n[Test 3: Saturation raises a structured BackpressureError]")
+    async def hold():
+        async with gov.limit("tiny"):
+            await asyncio.sleep(0.3)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0.01)
+    outcomes = await asyncio.gather(*(hold() for _ in range(2)), return_exceptions=True)
+    await holder
+    reasons = sorted(o.reason for o in outcomes if isinstance(o, BackpressureError))
+    print(f"Rejections: {reasons}, retry_after: {[o.retry_after for o in outcomes]}")
+    backpressure_ok = reasons == ["max in flight", "queue full"] and all(o.retry_after >= 1 for o in outcomes)
+
+    print("\n[Test 4: Blocking callers are capped too]")
+    threads_peak = 0
+    threads_in_flight = 0
+    lock = threading.Lock()
+
+    def blocking_call():
+        nonlocal threads_peak, threads_in_flight
+        with gov.limit_blocking("narrow"):
+            with lock:
+                threads_in_flight += 1
+                threads_peak = max(threads_peak, threads_in_flight)
+            time.sleep(0.05)
+            with lock:
+                threads_in_flight -= 1
+
+    await asyncio.gather(*(asyncio.to_thread(blocking_call) for _ in range(5)))
+    narrow = gov.summary()["narrow"]
+    blocking_ok = threads_peak == 2 and narrow["waiting"] == 0 and narrow["acquired"] == 11
+    print(f"Peak threads in flight: {threads_peak}, summary: {narrow}")
+
+    print("\n[Test 5: Blocking callers respect the queue bound and stay off the event loop]")
+    def tiny_call(delay, hold):
+        time.sleep(delay)
+        try:
+            with gov.limit_blocking("tiny"):
+                time.sleep(hold)
+        except BackpressureError as e:
+            return e.reason
+
+    outcomes = await asyncio.gather(
+        asyncio.to_thread(tiny_call, 0, 0.3),
+        asyncio.to_thread(tiny_call, 0.02, 0),
+        asyncio.to_thread(tiny_call, 0.05, 0)
+    )
+    try:
+        with gov.limit_blocking("tiny"):
+            pass
+        on_loop_ok = False
+    except RuntimeError as e:
+        on_loop_ok = gov.summary()["tiny"]["waiting"] == 0
+        print(f"On the loop: {e}")
+    print(f"Blocking outcomes: {outcomes}")
+    blocking_queue_ok = outcomes == [None, "max in flight", "queue full"] and on_loop_ok
+
+    print("\n[Test 6: Async and blocking callers share one in-flight cap]")
+    mixed = {"in_flight": 0, "peak": 0}
+
+    def enter():
+        with lock:
+            mixed["in_flight"] += 1
+            mixed["peak"] = max(mixed["peak"], mixed["in_flight"])
+
+    def leave():
+        with lock:
+            mixed["in_flight"] -= 1
+
+    async def async_call():
+        async with gov.limit("narrow"):
+            enter()
+            await asyncio.sleep(0.05)
+            leave()
+
+    def thread_call():
+        with gov.limit_blocking("narrow"):
+            enter()
+            time.sleep(0.05)
+            leave()
+
+    await asyncio.gather(*[async_call() for _ in range(4)], *[asyncio.to_thread(thread_call) for _ in range(4)])
+    narrow = gov.summary()["narrow"]
+    print(f"Peak mixed in flight: {mixed['peak']}, summary in flight: {narrow['in_flight']}")
+    shared_ok = mixed["peak"] == 2 and narrow["in_flight"] == 0 and narrow["waiting"] == 0
+
+    print("\n[Test 7: Client fallbacks do not swallow backpressure]")
+    saturated = ProviderGovernor({"fabricate": LIMITS["tiny"]})
+    original_governor = tonic_client.governor
+    tonic_client.governor = saturated
+    client = tonic_client.FabricateClient()
+    client.api_key = "test-key"
+
+    async def hold_fabricate():
+        async with saturated.limit("fabricate"):
+            await asyncio.sleep(0.3)
+
+    holder = asyncio.create_task(hold_fabricate())
+    await asyncio.sleep(0.01)
+    try:
+        await client.generate("prompt")
+        client_ok = False
+    except BackpressureError as e:
+        client_ok = e.provider == "fabricate"
+        print(f"Fabricate raised: {e}")
+    finally:
+        tonic_client.governor = original_governor
+        await holder
+
+    print("\n[Test 8: Backpressure is never replaced by a stage fallback]")
+    async def throttled(inputs):
+        raise BackpressureError("anthropic", 3, "queue full")
+
+    try:
+        await DAGExecutor([Stage("themes", throttled, fallback={"primary": "technology"})]).run()
+        fallback_ok = False
+    except StageFailedError as e:
+        fallback_ok = isinstance(e.cause, BackpressureError)
+        print(f"Stage failed with: {e.cause}")
+
+    print("\n[Test 9: Unknown providers pass through]")
+    async with gov.limit("unconfigured"):
+        passthrough_ok = True
+
+    if (rate_ok and cap_ok and backpressure_ok and blocking_ok and blocking_queue_ok
+            and shared_ok and client_ok and fallback_ok and passthrough_ok):
+        print("\nSUCCESS: Provider governor working correctly.")
+    else:
+        print("\nFAILURE: Provider governor checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_provider_governor())
@@ -0,0 +1,72 @@
+import asyncio
+import sys
+import os
+import subprocess
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.resource_blocker import ResourceBlocker
+from src.config.browser_config import BLOCKING_CONFIG
+
+# (site, url, resource_type, expected reason)
+CASES = [
+    ("linkedin", "https://media.licdn.com/photo.jpg", "image", "image"),
+    ("linkedin", "https://www.linkedin.com/video.mp4", "media", "media"),
+    ("linkedin", "https://static.licdn.com/font.woff2", "font", "font"),
+    ("linkedin", "https://www.linkedin.com/in/someone/", "document", None),
+    ("linkedin", "https://static.licdn.com/app.js", "script", None),
+    ("linkedin", "https://www.linkedin.com/voyager/api/me", "xhr", None),
+    ("linkedin", "https://www.linkedin.com/style.css", "stylesheet", None),
+    ("linkedin", "https://px.ads.linkedin.com/collect", "xhr", "tracker"),
+    ("linkedin", "https://www.google-analytics.com/analytics.js", "script", "tracker"),
+    ("linkedin", "https://stats.g.doubleclick.net/j/collect", "xhr", "tracker"),
+    # Lookalike hosts are not subdomains of a blocked domain
+    ("linkedin", "https://notdoubleclick.net/lib.js", "script", None),
+    ("linkedin", "https://doubleclick.net.example.com/lib.js", "script", None),
+    ("twitter", "https://pbs.twimg.com/media/a.jpg", "image", "image"),
+    ("twitter", "https://api.x.com/graphql/timeline", "fetch", None),
+    ("twitter", "https://analytics.twitter.com/i/adsct", "script", "tracker"),
+    ("twitter", "https://static.ads-twitter.com/uwt.js", "script", "tracker"),
+    ("duckduckgo", "https://html.duckduckgo.com/html/?q=acme", "document", None),
+    ("duckduckgo", "https://improving.duckduckgo.com/t/ping", "image", "image"),
+    ("duckduckgo", "https://improving.duckduckgo.com/t/ping", "xhr", "tracker"),
+    # Sites without rules block nothing
+    ("unknown", "https://example.com/a.jpg", "image", None),
+]
+
+async def verify_resource_blocker():
+    print("--- Testing Resource Blocker ---")
+
+    print("\n[Test 1: Resource types, blocked domains and allowed first-party requests]")
+    failures = []
+    for site, url, resource_type, expected in CASES:
+        reason = ResourceBlocker(site).should_block(url, resource_type)
+        if reason != expected:
+            failures.append((site, url, resource_type, expected, reason))
+    print(f"{len(CASES) - len(failures)}/{len(CASES)} cases match")
+    for failure in failures:
+        print(f"  Mismatch: {failure}")
+    table_ok = not failures
+
+    print("\n[Test 2: A disabled blocker lets everything through]")
+    disabled = ResourceBlocker("linkedin", {**BLOCKING_CONFIG, "enabled": False})
+    disabled_ok = all(disabled.should_block(url, kind) is None for site, url, kind, _ in CASES if site == "linkedin")
+
+    print("\n[Test 3: BROWSER_BLOCK_RESOURCES=0/false turns blocking off]")
+    probe = "from src.config.browser_config import BLOCKING_CONFIG; print(BLOCKING_CONFIG['enabled'])"
+    backend = os.path.dirname(os.path.abspath(__file__))
+    switch = {}
+    for value in ("0", "1", "false", "On"):
+        env = {**os.environ, "BROWSER_BLOCK_RESOURCES": value}
+        switch[value] = subprocess.run([sys.executable, "-c", probe], cwd=backend, env=env, capture_output=True, text=True).stdout.strip()
+    print(f"enabled by value: {switch}")
+    switch_ok = switch == {"0": "False", "1": "True", "false": "False", "On": "True"}
+
+    if table_ok and disabled_ok and switch_ok:
+        print("\nSUCCESS: Resource blocker working correctly.")
+    else:
+        print("\nFAILURE: Resource blocker checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_resource_blocker())
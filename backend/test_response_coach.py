@@ -0,0 +1,105 @@
+import asyncio
+import sys
+import os
+import json
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.fabricate.response_coach import ResponseCoach
+
+class FakeBlock:
+    type = "text"
+    def __init__(self, text):
+        self.text = text
+
+class FakeMessage:
+    def __init__(self, text):
+        self.content = [FakeBlock(text)]
+        self.stop_reason = "end_turn"
+
+def strategy(index=None, framework="STAR"):
+    item = {
+        "response_framework": framework,
+        "emphasize": ["ROI"],
+        "avoid": ["Jargon"],
+        "pivot_options": ["Let's look at outcomes"],
+        "follow_up_prepared": ["What does success look like?"]
+    }
+    if index is not None:
+        item["index"] = index
+    return item
+
+class FakeLLM:
+    """
+    Answers batch and single strategy prompts after a fixed latency.
+    `batch_reply` builds the batch response from the number of questions.
+    """
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.calls = []
+        self.messages = self
+
+    async def create(self, call_site=None, **kwargs):
+        self.calls.append(call_site)
+        await asyncio.sleep(0.1)
+        if call_site == "response_strategy_batch":
+            count = kwargs["messages"][0]["content"].count("?")
+            return FakeMessage(self.batch_reply(count))
+        return FakeMessage("```json\n" + json.dumps(strategy(framework="PPP")) + "\n```")
+
+QUESTIONS = [{"question": f"Question {i}?"} for i in range(6)]
+PROFILE = {"name": "Jane Doe", "role": "CTO"}
+
+async def verify_response_coach():
+    print("--- Testing Batched Response Coach ---")
+
+    print("\n[Test 1: All strategies from one request]")
+    llm = FakeLLM(lambda n: json.dumps([strategy(i + 1) for i in reversed(range(n))]))
+    start = time.perf_counter()
+    strategies = await ResponseCoach(llm_client=llm).generate_response_strategies(QUESTIONS, PROFILE)
+    elapsed = time.perf_counter() - start
+    print(f"LLM calls: {llm.calls}, {elapsed:.2f}s")
+    batch_ok = (
+        llm.calls == ["response_strategy_batch"]
+        and [s["question"] for s in strategies] == [q["question"] for q in QUESTIONS]
+        and all(s["response_framework"] == "STAR" for s in strategies)
+    )
+
+    print("\n[Test 2: Invalid items are retried individually and concurrently]")
+    def partial(n):
+        items = [strategy(i + 1) for i in range(n)]
+        items[1] = {"index": 2, "response_framework": ""}
+        return json.dumps(items[:-1])
+    llm = FakeLLM(partial)
+    start = time.perf_counter()
+    strategies = await ResponseCoach(llm_client=llm).generate_response_strategies(QUESTIONS, PROFILE)
+    elapsed = time.perf_counter() - start
+    frameworks = [s["response_framework"] for s in strategies]
+    print(f"Frameworks: {frameworks}, {elapsed:.2f}s")
+    partial_ok = frameworks == ["STAR", "PPP", "STAR", "STAR", "STAR", "PPP"] and llm.calls.count("response_strategy") == 2 and elapsed < 0.3
+
+    print("\n[Test 3: Unparseable batch falls back to concurrent per-question calls]")
+    llm = FakeLLM(lambda n: "Sorry, here are some thoughts instead.")
+    start = time.perf_counter()
+    strategies = await ResponseCoach(llm_client=llm).generate_response_strategies(QUESTIONS, PROFILE)
+    elapsed = time.perf_counter() - start
+    print(f"Single calls: {llm.calls.count('response_strategy')}, {elapsed:.2f}s")
+    fallback_ok = len(strategies) == 6 and all(s["response_framework"] == "PPP" for s in strategies) and elapsed < 0.3
+
+    print("\n[Test 4: Unbatched mode runs questions concurrently]")
+    llm = FakeLLM(lambda n: "[]")
+    start = time.perf_counter()
+    strategies = await ResponseCoach(llm_client=llm, batched=False).generate_response_strategies(QUESTIONS, PROFILE)
+    elapsed = time.perf_counter() - start
+    concurrent_ok = "response_strategy_batch" not in llm.calls and len(strategies) == 6 and elapsed < 0.2
+    print(f"{len(llm.calls)} calls in {elapsed:.2f}s")
+
+    if batch_ok and partial_ok and fallback_ok and concurrent_ok:
+        print("\nSUCCESS: Batched response coach working correctly.")
+    else:
+        print("\nFAILURE: Batched response coach checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_response_coach())
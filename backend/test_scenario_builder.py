@@ -0,0 +1,90 @@
+import asyncio
+import sys
+import os
+import json
+import time
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.fabricate.scenario_builder import ConversationScenarioBuilder
+
+class FakeBlock:
+    type = "text"
+    def __init__(self, text):
+        self.text = text
+
+class FakeMessage:
+    def __init__(self, text):
+        self.content = [FakeBlock(text)]
+        self.stop_reason = "end_turn"
+
+class FakeLLM:
+    """
+    Returns a scenario after a per-context delay, tracking concurrency.
+    """
+    def __init__(self, delays):
+        self.delays = delays
+        self.in_flight = 0
+        self.peak = 0
+        self.messages = self
+
+    async def create(self, call_site=None, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        context = prompt.split('for a "')[1].split('"')[0]
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(context, 0.1))
+        finally:
+            self.in_flight -= 1
+        return FakeMessage(json.dumps({"context": context, "likely_opener": "Hi", "sample_dialogue": []}))
+
+PROFILE = {"name": "Jane Doe", "role": "CTO", "company": "Acme"}
+
+async def verify_scenario_builder():
+    print("--- Testing Parallel Scenario Builder ---")
+
+    print("\n[Test 1: Scenarios are built concurrently]")
+    llm = FakeLLM({})
+    start = time.perf_counter()
+    scenarios = await ConversationScenarioBuilder(llm_client=llm).build_scenarios(PROFILE)
+    elapsed = time.perf_counter() - start
+    print(f"Built {list(scenarios)} in {elapsed:.2f}s (peak {llm.peak} in flight)")
+    concurrent_ok = list(scenarios) == ["first_meeting", "pitch", "advice_seeking", "partnership"] and elapsed < 0.2
+
+    print("\n[Test 2: Concurrency limit is respected]")
+    llm = FakeLLM({})
+    await ConversationScenarioBuilder(llm_client=llm, config={"max_concurrency": 2}).build_scenarios(PROFILE)
+    limit_ok = llm.peak == 2
+    print(f"Peak in flight: {llm.peak}")
+
+    print("\n[Test 3: A slow scenario is dropped, the rest are returned]")
+    llm = FakeLLM({"pitch": 1.0})
+    builder = ConversationScenarioBuilder(llm_client=llm, config={"scenario_timeout": 0.2})
+    start = time.perf_counter()
+    scenarios = await builder.build_scenarios(PROFILE)
+    elapsed = time.perf_counter() - start
+    print(f"Returned {list(scenarios)} after {elapsed:.2f}s")
+    partial_ok = list(scenarios) == ["first_meeting", "advice_seeking", "partnership"] and elapsed < 0.5
+
+    print("\n[Test 4: Only contexts relevant to the meeting]")
+    llm = FakeLLM({})
+    builder = ConversationScenarioBuilder(llm_client=llm)
+    pitch_only = await builder.build_scenarios(PROFILE, meeting_context="Product demo and pricing proposal", relevant_only=True)
+    mixed = await builder.build_scenarios(PROFILE, meeting_context="Intro call about a possible partnership", relevant_only=True)
+    unmatched = await builder.build_scenarios(PROFILE, meeting_context="Quarterly review", relevant_only=True)
+    print(f"Pitch: {list(pitch_only)}, mixed: {list(mixed)}, unmatched: {list(unmatched)}")
+    relevant_ok = (
+        list(pitch_only) == ["pitch"]
+        and list(mixed) == ["first_meeting", "partnership"]
+        and list(unmatched) == ["first_meeting"]
+    )
+
+    if concurrent_ok and limit_ok and partial_ok and relevant_ok:
+        print("\nSUCCESS: Parallel scenario builder working correctly.")
+    else:
+        print("\nFAILURE: Parallel scenario builder checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_scenario_builder())
@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import os
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.pipeline.single_flight import SingleFlight
+
+async def verify_single_flight():
+    print("--- Testing Single-Flight Coalescing ---")
+    flight = SingleFlight("test")
+    calls = []
+
+    async def browse(url):
+        calls.append(url)
+        await asyncio.sleep(0.1)
+        return {"profile": url}
+
+    print("\n[Test 1: Identical concurrent requests share one run]")
+    key = SingleFlight.make_key("linkedin", "linkedin.com/in/jane")
+    results = await asyncio.gather(*(flight.do(key, lambda: browse("jane")) for _ in range(5)))
+    print(f"Underlying calls: {calls}, stats: {flight.stats}")
+    shared_ok = calls == ["jane"] and all(r == {"profile": "jane"} for r in results) and flight.in_flight() == 0
+
+    print("\n[Test 2: Errors reach every waiter]")
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("browser crashed")
+
+    outcomes = await asyncio.gather(*(flight.do("boom", failing) for _ in range(3)), return_exceptions=True)
+    errors_ok = all(isinstance(o, RuntimeError) for o in outcomes)
+    print(f"Outcomes: {[type(o).__name__ for o in outcomes]}")
+
+    print("\n[Test 3: One waiter cancelling does not kill shared work]")
+    calls.clear()
+    first = asyncio.create_task(flight.do("john", lambda: browse("john")))
+    second = asyncio.create_task(flight.do("john", lambda: browse("john")))
+    await asyncio.sleep(0.02)
+    first.cancel()
+    result = await second
+    partial_cancel_ok = first.cancelled() and result == {"profile": "john"} and calls == ["john"]
+    print(f"Survivor got: {result}")
+
+    print("\n[Test 4: Last waiter cancelling stops the work]")
+    finished = []
+
+    async def slow():
+        await asyncio.sleep(0.2)
+        finished.append(True)
+
+    only = asyncio.create_task(flight.do("slow", slow))
+    await asyncio.sleep(0.02)
+    only.cancel()
+    await asyncio.sleep(0.3)
+    full_cancel_ok = not finished and flight.in_flight() == 0
+
+    if shared_ok and errors_ok and partial_cancel_ok and full_cancel_ok:
+        print("\nSUCCESS: Single-flight coalescing working correctly.")
+    else:
+        print("\nFAILURE: Single-flight checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_single_flight())
@@ -1,6 +1,7 @@
 import asyncio
 import os
 from src.agents.twitter_browser import TwitterBrowserAgent
+from src.agents.browser_pool import close_browser_pool
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,5 +31,8 @@ async def test_twitter_agent():
         print("Note: No tweets found. This might be due to Twitter login walls or anti-scraping.")
         print("However, if the fallback logic executed without crashing, the test is partial success.")
 
+    # Release the shared browser before the event loop closes
+    await close_browser_pool()
+
 if __name__ == "__main__":
     asyncio.run(test_twitter_agent())
@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import os
+import time
+import httpx
+
+# Ensure we can import from src
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.yutori_client import AsyncYutoriClient, YutoriTaskError
+
+FAST_POLLING = {"poll_initial_interval": 0.01, "poll_max_interval": 0.05, "poll_timeout": 2}
+
+def mock_yutori(polls_until_done: int, final_status: str = "completed"):
+    """
+    Local stand-in for the Yutori browsing API.
+    """
+    polls = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            task_id = f"task-{len(polls)}"
+            polls[task_id] = 0
+            return httpx.Response(200, json={"task_id": task_id, "view_url": f"https://yutori.local/{task_id}"})
+
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        polls[task_id] += 1
+        if polls[task_id] < polls_until_done:
+            return httpx.Response(200, json={"status": "running"})
+        return httpx.Response(200, json={"status": final_status, "output": '{"name": "Acme"}', "error": "boom"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), polls
+
+async def verify_yutori_client():
+    print("--- Testing Async Yutori Client ---")
+
+    print("\n[Test 1: Many tasks in flight concurrently]")
+    http, polls = mock_yutori(polls_until_done=3)
+    client = AsyncYutoriClient("test-key", config=FAST_POLLING, http_client=http)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.run_task(f"research {i}", "https://www.google.com") for i in range(5)))
+    elapsed = time.perf_counter() - start
+    print(f"Completed {len(results)} tasks in {elapsed:.2f}s, polls per task: {sorted(polls.values())}")
+    concurrent_ok = len(results) == 5 and all(r["status"] == "completed" for r in results) and elapsed < 1.0
+
+    print("\n[Test 2: Failed task raises]")
+    http, _ = mock_yutori(polls_until_done=1, final_status="failed")
+    client = AsyncYutoriClient("test-key", config=FAST_POLLING, http_client=http)
+    try:
+        await client.run_task("research", "https://www.google.com")
+        failed_ok = False
+    except YutoriTaskError as e:
+        print(f"Raised: {e}")
+        failed_ok = True
+
+    print("\n[Test 3: Cancellation stops polling]")
+    http, polls = mock_yutori(polls_until_done=10_000)
+    client = AsyncYutoriClient("test-key", config=FAST_POLLING, http_client=http)
+    task = asyncio.create_task(client.run_task("research", "https://www.google.com"))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    try:
+        await task
+        cancel_ok = False
+    except asyncio.CancelledError:
+        polls_at_cancel = sum(polls.values())
+        await asyncio.sleep(0.2)
+        cancel_ok = sum(polls.values()) == polls_at_cancel
+        print(f"Polling stopped after {polls_at_cancel} polls")
+
+    if concurrent_ok and failed_ok and cancel_ok:
+        print("\nSUCCESS: Async Yutori client working correctly.")
+    else:
+        print("\nFAILURE: Async Yutori client checks failed.")
+
+if __name__ == "__main__":
+    asyncio.run(verify_yutori_client())